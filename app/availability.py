@@ -0,0 +1,187 @@
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from typing import Optional, List, Dict, Any, Iterator
+
+from app.config import AVAILABILITY_MAX_STALENESS_SECONDS, AVAILABILITY_NOTIFY_CHANNEL
+from app.database import DatabaseConnection, DatabaseService, NotificationListener, PROVIDER_KINDS, as_date
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def weekday_mask(start: date, days: int, weekdays: Optional[List[int]] = None) -> int:
+    if not weekdays:
+        return (1 << days) - 1
+    wanted = set(weekdays)
+    mask = 0
+    for offset in range(days):
+        if (start + timedelta(days=offset)).weekday() in wanted:
+            mask |= 1 << offset
+    return mask
+
+
+class CalendarBitmaps:
+    """Blocked days per provider, one bit per day counted from `epoch`."""
+
+    def __init__(self, epoch: date):
+        self.epoch = epoch
+        self.blocked: Dict[str, Dict[str, int]] = {kind: {} for kind in PROVIDER_KINDS}
+
+    def set_blocked(self, kind: str, provider_id: str, day: date, blocked: bool) -> None:
+        offset = (day - self.epoch).days
+        if offset < 0:
+            return
+        bits = self.blocked[kind].get(provider_id, 0)
+        if blocked:
+            bits |= 1 << offset
+        else:
+            bits &= ~(1 << offset)
+        if bits:
+            self.blocked[kind][provider_id] = bits
+        else:
+            self.blocked[kind].pop(provider_id, None)
+
+    def free_mask(self, kind: str, provider_id: str, start: date, days: int) -> int:
+        """Bit `i` is set when the provider is free on `start + i`. Days
+        before `epoch` are in the past and never free; the bitmaps do not
+        hold them."""
+        bits = self.blocked[kind].get(provider_id, 0)
+        offset = (start - self.epoch).days
+        if offset >= 0:
+            return ((1 << days) - 1) & ~(bits >> offset)
+        past = min(-offset, days)
+        return ((1 << days) - 1) & ~(bits << past) & ~((1 << past) - 1)
+
+
+class AvailabilityIndex:
+    """Process-wide calendar bitmaps for `venue_availability` and
+    `caterer_availability`.
+
+    Loaded once from the blocked rows on or after today, then kept current
+    row by row from `availability_changed` notifications. A full reload
+    happens on TRUNCATE, when the listener drops, or once the bitmaps are
+    older than AVAILABILITY_MAX_STALENESS_SECONDS.
+    """
+
+    _bitmaps: Optional[CalendarBitmaps] = None
+    _loaded_at: float = 0.0
+    _dirty: bool = False
+    _lock: Optional[asyncio.Lock] = None
+    _listener: Optional[NotificationListener] = None
+    _pending: Optional[List[Dict[str, Any]]] = None
+    max_staleness: float = AVAILABILITY_MAX_STALENESS_SECONDS
+    reloads: int = 0
+    updates: int = 0
+
+    @classmethod
+    def _is_fresh(cls) -> bool:
+        return (
+            cls._bitmaps is not None
+            and not cls._dirty
+            and time.monotonic() - cls._loaded_at <= cls.max_staleness
+        )
+
+    @classmethod
+    async def get_bitmaps(cls) -> CalendarBitmaps:
+        if cls._is_fresh():
+            return cls._bitmaps
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if not cls._is_fresh():
+                await cls.reload()
+            return cls._bitmaps
+
+    @classmethod
+    async def reload(cls) -> None:
+        if cls._listener is None:
+            cls._listener = NotificationListener(AVAILABILITY_NOTIFY_CHANNEL, cls._on_notification, cls.invalidate)
+        await cls._listener.ensure()
+        cls._dirty = False
+
+        # Changes that arrive while loading are replayed on top of the load.
+        cls._pending = []
+        try:
+            bitmaps = CalendarBitmaps(date.today())
+            with DatabaseConnection.primary():
+                for kind in PROVIDER_KINDS:
+                    for provider_id, day in await DatabaseService.fetch_blocked_dates(kind, bitmaps.epoch):
+                        bitmaps.set_blocked(kind, provider_id, day, True)
+            cls._bitmaps = bitmaps
+            pending, cls._pending = cls._pending, None
+            for change in pending:
+                cls.apply_change(change)
+        finally:
+            cls._pending = None
+
+        cls._loaded_at = time.monotonic()
+        cls.reloads += 1
+
+    @classmethod
+    def invalidate(cls, *args) -> None:
+        cls._dirty = True
+
+    @classmethod
+    def _on_notification(cls, connection, pid, channel, payload: str) -> None:
+        cls.apply_change(json.loads(payload))
+
+    @classmethod
+    def apply_change(cls, change: Dict[str, Any]) -> None:
+        if change.get('reload'):
+            cls.invalidate()
+            return
+        if cls._pending is not None:
+            cls._pending.append(change)
+            return
+        if cls._bitmaps is None:
+            return
+        cls._bitmaps.set_blocked(
+            change['kind'],
+            change['id'],
+            as_date(change['date']),
+            not change['available']
+        )
+        cls.updates += 1
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._listener is not None:
+            await cls._listener.close()
+        cls._bitmaps = None
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        bitmaps = cls._bitmaps
+        return {
+            "loaded": bitmaps is not None,
+            "epoch": bitmaps.epoch.isoformat() if bitmaps else None,
+            "blocked_venues": len(bitmaps.blocked['venue']) if bitmaps else 0,
+            "blocked_caterers": len(bitmaps.blocked['caterer']) if bitmaps else 0,
+            "reloads": cls.reloads,
+            "incremental_updates": cls.updates,
+            "listening": cls._listener is not None and cls._listener.listening
+        }
+
+
+def free_days_by_date(
+    bitmaps: CalendarBitmaps,
+    kind: str,
+    providers: List[Dict[str, Any]],
+    start: date,
+    days: int,
+    day_mask: int
+) -> Dict[int, List[Dict[str, Any]]]:
+    by_offset: Dict[int, List[Dict[str, Any]]] = {}
+    for provider in providers:
+        free = bitmaps.free_mask(kind, str(provider['id']), start, days) & day_mask
+        for offset in iter_bits(free):
+            by_offset.setdefault(offset, []).append(provider)
+    return by_offset
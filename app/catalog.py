@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Optional, List, Dict, Any
+
+from app.config import (
+    CATALOG_CACHE_ENABLED,
+    CATALOG_MAX_STALENESS_SECONDS,
+    CATALOG_NOTIFY_CHANNEL
+)
+from app.database import DatabaseConnection, DatabaseService, NotificationListener
+from app.matching import caterer_index, venue_index
+
+
+class CatalogSnapshot:
+    """Immutable view of the active caterers and venues, in the same
+    (name, id) order the search statements return them."""
+
+    def __init__(self, caterers: List[Dict[str, Any]], venues: List[Dict[str, Any]]):
+        self.caterers = caterers
+        self.venues = venues
+        self.caterer_index = caterer_index(caterers)
+        self.venue_index = venue_index(venues)
+        self.loaded_at = time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+    def find_caterers(
+        self,
+        location: Optional[str] = None,
+        min_guests: Optional[int] = None,
+        max_guests: Optional[int] = None,
+        cuisines: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        return self.caterer_index.search(location, min_guests, max_guests, cuisines)
+
+    def find_venues(
+        self,
+        location: Optional[str] = None,
+        min_capacity: Optional[int] = None,
+        max_capacity: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        return self.venue_index.search(location, min_capacity, max_capacity)
+
+
+class CatalogCache:
+    """Process-wide snapshot of the provider catalog.
+
+    The snapshot is reloaded when a `catalog_changed` notification arrives
+    (see the triggers in database/schema.sql) and, regardless of
+    notifications, once it is older than CATALOG_MAX_STALENESS_SECONDS.
+    """
+
+    _snapshot: Optional[CatalogSnapshot] = None
+    _dirty: bool = False
+    _lock: Optional[asyncio.Lock] = None
+    _listener: Optional[NotificationListener] = None
+    max_staleness: float = CATALOG_MAX_STALENESS_SECONDS
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    invalidations: int = 0
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return CATALOG_CACHE_ENABLED
+
+    @classmethod
+    def _is_fresh(cls) -> bool:
+        return (
+            cls._snapshot is not None
+            and not cls._dirty
+            and cls._snapshot.age() <= cls.max_staleness
+        )
+
+    @classmethod
+    async def get_snapshot(cls) -> CatalogSnapshot:
+        if cls._is_fresh():
+            cls.hits += 1
+            return cls._snapshot
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._is_fresh():
+                cls.hits += 1
+                return cls._snapshot
+            cls.misses += 1
+            await cls.refresh()
+            return cls._snapshot
+
+    @classmethod
+    async def refresh(cls) -> None:
+        if cls._listener is None:
+            cls._listener = NotificationListener(CATALOG_NOTIFY_CHANNEL, cls.invalidate, cls.invalidate)
+        await cls._listener.ensure()
+        cls._dirty = False
+        # Reloads follow primary notifications, so read what triggered them.
+        with DatabaseConnection.primary():
+            caterers = await DatabaseService.fetch_caterers()
+            venues = await DatabaseService.fetch_venues()
+        cls._snapshot = CatalogSnapshot(caterers, venues)
+        cls.refreshes += 1
+
+    @classmethod
+    def invalidate(cls, *args) -> None:
+        cls._dirty = True
+        cls.invalidations += 1
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls.enabled():
+            await cls.get_snapshot()
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._listener is not None:
+            await cls._listener.close()
+        cls._snapshot = None
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        lookups = cls.hits + cls.misses
+        return {
+            "enabled": cls.enabled(),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": round(cls.hits / lookups, 4) if lookups else 0.0,
+            "refreshes": cls.refreshes,
+            "invalidations": cls.invalidations,
+            "listening": cls._listener is not None and cls._listener.listening,
+            "snapshot_age_seconds": round(cls._snapshot.age(), 3) if cls._snapshot else None,
+            "max_staleness_seconds": cls.max_staleness,
+            "caterers": len(cls._snapshot.caterers) if cls._snapshot else 0,
+            "venues": len(cls._snapshot.venues) if cls._snapshot else 0
+        }
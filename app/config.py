@@ -1,7 +1,123 @@
+from typing import Optional, List, Tuple
+
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Deployment settings, read from the environment (or `.env`)."""
+
+    model_config = SettingsConfigDict(env_file='.env', extra='ignore')
+
+    web_concurrency: int = 1
+
+    database_url: str = 'postgresql://localhost:5432/event_planner_db'
+    db_max_connections: Optional[int] = None
+    db_pool_min_size: int = 5
+    db_pool_max_size: int = 20
+    db_pool_max_inactive_connection_lifetime: float = 300.0
+    db_pool_max_queries: int = 50000
+    db_pool_acquire_timeout: float = 10.0
+    db_command_timeout: float = 60.0
+    db_statement_cache_size: int = 100
+
+    database_replica_urls: str = ''
+    db_replica_max_lag_seconds: float = 5.0
+    db_replica_lag_check_interval: float = 1.0
+    db_replica_retry_interval: float = 10.0
+
+    planning_stage_timeout_seconds: float = 10.0
+    combination_top_k: int = 5
+    plan_batch_max_requests: int = 500
+    plan_stream_prefetch: int = 200
+    plan_max_page_size: int = 100
+    cursor_secret: str = ''
+    booking_import_batch_size: int = 5000
+
+    catalog_cache_enabled: bool = False
+    catalog_max_staleness_seconds: float = 60.0
+
+    availability_max_staleness_seconds: float = 300.0
+    availability_search_max_days: int = 366
+
+    response_cache_enabled: bool = False
+    response_cache_ttl_seconds: float = 30.0
+    response_cache_max_entries: int = 10000
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+
+    metrics_enabled: bool = True
+    tracing_exporter: str = 'none'
+    tracing_service_name: str = 'event-planner-api'
+    profiler_enabled: bool = False
+    profiler_sample_interval_seconds: float = 0.005
+    profiler_max_seconds: float = 60.0
+
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.database_replica_urls.split(',') if url.strip()]
+
+    def listener_connections(self) -> int:
+        """Dedicated LISTEN connections one worker may hold outside its pool."""
+        return 1 + int(self.catalog_cache_enabled) + 2 * int(self.response_cache_enabled)
+
+    def pool_bounds(self) -> Tuple[int, int]:
+        """Per-worker (min_size, max_size), capped so that every worker's
+        pool plus its listeners fits under DB_MAX_CONNECTIONS."""
+        max_size = self.db_pool_max_size
+        if self.db_max_connections is not None:
+            budget = self.db_max_connections // max(1, self.web_concurrency)
+            max_size = min(max_size, budget - self.listener_connections())
+        return min(self.db_pool_min_size, max_size), max_size
+
+    @model_validator(mode='after')
+    def check_connection_budget(self) -> 'Settings':
+        if self.pool_bounds()[1] < 1:
+            raise ValueError(
+                f"DB_MAX_CONNECTIONS={self.db_max_connections} leaves no pool connections for "
+                f"{self.web_concurrency} worker(s) needing {self.listener_connections()} listener(s) each"
+            )
+        return self
+
+
+settings = Settings()
+
 DEFAULT_EVENT_DURATION_HOURS = 4
 
 DEFAULT_TAX_RATE_PERCENT = 10.0
 
+PLANNING_STAGE_TIMEOUT_SECONDS = settings.planning_stage_timeout_seconds
+
+COMBINATION_TOP_K = settings.combination_top_k
+
+PLAN_BATCH_MAX_REQUESTS = settings.plan_batch_max_requests
+
+PLAN_MAX_PAGE_SIZE = settings.plan_max_page_size
+
+CURSOR_SECRET = settings.cursor_secret
+
+BOOKING_IMPORT_BATCH_SIZE = settings.booking_import_batch_size
+
+DATABASE_URL = settings.database_url
+
+CATALOG_CACHE_ENABLED = settings.catalog_cache_enabled
+
+CATALOG_MAX_STALENESS_SECONDS = settings.catalog_max_staleness_seconds
+
+CATALOG_NOTIFY_CHANNEL = 'catalog_changed'
+
+AVAILABILITY_MAX_STALENESS_SECONDS = settings.availability_max_staleness_seconds
+
+AVAILABILITY_SEARCH_MAX_DAYS = settings.availability_search_max_days
+
+AVAILABILITY_NOTIFY_CHANNEL = 'availability_changed'
+
+RESPONSE_CACHE_ENABLED = settings.response_cache_enabled
+
+RESPONSE_CACHE_TTL_SECONDS = settings.response_cache_ttl_seconds
+
+RESPONSE_CACHE_MAX_ENTRIES = settings.response_cache_max_entries
+
+RESPONSE_CACHE_MAX_BYTES = settings.response_cache_max_bytes
+
 SUPPORTED_LOCATIONS = [
     "San Francisco",
     "New York",
@@ -10,6 +126,15 @@ SUPPORTED_LOCATIONS = [
     "Austin"
 ]
 
+# Other names requests use for the supported locations; see app/locations.py.
+LOCATION_ALIASES = {
+    "San Francisco": ["SF", "San Fran", "San Francisco, CA"],
+    "New York": ["NYC", "New York City", "NY", "New York, NY"],
+    "Los Angeles": ["LA", "L.A.", "Los Angeles, CA"],
+    "Chicago": ["Chi-town", "Chicago, IL"],
+    "Austin": ["ATX", "Austin, TX"]
+}
+
 SUPPORTED_CUISINES = [
     "Italian",
     "Indian",
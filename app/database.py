@@ -1,39 +1,419 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from contextvars import ContextVar
 import asyncpg
-from typing import Optional, List, Dict, Any
-import os
-from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Set, Tuple, Union, Callable, AsyncIterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date
+from decimal import Decimal
+
+from app.config import DATABASE_URL, DEFAULT_EVENT_DURATION_HOURS, settings
+from app.statements import StatementConnection, WRITE_STATEMENTS, prepare_statements
+from app.tracing import Metrics, Tracer, query_span
+
+
+class PoolMetrics:
+    """Acquire wait times and occupancy for the shared pool.
+
+    A saturation event is an acquire that started while every connection
+    was already checked out or promised to an earlier waiter.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.acquires = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.peak_in_use = 0
+        self.saturation_events = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._recent_waits = deque(maxlen=window)
+
+    def acquiring(self, max_size: int) -> None:
+        if self.in_use + self.waiting >= max_size:
+            self.saturation_events += 1
+        self.waiting += 1
+
+    def acquired(self, wait_seconds: float) -> None:
+        self.waiting -= 1
+        self.acquires += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        self._recent_waits.append(wait_seconds)
+
+    def released(self) -> None:
+        self.in_use -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self._recent_waits)
+
+        def percentile_ms(q: float) -> float:
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(q * len(recent)))] * 1000, 3)
+
+        return {
+            "acquires": self.acquires,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "peak_in_use": self.peak_in_use,
+            "saturation_events": self.saturation_events,
+            "acquire_timeouts": self.timeouts,
+            "acquire_wait_ms_mean": round(self.wait_seconds_total / self.acquires * 1000, 3) if self.acquires else 0.0,
+            "acquire_wait_ms_p50": percentile_ms(0.50),
+            "acquire_wait_ms_p95": percentile_ms(0.95),
+            "acquire_wait_ms_p99": percentile_ms(0.99),
+            "acquire_wait_ms_max": round(self.wait_seconds_max * 1000, 3)
+        }
+
+
+# Zero while the replica has replayed everything it has received; otherwise
+# the age of the last replayed transaction.
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END::float8
+"""
+
+# Set for the rest of a request (and the tasks it spawns) once it has
+# written, so its later reads see its own writes.
+_primary_pinned: ContextVar[bool] = ContextVar('primary_pinned', default=False)
+
+
+class PoolExhaustedError(asyncio.TimeoutError):
+    def __init__(self, pool: str, timeout: float):
+        super().__init__(f"No connection on the {pool} database pool came free within {timeout:g}s")
+        self.pool = pool
+        self.timeout = timeout
+
+
+class ManagedPool:
+    """One asyncpg pool (primary or replica) with its acquire metrics."""
+
+    def __init__(self, name: str, dsn: str):
+        self.name = name
+        self.dsn = dsn
+        self.pool: Optional[asyncpg.Pool] = None
+        self.metrics = PoolMetrics()
+        self.lag_seconds: Optional[float] = None
+        self.lag_checked_at = 0.0
+        self.failed_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lag_check: Optional[asyncio.Task] = None
+
+    @property
+    def load(self) -> int:
+        return self.metrics.in_use + self.metrics.waiting
+
+    async def get(self) -> asyncpg.Pool:
+        if self.pool is not None:
+            return self.pool
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.pool is None:
+                min_size, max_size = settings.pool_bounds()
+                self.pool = await asyncpg.create_pool(
+                    self.dsn,
+                    min_size=min_size,
+                    max_size=max_size,
+                    max_inactive_connection_lifetime=settings.db_pool_max_inactive_connection_lifetime,
+                    max_queries=settings.db_pool_max_queries,
+                    command_timeout=settings.db_command_timeout,
+                    statement_cache_size=settings.db_statement_cache_size,
+                    connection_class=StatementConnection,
+                    init=prepare_statements
+                )
+        return self.pool
+
+    async def acquire(self) -> asyncpg.Connection:
+        pool = await self.get()
+        metrics = self.metrics
+        metrics.acquiring(pool.get_max_size())
+
+        started = time.perf_counter()
+        try:
+            connection = await pool.acquire(timeout=settings.db_pool_acquire_timeout)
+        except BaseException as e:
+            metrics.waiting -= 1
+            if isinstance(e, asyncio.TimeoutError):
+                metrics.timeouts += 1
+                raise PoolExhaustedError(self.name, settings.db_pool_acquire_timeout) from e
+            raise
+        waited = time.perf_counter() - started
+        metrics.acquired(waited)
+        if Tracer.metrics_enabled:
+            Metrics.observe("db_pool_acquire_seconds", "pool", self.name, waited)
+        return connection
+
+    async def release(self, connection: asyncpg.Connection) -> None:
+        self.metrics.released()
+        await self.pool.release(connection)
+
+    @asynccontextmanager
+    async def connection(self):
+        connection = await self.acquire()
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
+
+    def usable_replica(self) -> bool:
+        """Within the lag bound, and not recently unreachable. Schedules a
+        background lag check when the last one is older than the interval."""
+        now = time.monotonic()
+        if now - self.lag_checked_at >= settings.db_replica_lag_check_interval and (
+            self._lag_check is None or self._lag_check.done()
+        ):
+            self._lag_check = asyncio.ensure_future(self.check_lag())
+        if now - self.failed_at < settings.db_replica_retry_interval:
+            return False
+        return self.lag_seconds is not None and self.lag_seconds <= settings.db_replica_max_lag_seconds
+
+    async def check_lag(self) -> None:
+        try:
+            async with self.connection() as connection:
+                self.lag_seconds = await connection.fetchval(REPLICA_LAG_QUERY)
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError):
+            self.lag_seconds = None
+            self.failed_at = time.monotonic()
+        finally:
+            self.lag_checked_at = time.monotonic()
+
+    async def close(self) -> None:
+        if self._lag_check is not None:
+            self._lag_check.cancel()
+        if self.pool is not None:
+            pool, self.pool = self.pool, None
+            await pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self.pool
+        min_size, max_size = settings.pool_bounds()
+        return {
+            "size": pool.get_size() if pool else 0,
+            "idle": pool.get_idle_size() if pool else 0,
+            "min_size": min_size,
+            "max_size": max_size,
+            **self.metrics.snapshot()
+        }
 
 
 class DatabaseConnection:
-    _pool: Optional[asyncpg.Pool] = None
+    """The primary pool plus optional read replicas.
+
+    Read-only statements go to the least-loaded replica whose lag is within
+    DB_REPLICA_MAX_LAG_SECONDS (round-robin among equally loaded ones) and
+    fall back to the primary. Writes, ad-hoc queries, reads made after a
+    write in the same request, and anything inside `primary()` use the
+    primary.
+    """
+
+    _primary: ManagedPool = ManagedPool('primary', DATABASE_URL)
+    _replicas: List[ManagedPool] = [
+        ManagedPool(f'replica-{i}', dsn) for i, dsn in enumerate(settings.replica_urls())
+    ]
+    _next_replica = itertools.count()
+    replica_reads: int = 0
+    fallback_reads: int = 0
     
     @classmethod
     async def get_pool(cls) -> asyncpg.Pool:
-        if cls._pool is None:
-            database_url = os.getenv(
-                'DATABASE_URL',
-                'postgresql://localhost:5432/event_planner_db'
-            )
-            cls._pool = await asyncpg.create_pool(
-                database_url,
-                min_size=5,
-                max_size=20,
-                command_timeout=60
-            )
-        return cls._pool
+        return await cls._primary.get()
+
+    @classmethod
+    async def start(cls) -> None:
+        await cls._primary.get()
+        for replica in cls._replicas:
+            await replica.check_lag()
     
     @classmethod
     async def close_pool(cls):
-        if cls._pool:
-            await cls._pool.close()
-            cls._pool = None
+        for managed in [cls._primary, *cls._replicas]:
+            await managed.close()
+
+    @classmethod
+    @contextmanager
+    def primary(cls):
+        token = _primary_pinned.set(True)
+        try:
+            yield
+        finally:
+            _primary_pinned.reset(token)
+
+    @classmethod
+    def pin_primary(cls) -> None:
+        _primary_pinned.set(True)
+
+    @classmethod
+    def _route(cls, readonly: bool) -> ManagedPool:
+        if not readonly or not cls._replicas or _primary_pinned.get():
+            return cls._primary
+        start = next(cls._next_replica) % len(cls._replicas)
+        candidates = [
+            replica for replica in cls._replicas[start:] + cls._replicas[:start]
+            if replica.usable_replica()
+        ]
+        if not candidates:
+            cls.fallback_reads += 1
+            return cls._primary
+        cls.replica_reads += 1
+        return min(candidates, key=lambda replica: replica.load)
     
     @classmethod
     @asynccontextmanager
-    async def get_connection(cls):
-        pool = await cls.get_pool()
-        async with pool.acquire() as connection:
+    async def get_connection(cls, readonly: bool = False):
+        managed = cls._route(readonly)
+        try:
+            connection = await managed.acquire()
+        except (OSError, asyncpg.PostgresConnectionError):
+            if managed is cls._primary:
+                raise
+            managed.failed_at = time.monotonic()
+            managed = cls._primary
+            connection = await managed.acquire()
+
+        try:
             yield connection
+        finally:
+            await managed.release(connection)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        stats = cls._primary.stats()
+        if cls._replicas:
+            stats["replica_reads"] = cls.replica_reads
+            stats["primary_fallback_reads"] = cls.fallback_reads
+            stats["replicas"] = [
+                {
+                    "name": replica.name,
+                    "lag_seconds": replica.lag_seconds,
+                    "usable": replica.lag_seconds is not None
+                    and replica.lag_seconds <= settings.db_replica_max_lag_seconds,
+                    **replica.stats()
+                }
+                for replica in cls._replicas
+            ]
+        return stats
+
+
+class NotificationListener:
+    """Dedicated LISTEN connection for one NOTIFY channel.
+
+    `on_lost` runs when the connection drops; callers treat that as "state
+    may have changed" and call `ensure` again on their next refresh.
+    """
+
+    def __init__(self, channel: str, callback: Callable, on_lost: Callable[[], None]):
+        self.channel = channel
+        self.callback = callback
+        self.on_lost = on_lost
+        self._connection: Optional[asyncpg.Connection] = None
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def ensure(self) -> bool:
+        if self.listening:
+            return True
+        try:
+            self._connection = await asyncpg.connect(DATABASE_URL)
+            await self._connection.add_listener(self.channel, self.callback)
+            self._connection.add_termination_listener(self._terminated)
+        except (OSError, asyncpg.PostgresError):
+            self._connection = None
+        return self._connection is not None
+
+    def _terminated(self, connection: asyncpg.Connection) -> None:
+        self._connection = None
+        self.on_lost()
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+
+PROVIDER_KINDS = ('venue', 'caterer')
+
+BOOKING_IMPORT_COLUMNS = (
+    'id', 'client_id', 'venue_id', 'caterer_id', 'event_date', 'number_of_guests',
+    'event_type', 'cuisine_preferences', 'special_requirements', 'status',
+    'venue_cost', 'catering_cost', 'total_cost'
+)
+
+
+class BookingConflictError(Exception):
+    def __init__(self, kind: str, provider_id: str, event_date: date):
+        super().__init__(f"The {kind} {provider_id} is already booked on {event_date.isoformat()}")
+        self.kind = kind
+        self.provider_id = provider_id
+        self.event_date = event_date
+
+
+def _holds_slot(booking: Dict[str, Any], kind: str) -> bool:
+    return booking.get(f'{kind}_id') is not None and booking.get('status') != 'cancelled'
+
+
+SEARCH_ORDERS = ('name', 'cost')
+
+
+def _page_params(number_of_guests, budget_per_guest, order_by, limit, offset, after, cost_needs_guests) -> Tuple:
+    """Parameters $6-$12 of the search statements. `after` is the
+    `(sort_cost, name, id)` key of the last row of the previous page."""
+    if order_by not in SEARCH_ORDERS:
+        raise ValueError(f"order_by must be one of {', '.join(SEARCH_ORDERS)}")
+    if number_of_guests is None and (budget_per_guest is not None or (order_by == 'cost' and cost_needs_guests)):
+        raise ValueError("Pricing candidates needs number_of_guests")
+    after_cost, after_name, after_id = after if after is not None else (None, None, None)
+    if after_cost is not None:
+        after_cost = Decimal(after_cost)
+    return (budget_per_guest, order_by == 'cost', limit, offset, after_name, after_id, after_cost)
+
+
+def _venue_search(
+    location, min_capacity, max_capacity, available_on,
+    number_of_guests=None, budget_per_guest=None, order_by='name', limit=None, offset=None, after=None,
+    duration_hours=DEFAULT_EVENT_DURATION_HOURS
+) -> Tuple:
+    params = (
+        location or None, min_capacity, max_capacity, number_of_guests, duration_hours,
+        *_page_params(number_of_guests, budget_per_guest, order_by, limit, offset, after, cost_needs_guests=False)
+    )
+    name = "venues" if location else "venues_anywhere"
+    if available_on is None:
+        return (name, *params)
+    return (f"{name}_available_on", *params, as_date(available_on))
+
+
+def _caterer_search(
+    location, min_guests, max_guests, cuisines, available_on,
+    number_of_guests=None, budget_per_guest=None, order_by='name', limit=None, offset=None, after=None
+) -> Tuple:
+    params = (
+        location or None, min_guests, max_guests, cuisines or None, number_of_guests,
+        *_page_params(number_of_guests, budget_per_guest, order_by, limit, offset, after, cost_needs_guests=True)
+    )
+    name = "caterers" if location else "caterers_anywhere"
+    if available_on is None:
+        return (name, *params)
+    return (f"{name}_available_on", *params, as_date(available_on))
+
+
+def as_date(value: Union[str, date]) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
 
 
 class DatabaseService:
@@ -52,42 +432,43 @@ class DatabaseService:
             else:
                 return await conn.execute(query, *args)
     
+    @staticmethod
+    async def execute_statement(
+        name: str,
+        *args,
+        fetch_one: bool = False
+    ) -> Any:
+        readonly = name not in WRITE_STATEMENTS
+        if not readonly:
+            DatabaseConnection.pin_primary()
+        async with DatabaseConnection.get_connection(readonly=readonly) as conn:
+            statement = await conn.registered_statement(name)
+            with query_span(name):
+                try:
+                    return await (statement.fetchrow(*args) if fetch_one else statement.fetch(*args))
+                except (asyncpg.InvalidCachedStatementError, asyncpg.OutdatedSchemaCacheError):
+                    statement = await conn.registered_statement(name, refresh=True)
+                    return await (statement.fetchrow(*args) if fetch_one else statement.fetch(*args))
+    
     @staticmethod
     async def fetch_venues(
         location: Optional[str] = None,
         min_capacity: Optional[int] = None,
-        max_capacity: Optional[int] = None
+        max_capacity: Optional[int] = None,
+        available_on: Optional[Union[str, date]] = None,
+        number_of_guests: Optional[int] = None,
+        budget_per_guest: Optional[float] = None,
+        order_by: str = 'name',
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[Tuple] = None
     ) -> List[Dict[str, Any]]:
-        query = """
-            SELECT 
-                id, name, location, address, capacity_min, capacity_max,
-                base_room_rental_fee, hourly_rate, includes_catering,
-                supported_cuisines_if_included, amenities, description,
-                contact_email, contact_phone, is_active
-            FROM venues
-            WHERE is_active = TRUE
-        """
-        params = []
-        param_count = 1
-        
-        if location:
-            query += f" AND LOWER(location) = LOWER(${param_count})"
-            params.append(location)
-            param_count += 1
-        
-        if min_capacity is not None:
-            query += f" AND capacity_max >= ${param_count}"
-            params.append(min_capacity)
-            param_count += 1
-        
-        if max_capacity is not None:
-            query += f" AND capacity_min <= ${param_count}"
-            params.append(max_capacity)
-            param_count += 1
-        
-        query += " ORDER BY name"
-        
-        rows = await DatabaseService.execute_query(query, *params, fetch_all=True)
+        rows = await DatabaseService.execute_statement(
+            *_venue_search(
+                location, min_capacity, max_capacity, available_on,
+                number_of_guests, budget_per_guest, order_by, limit, offset, after
+            )
+        )
         return [dict(row) for row in rows]
     
     @staticmethod
@@ -95,44 +476,91 @@ class DatabaseService:
         location: Optional[str] = None,
         min_guests: Optional[int] = None,
         max_guests: Optional[int] = None,
-        cuisines: Optional[List[str]] = None
+        cuisines: Optional[List[str]] = None,
+        available_on: Optional[Union[str, date]] = None,
+        number_of_guests: Optional[int] = None,
+        budget_per_guest: Optional[float] = None,
+        order_by: str = 'name',
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[Tuple] = None
     ) -> List[Dict[str, Any]]:
-        query = """
-            SELECT 
-                id, name, location, address, supported_cuisines,
-                base_price_per_guest, service_fee_flat, tax_rate_percent,
-                min_guests, max_guests, notes, contact_email, contact_phone,
-                is_active
-            FROM caterers
-            WHERE is_active = TRUE
-        """
-        params = []
-        param_count = 1
-        
-        if location:
-            query += f" AND LOWER(location) = LOWER(${param_count})"
-            params.append(location)
-            param_count += 1
-        
-        if min_guests is not None:
-            query += f" AND max_guests >= ${param_count}"
-            params.append(min_guests)
-            param_count += 1
-        
-        if max_guests is not None:
-            query += f" AND min_guests <= ${param_count}"
-            params.append(max_guests)
-            param_count += 1
-        
-        if cuisines:
-            query += f" AND supported_cuisines && ${param_count}::text[]"
-            params.append(cuisines)
-            param_count += 1
-        
-        query += " ORDER BY name"
-        
-        rows = await DatabaseService.execute_query(query, *params, fetch_all=True)
+        rows = await DatabaseService.execute_statement(
+            *_caterer_search(
+                location, min_guests, max_guests, cuisines, available_on,
+                number_of_guests, budget_per_guest, order_by, limit, offset, after
+            )
+        )
         return [dict(row) for row in rows]
+
+    @staticmethod
+    async def stream_statement(name: str, *args) -> AsyncIterator[Dict[str, Any]]:
+        """Rows of a read-only statement from a server-side cursor, fetched
+        `PLAN_STREAM_PREFETCH` at a time. The connection is held until the
+        iterator is exhausted or closed. As in `execute_statement`, a
+        statement a schema change invalidated is prepared again and retried,
+        as long as no row has been yielded. `db_query_seconds` times the
+        query up to its first batch, not the pace the consumer reads at."""
+        prefetch = settings.plan_stream_prefetch
+        yielded = False
+        async with DatabaseConnection.get_connection(readonly=True) as conn:
+            for refresh in (False, True):
+                try:
+                    async with conn.transaction(readonly=True):
+                        with query_span(name):
+                            statement = await conn.registered_statement(name, refresh=refresh)
+                            cursor = await statement.cursor(*args)
+                            rows = await cursor.fetch(prefetch)
+                        while rows:
+                            for row in rows:
+                                yielded = True
+                                yield dict(row)
+                            rows = await cursor.fetch(prefetch) if len(rows) == prefetch else []
+                    return
+                except (asyncpg.InvalidCachedStatementError, asyncpg.OutdatedSchemaCacheError):
+                    if refresh or yielded:
+                        raise
+
+    @staticmethod
+    def stream_venues(
+        location: Optional[str] = None,
+        min_capacity: Optional[int] = None,
+        max_capacity: Optional[int] = None,
+        available_on: Optional[Union[str, date]] = None,
+        number_of_guests: Optional[int] = None,
+        budget_per_guest: Optional[float] = None,
+        order_by: str = 'name',
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[Tuple] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return DatabaseService.stream_statement(
+            *_venue_search(
+                location, min_capacity, max_capacity, available_on,
+                number_of_guests, budget_per_guest, order_by, limit, offset, after
+            )
+        )
+
+    @staticmethod
+    def stream_caterers(
+        location: Optional[str] = None,
+        min_guests: Optional[int] = None,
+        max_guests: Optional[int] = None,
+        cuisines: Optional[List[str]] = None,
+        available_on: Optional[Union[str, date]] = None,
+        number_of_guests: Optional[int] = None,
+        budget_per_guest: Optional[float] = None,
+        order_by: str = 'name',
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[Tuple] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return DatabaseService.stream_statement(
+            *_caterer_search(
+                location, min_guests, max_guests, cuisines, available_on,
+                number_of_guests, budget_per_guest, order_by, limit, offset, after
+            )
+        )
     
     @staticmethod
     async def create_booking(
@@ -148,33 +576,96 @@ class DatabaseService:
         catering_cost: Optional[float] = None,
         total_cost: Optional[float] = None
     ) -> Dict[str, Any]:
-        query = """
-            INSERT INTO bookings (
-                client_id, venue_id, caterer_id, event_date, number_of_guests,
-                event_type, cuisine_preferences, special_requirements,
-                venue_cost, catering_cost, total_cost, status
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, 'pending')
-            RETURNING *
-        """
-        
-        row = await DatabaseService.execute_query(
-            query,
-            client_id, venue_id, caterer_id, event_date, number_of_guests,
-            event_type, cuisine_preferences, special_requirements,
-            venue_cost, catering_cost, total_cost,
-            fetch_one=True
-        )
+        day = as_date(event_date)
+        DatabaseConnection.pin_primary()
+        async with DatabaseConnection.get_connection() as conn:
+            async with conn.transaction():
+                statement = await conn.registered_statement("create_booking")
+                row = await statement.fetchrow(
+                    client_id, venue_id, caterer_id, day, number_of_guests,
+                    event_type, cuisine_preferences, special_requirements,
+                    venue_cost, catering_cost, total_cost
+                )
+                # Venue before caterer, so concurrent bookings lock slots in
+                # the same order.
+                for kind, provider_id in (('venue', venue_id), ('caterer', caterer_id)):
+                    if provider_id is None:
+                        continue
+                    statement = await conn.registered_statement(f"reserve_{kind}")
+                    if await statement.fetchval(provider_id, day, row['id']) is None:
+                        raise BookingConflictError(kind, str(provider_id), day)
         
-        return dict(row) if row else None
+        return dict(row)
     
     @staticmethod
-    async def check_venue_availability(venue_id: str, date: str) -> bool:
-        query = """
-            SELECT is_available
-            FROM venue_availability
-            WHERE venue_id = $1 AND date = $2
+    async def import_bookings(bookings: List[Dict[str, Any]]) -> List[Tuple[int, str]]:
+        """Insert `bookings` (ids, dates and amounts already typed) and block
+        their calendar slots in one transaction.
+
+        Rows whose venue or caterer slot is already blocked, or taken by an
+        earlier row of the same call, are skipped and returned as
+        `(index, kind)`. Cancelled bookings are imported without blocking
+        anything. The calendars are locked against concurrent writers
+        for the duration, so the check and the insert cannot race.
         """
-        row = await DatabaseService.execute_query(query, venue_id, date, fetch_one=True)
+        conflicts: List[Tuple[int, str]] = []
+        if not bookings:
+            return conflicts
+
+        DatabaseConnection.pin_primary()
+        async with DatabaseConnection.get_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "LOCK TABLE venue_availability, caterer_availability IN SHARE ROW EXCLUSIVE MODE"
+                )
+                dates = sorted({booking['event_date'] for booking in bookings})
+                taken: Dict[str, Set[Tuple[Any, date]]] = {}
+                for kind in PROVIDER_KINDS:
+                    ids = list({booking[f'{kind}_id'] for booking in bookings if _holds_slot(booking, kind)})
+                    rows = []
+                    if ids:
+                        statement = await conn.registered_statement(f"unavailable_{kind}s")
+                        rows = await statement.fetch(ids, dates)
+                    taken[kind] = {(row[f'{kind}_id'], row['date']) for row in rows}
+
+                accepted = []
+                for index, booking in enumerate(bookings):
+                    slots = [
+                        (kind, (booking[f'{kind}_id'], booking['event_date']))
+                        for kind in PROVIDER_KINDS if _holds_slot(booking, kind)
+                    ]
+                    clash = next((kind for kind, slot in slots if slot in taken[kind]), None)
+                    if clash is not None:
+                        conflicts.append((index, clash))
+                        continue
+                    for kind, slot in slots:
+                        taken[kind].add(slot)
+                    accepted.append(booking)
+
+                if not accepted:
+                    return conflicts
+                await conn.copy_records_to_table(
+                    'bookings',
+                    records=[tuple(booking.get(column) for column in BOOKING_IMPORT_COLUMNS) for booking in accepted],
+                    columns=BOOKING_IMPORT_COLUMNS
+                )
+                for kind in PROVIDER_KINDS:
+                    reserved = [booking for booking in accepted if _holds_slot(booking, kind)]
+                    if reserved:
+                        statement = await conn.registered_statement(f"reserve_{kind}s")
+                        await statement.fetch(
+                            [booking[f'{kind}_id'] for booking in reserved],
+                            [booking['event_date'] for booking in reserved],
+                            [booking['id'] for booking in reserved]
+                        )
+
+        return conflicts
+    
+    @staticmethod
+    async def check_venue_availability(venue_id: str, date: str) -> bool:
+        row = await DatabaseService.execute_statement(
+            "venue_availability", venue_id, as_date(date), fetch_one=True
+        )
         
         if row is None:
             return True
@@ -183,14 +674,44 @@ class DatabaseService:
     
     @staticmethod
     async def check_caterer_availability(caterer_id: str, date: str) -> bool:
-        query = """
-            SELECT is_available
-            FROM caterer_availability
-            WHERE caterer_id = $1 AND date = $2
-        """
-        row = await DatabaseService.execute_query(query, caterer_id, date, fetch_one=True)
+        row = await DatabaseService.execute_statement(
+            "caterer_availability", caterer_id, as_date(date), fetch_one=True
+        )
         
         if row is None:
             return True
         
         return row['is_available']
+    
+    @staticmethod
+    async def fetch_unavailable_venues(
+        venue_ids: List[Any],
+        dates: List[Union[str, date]]
+    ) -> Set[Tuple[str, date]]:
+        if not venue_ids or not dates:
+            return set()
+        rows = await DatabaseService.execute_statement(
+            "unavailable_venues", venue_ids, [as_date(d) for d in dates]
+        )
+        return {(str(row['venue_id']), row['date']) for row in rows}
+    
+    @staticmethod
+    async def fetch_unavailable_caterers(
+        caterer_ids: List[Any],
+        dates: List[Union[str, date]]
+    ) -> Set[Tuple[str, date]]:
+        if not caterer_ids or not dates:
+            return set()
+        rows = await DatabaseService.execute_statement(
+            "unavailable_caterers", caterer_ids, [as_date(d) for d in dates]
+        )
+        return {(str(row['caterer_id']), row['date']) for row in rows}
+    
+    @staticmethod
+    async def fetch_blocked_dates(kind: str, since: date) -> List[Tuple[str, date]]:
+        name = {
+            'venue': 'blocked_venue_dates',
+            'caterer': 'blocked_caterer_dates',
+        }[kind]
+        rows = await DatabaseService.execute_statement(name, since)
+        return [(str(row['provider_id']), row['date']) for row in rows]
@@ -0,0 +1,43 @@
+"""Bulk-import bookings from the old system's CSV export.
+
+The CSV needs a header row with client_id, event_date and number_of_guests,
+and may carry venue_id, caterer_id, event_type, cuisine_preferences
+(semicolon-separated), special_requirements, status, venue_cost,
+catering_cost and total_cost. Each booking's venue and caterer are blocked
+on its date; rows that clash with an existing or earlier booking are
+skipped and listed.
+
+    python -m app.import_bookings bookings.csv --batch-size 5000
+"""
+import argparse
+import asyncio
+import csv
+import time
+
+from app.config import BOOKING_IMPORT_BATCH_SIZE
+from app.database import DatabaseConnection
+from app.services.booking_service import import_bookings
+
+
+async def main(path: str, batch_size: int) -> None:
+    started = time.perf_counter()
+    try:
+        with open(path, newline='') as handle:
+            result = await import_bookings(csv.DictReader(handle), batch_size=batch_size)
+    finally:
+        await DatabaseConnection.close_pool()
+
+    elapsed = time.perf_counter() - started
+    print(f"imported {result['imported']} booking(s) in {elapsed:.2f}s "
+          f"({result['imported'] / elapsed:,.0f}/s)")
+    for conflict in result['conflicts']:
+        # +2: header line, and CSV lines are 1-based.
+        print(f"  line {conflict['row'] + 2}: {conflict['kind']} already booked on that date, skipped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--batch-size", type=int, default=BOOKING_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(main(args.path, args.batch_size))
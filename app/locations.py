@@ -0,0 +1,37 @@
+import re
+from typing import Dict, Optional
+
+from app.config import LOCATION_ALIASES, SUPPORTED_LOCATIONS
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def fold(location: str) -> str:
+    """Case, punctuation and spacing folded away, so `" San  Francisco, CA"`
+    and `"san-francisco ca"` compare equal."""
+    return _SEPARATORS.sub(" ", location.casefold()).strip()
+
+
+# Canonical city id (`"san-francisco"`) -> the spelling providers are stored under.
+CITIES: Dict[str, str] = {fold(name).replace(" ", "-"): name for name in SUPPORTED_LOCATIONS}
+
+_IDS_BY_SPELLING: Dict[str, str] = {
+    fold(spelling): city
+    for city, name in CITIES.items()
+    for spelling in [name, *LOCATION_ALIASES.get(name, [])]
+}
+
+
+def city_id(location: str) -> Optional[str]:
+    """Canonical id of a supported city under any of its names, or None."""
+    return _IDS_BY_SPELLING.get(fold(location))
+
+
+def canonical_location(location: str) -> str:
+    """The stored spelling for a supported city or one of its aliases.
+    Other locations come back trimmed with inner whitespace collapsed; the
+    search statements still match them case-insensitively."""
+    city = city_id(location)
+    if city is not None:
+        return CITIES[city]
+    return " ".join(location.split())
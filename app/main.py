@@ -1,30 +1,74 @@
-from fastapi import FastAPI, HTTPException
-from contextlib import asynccontextmanager
-from typing import List
+import os
+import time
+from fastapi import FastAPI, HTTPException, Header, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from contextlib import aclosing, asynccontextmanager
+from typing import List, Dict, Optional, Any, AsyncIterator, Tuple
 
 from app.models import (
     EventPlanRequest,
     EventPlanResponse,
+    BatchEventPlanRequest,
+    BatchEventPlanResponse,
+    AvailabilitySearchRequest,
+    AvailabilitySearchResponse,
+    BookingRequest,
+    BookingResponse,
     InputSummary,
-    CateringAnalysis
+    CateringAnalysis,
+    VenueCatererCombination
 )
 from app.services.catering_service import (
     filter_catering_services,
     build_catering_analysis,
-    get_cheapest_catering_cost
+    build_catering_provider,
+    calculate_cost_breakdown,
+    get_cheapest_catering_cost,
+    listed_cuisines,
+    preference_set
 )
 from app.services.venue_service import (
     filter_event_rooms,
+    build_event_room,
     build_event_room_response
 )
-from app.config import DEFAULT_EVENT_DURATION_HOURS
-from app.database import DatabaseConnection
+from app.services.batch_service import fetch_batch_candidates
+from app.services.availability_service import search_availability
+from app.services.booking_service import create_booking
+from app.services.combination_service import rank_combinations
+from app.services.pricing_service import (
+    CateringPriceTable,
+    price_catering_services,
+    price_event_rooms,
+    resolve_price_table
+)
+from app.services.stages import run_stages, StageTimeoutError
+from app.config import COMBINATION_TOP_K, DEFAULT_EVENT_DURATION_HOURS, settings
+from app.database import DatabaseConnection, DatabaseService, BookingConflictError, PoolExhaustedError
+from app.responses import ModelResponse, conditional_response, etag_for, frame_stream
+from app.catalog import CatalogCache
+from app.availability import AvailabilityIndex
+from app.response_cache import PlanResponseCache
+from app.statements import StatementRegistry
+from app.pagination import CATERERS, ROOMS, PageCursor, candidate_query, page_size, sort_key, take_page
+from app.tracing import Metrics, RequestTimingMiddleware, SamplingProfiler, Tracer, stage_span
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await DatabaseConnection.get_pool()
+    # Each worker warms its own pool (statements are prepared as the
+    # connections open) and catalog before uvicorn lets traffic in.
+    started = time.perf_counter()
+    Tracer.configure()
+    await DatabaseConnection.start()
+    await CatalogCache.start()
+    await PlanResponseCache.start()
+    app.state.warmup_seconds = time.perf_counter() - started
     yield
+    await PlanResponseCache.stop()
+    await AvailabilityIndex.stop()
+    await CatalogCache.stop()
     await DatabaseConnection.close_pool()
 
 
@@ -36,6 +80,15 @@ app = FastAPI(
 )
 
 
+def route_label(path: str) -> str:
+    # Labelled by route template rather than raw path to keep the
+    # label set bounded; unmatched paths share one series.
+    return path if path in _ROUTE_PATHS else "unmatched"
+
+
+app.add_middleware(RequestTimingMiddleware, label=route_label)
+
+
 @app.get("/")
 async def root():
     return {
@@ -44,7 +97,13 @@ async def root():
         "database": "PostgreSQL",
         "endpoints": {
             "plan_event": "POST /plan-event",
+            "plan_event_stream": "POST /plan-event/stream",
+            "plan_events": "POST /plan-events",
+            "availability_search": "POST /availability/search",
+            "bookings": "POST /bookings",
             "health": "GET /health",
+            "stats": "GET /stats",
+            "metrics": "GET /metrics",
             "docs": "GET /docs"
         }
     }
@@ -53,77 +112,473 @@ async def root():
 @app.get("/health")
 async def health_check():
     try:
-        pool = await DatabaseConnection.get_pool()
-        async with pool.acquire() as conn:
+        async with DatabaseConnection.get_connection() as conn:
             await conn.fetchval("SELECT 1")
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
+@app.get("/stats")
+async def stats():
+    return {
+        "worker": {
+            "pid": os.getpid(),
+            "workers": settings.web_concurrency,
+            "warmup_seconds": round(getattr(app.state, "warmup_seconds", 0.0), 3)
+        },
+        "pool": DatabaseConnection.stats(),
+        "catalog": CatalogCache.stats(),
+        "availability": AvailabilityIndex.stats(),
+        "response_cache": PlanResponseCache.stats(),
+        "statements": StatementRegistry.stats()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    # Histograms are per worker: with WEB_CONCURRENCY > 1 each scrape
+    # reaches one worker, so scrape workers individually or run one.
+    return PlainTextResponse(Metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/debug/profile", response_class=PlainTextResponse)
+async def debug_profile(seconds: float = Query(default=10.0, gt=0)):
+    if not settings.profiler_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    try:
+        folded = await run_in_threadpool(
+            SamplingProfiler.profile,
+            min(seconds, settings.profiler_max_seconds),
+            settings.profiler_sample_interval_seconds
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse(folded)
+
+
 @app.post("/plan-event", response_model=EventPlanResponse)
-async def plan_event(request: EventPlanRequest):
+async def plan_event(request: EventPlanRequest, if_none_match: Optional[str] = Header(default=None)):
     try:
-        filtered_catering = await filter_catering_services(
-            location=request.location,
-            number_of_guests=request.number_of_guests,
-            cuisine_preferences=request.cuisine_preferences
+        if PlanResponseCache.enabled():
+            cache_key = PlanResponseCache.key_for(request)
+            cached = await PlanResponseCache.get(cache_key)
+            if cached is not None:
+                return conditional_response(cached.body, cached.etag, if_none_match)
+            generation = PlanResponseCache.generation
+
+        cursor = PageCursor.for_request(request)
+        stages = {}
+        if not cursor.exhausted(CATERERS):
+            stages["catering"] = filter_catering_services(
+                location=request.location,
+                number_of_guests=request.number_of_guests,
+                cuisine_preferences=request.cuisine_preferences,
+                event_date=request.event_date,
+                **candidate_query(request, cursor, CATERERS)
+            )
+        if request.needs_event_room and not cursor.exhausted(ROOMS):
+            stages["rooms"] = filter_event_rooms(
+                location=request.location,
+                number_of_guests=request.number_of_guests,
+                event_date=request.event_date,
+                **candidate_query(request, cursor, ROOMS)
+            )
+        if request.needs_event_room:
+            stages["cheapest_caterers"] = fetch_cheapest_caterers(request)
+            stages["cheapest_rooms"] = fetch_cheapest_rooms(request)
+
+        candidates = await run_stages(stages)
+
+        plan = await assemble_page(
+            request,
+            cursor,
+            catering_rows=candidates.get("catering", []),
+            room_rows=candidates.get("rooms", []),
+            cheapest=(candidates.get("cheapest_caterers", []), candidates.get("cheapest_rooms", []))
+        )
+        with stage_span("serialize"):
+            body = ModelResponse(plan).body
+
+        if PlanResponseCache.enabled():
+            cached = PlanResponseCache.put(cache_key, body, generation)
+            return conditional_response(body, cached.etag, if_none_match)
+        return conditional_response(body, etag_for(body), if_none_match)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StageTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except PoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@app.post("/plan-event/stream")
+async def plan_event_stream(request: EventPlanRequest, accept: Optional[str] = Header(default=None)):
+    if request.rank_by_rating:
+        raise HTTPException(
+            status_code=400,
+            detail="rank_by_rating needs every candidate before the first one is sent and is not available when streaming"
         )
+    try:
+        cursor = PageCursor.for_request(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    sse = accept is not None and "text/event-stream" in accept
+    return StreamingResponse(
+        frame_stream(stream_plan(request, cursor), sse=sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson"
+    )
+
+
+@app.post("/plan-events", response_model=BatchEventPlanResponse)
+async def plan_events(batch: BatchEventPlanRequest):
+    try:
+        groups = await fetch_batch_candidates(batch.requests)
+
+        results = []
+        for request in batch.requests:
+            group = groups[request.location.lower()]
+            cursor = PageCursor.for_request(request)
+            catering_rows, room_rows = group.candidates_for(request, cursor)
+            results.append(await assemble_page(
+                request,
+                cursor,
+                catering_rows,
+                room_rows,
+                group.cheapest_for(request),
+                price_table=group.price_table
+            ))
+
+        return ModelResponse(BatchEventPlanResponse(results=results))
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StageTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except PoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@app.post("/availability/search", response_model=AvailabilitySearchResponse)
+async def availability_search(request: AvailabilitySearchRequest):
+    try:
+        return ModelResponse(await search_availability(request))
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StageTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except PoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@app.post("/bookings", response_model=BookingResponse, status_code=201)
+async def book(request: BookingRequest):
+    try:
+        return await create_booking(request)
+    except BookingConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+async def assemble_plan(
+    request: EventPlanRequest,
+    filtered_catering: List[Dict],
+    filtered_rooms: List[Dict],
+    price_table: Optional[CateringPriceTable] = None,
+    next_cursor: Optional[str] = None,
+    cheapest: Optional[Tuple[List[Dict], List[Dict]]] = None,
+    paged: bool = False
+) -> EventPlanResponse:
+    """The plan for the given caterers and rooms. The cheapest caterer and
+    the recommended combinations come from `cheapest`, the cheapest
+    caterers and rooms of the whole filtered set; without it the given
+    lists are taken to be the whole set."""
+    if price_table is None:
+        price_table = price_catering_services(filtered_catering, [request.number_of_guests])
+
+    with stage_span("catering_analysis"):
         catering_analysis = await build_catering_analysis(
             services=filtered_catering,
             number_of_guests=request.number_of_guests,
-            cuisine_preferences=request.cuisine_preferences
+            cuisine_preferences=request.cuisine_preferences,
+            price_table=price_table,
+            rank_by_rating=request.rank_by_rating
         )
 
-        event_rooms = []
-        cheapest_catering_cost = 0.0
-
-        if request.needs_event_room:
-            filtered_rooms = await filter_event_rooms(
-                location=request.location,
-                number_of_guests=request.number_of_guests
-            )
+    event_rooms = []
+    recommended_combinations = []
 
-            cheapest_catering_cost = await get_cheapest_catering_cost(
-                filtered_catering,
-                request.number_of_guests
+    if request.needs_event_room:
+        with stage_span("combinations"):
+            cheapest_catering_cost, recommended_combinations = await cheapest_pairs(
+                request,
+                *(cheapest or (filtered_catering, filtered_rooms)),
+                price_table=price_table
             )
 
+        with stage_span("event_rooms"):
             event_rooms = await build_event_room_response(
                 rooms=filtered_rooms,
                 cheapest_catering_cost=cheapest_catering_cost,
-                duration_hours=DEFAULT_EVENT_DURATION_HOURS
+                duration_hours=DEFAULT_EVENT_DURATION_HOURS,
+                rank_by_rating=request.rank_by_rating
             )
-        
+    
+    with stage_span("summary"):
         summary_text = build_summary_text(
             location=request.location,
             event_date=request.event_date,
             number_of_guests=request.number_of_guests,
             catering_analysis=catering_analysis,
             event_rooms=event_rooms,
-            cuisine_preferences=request.cuisine_preferences
+            cuisine_preferences=request.cuisine_preferences,
+            paged=paged
         )
-        
-        input_summary = InputSummary(
-            event_date=request.event_date,
+    
+    return EventPlanResponse(
+        input_summary=build_input_summary(request),
+        catering_analysis=catering_analysis,
+        event_rooms=event_rooms,
+        recommended_combinations=recommended_combinations,
+        summary_text=summary_text,
+        next_cursor=next_cursor
+    )
+
+
+async def assemble_page(
+    request: EventPlanRequest,
+    cursor: PageCursor,
+    catering_rows: List[Dict],
+    room_rows: List[Dict],
+    cheapest: Tuple[List[Dict], List[Dict]],
+    price_table: Optional[CateringPriceTable] = None
+) -> EventPlanResponse:
+    """The plan for one page of candidates fetched with `candidate_query`,
+    which asks for one row past the page to learn whether more follow, and
+    the `fetch_cheapest_*` picks of the whole filtered set."""
+    filtered_catering, caterers_after = take_page(catering_rows, request, CATERERS)
+    filtered_rooms, rooms_after = take_page(room_rows, request, ROOMS)
+    after = {CATERERS: caterers_after, ROOMS: rooms_after}
+    check_rating_order(request, after)
+    return await assemble_plan(
+        request,
+        filtered_catering,
+        filtered_rooms,
+        price_table=price_table,
+        next_cursor=cursor.next_token(request, after),
+        cheapest=cheapest,
+        paged=is_paged(request, cursor, after)
+    )
+
+
+def check_rating_order(request: EventPlanRequest, after: Dict[str, Optional[List]]) -> None:
+    # Rating is not part of the page key, so ranking one page of several
+    # would contradict the order the cursor continues in.
+    if request.rank_by_rating and any(key is not None for key in after.values()):
+        raise ValueError(
+            f"rank_by_rating needs every candidate on one page and more than {page_size(request)} match; "
+            f"narrow the search or leave rank_by_rating off to page through them"
+        )
+
+
+def is_paged(request: EventPlanRequest, cursor: PageCursor, after: Dict[str, Optional[List]]) -> bool:
+    """Whether the response is one page of several."""
+    return not cursor.first or bool(request.offset) or any(key is not None for key in after.values())
+
+
+def _cheapest_request(request: EventPlanRequest) -> EventPlanRequest:
+    return request.model_copy(update={"sort_by": "cost", "limit": COMBINATION_TOP_K, "offset": 0, "cursor": None})
+
+
+async def fetch_cheapest_caterers(request: EventPlanRequest) -> List[Dict]:
+    """The COMBINATION_TOP_K cheapest caterers of the whole filtered set,
+    whatever page is being served: the cheapest caterer and the
+    recommended pairs are the plan's, not the page's."""
+    if COMBINATION_TOP_K <= 0:
+        return []
+    cheapest = _cheapest_request(request)
+    rows = await filter_catering_services(
+        location=request.location,
+        number_of_guests=request.number_of_guests,
+        cuisine_preferences=request.cuisine_preferences,
+        event_date=request.event_date,
+        **candidate_query(cheapest, PageCursor.for_request(cheapest), CATERERS)
+    )
+    return take_page(rows, cheapest, CATERERS)[0]
+
+
+async def fetch_cheapest_rooms(request: EventPlanRequest) -> List[Dict]:
+    """The COMBINATION_TOP_K cheapest rooms of the whole filtered set that
+    can be paired with a caterer. Rooms with catering included are
+    skipped, continuing in cost order until enough are found."""
+    if COMBINATION_TOP_K <= 0:
+        return []
+    cheapest = _cheapest_request(request)
+    cursor = PageCursor.for_request(cheapest)
+    rooms = []
+    while True:
+        rows = await filter_event_rooms(
             location=request.location,
             number_of_guests=request.number_of_guests,
-            cuisine_preferences=request.cuisine_preferences,
-            budget_per_guest=request.budget_per_guest
+            event_date=request.event_date,
+            **candidate_query(cheapest, cursor, ROOMS)
         )
-        
-        return EventPlanResponse(
-            input_summary=input_summary,
-            catering_analysis=catering_analysis,
-            event_rooms=event_rooms,
-            summary_text=summary_text
+        page, after = take_page(rows, cheapest, ROOMS)
+        rooms.extend(room for room in page if not room['includes_catering'])
+        if len(rooms) >= COMBINATION_TOP_K or after is None:
+            return rooms[:COMBINATION_TOP_K]
+        cursor = PageCursor({CATERERS: None, ROOMS: after}, first=False)
+
+
+async def cheapest_pairs(
+    request: EventPlanRequest,
+    caterers: List[Dict],
+    rooms: List[Dict],
+    price_table: Optional[CateringPriceTable] = None
+) -> Tuple[float, List[VenueCatererCombination]]:
+    """The cheapest caterer's total and the recommended combinations, from
+    the cheapest caterers and rooms of the whole filtered set."""
+    guests = request.number_of_guests
+    price_table = resolve_price_table(caterers, guests, price_table)
+    cheapest_catering_cost = await get_cheapest_catering_cost(caterers, guests, price_table=price_table)
+    event_rooms = await build_event_room_response(rooms, cheapest_catering_cost, DEFAULT_EVENT_DURATION_HOURS)
+    return cheapest_catering_cost, rank_combinations(
+        event_rooms=event_rooms,
+        services=caterers,
+        price_table=price_table,
+        number_of_guests=guests,
+        cuisine_preferences=request.cuisine_preferences,
+        budget_per_guest=request.budget_per_guest
+    )
+
+
+def build_input_summary(request: EventPlanRequest) -> InputSummary:
+    return InputSummary(
+        event_date=request.event_date,
+        location=request.location,
+        number_of_guests=request.number_of_guests,
+        cuisine_preferences=request.cuisine_preferences,
+        budget_per_guest=request.budget_per_guest
+    )
+
+
+async def stream_plan(
+    request: EventPlanRequest,
+    cursor: Optional[PageCursor] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Frames of one page of a plan, built while rows come off server-side
+    cursors.
+
+    The input summary comes first, then one `caterer` frame per provider
+    (with the cuisines it is listed under), then one `room` frame per room,
+    both in `sort_by` order, and finally the `summary` frame with the
+    recommended combinations and the `next_cursor`. Those combinations and
+    the rooms' combined costs are worked out before the first room, from
+    the `fetch_cheapest_*` picks of the whole filtered set.
+    """
+    cursor = cursor or PageCursor.for_request(request)
+    size = page_size(request)
+    guests = request.number_of_guests
+    yield {"type": "input_summary", "input_summary": build_input_summary(request).model_dump(mode="json")}
+
+    cheapest_catering_cost = 0.0
+    recommended_combinations = []
+    if request.needs_event_room:
+        cheapest = await run_stages({
+            "cheapest_caterers": fetch_cheapest_caterers(request),
+            "cheapest_rooms": fetch_cheapest_rooms(request)
+        })
+        cheapest_catering_cost, recommended_combinations = await cheapest_pairs(
+            request, cheapest["cheapest_caterers"], cheapest["cheapest_rooms"]
         )
-    
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    preferences = preference_set(request.cuisine_preferences)
+    cuisines_found = set()
+    provider_entries = 0
+    min_cost = max_cost = None
+    after = {CATERERS: None, ROOMS: None}
+
+    if not cursor.exhausted(CATERERS):
+        rows = DatabaseService.stream_caterers(
+            location=request.location,
+            min_guests=guests,
+            max_guests=guests,
+            cuisines=request.cuisine_preferences,
+            available_on=request.event_date,
+            number_of_guests=guests,
+            **candidate_query(request, cursor, CATERERS)
+        )
+        async with aclosing(rows):
+            fetched = 0
+            async for service in rows:
+                if fetched == size:
+                    after[CATERERS] = sort_key(last, CATERERS, request)
+                    break
+                fetched += 1
+                last = service
+                cuisines = listed_cuisines(service, preferences)
+                if not cuisines:
+                    continue
+                breakdown = calculate_cost_breakdown(service, guests)
+                cuisines_found.update(cuisines)
+                provider_entries += len(cuisines)
+                cost_per_guest = breakdown.effective_cost_per_guest
+                min_cost = cost_per_guest if min_cost is None else min(min_cost, cost_per_guest)
+                max_cost = cost_per_guest if max_cost is None else max(max_cost, cost_per_guest)
+                yield {
+                    "type": "caterer",
+                    "cuisines": cuisines,
+                    "provider": build_catering_provider(service, breakdown).model_dump(mode="json")
+                }
+
+    room_count = 0
+    if request.needs_event_room and not cursor.exhausted(ROOMS):
+        rows = DatabaseService.stream_venues(
+            location=request.location,
+            min_capacity=guests,
+            max_capacity=guests,
+            available_on=request.event_date,
+            number_of_guests=guests,
+            **candidate_query(request, cursor, ROOMS)
+        )
+        async with aclosing(rows):
+            async for venue in rows:
+                if room_count == size:
+                    after[ROOMS] = sort_key(last, ROOMS, request)
+                    break
+                last = venue
+                room_cost = price_event_rooms([venue], DEFAULT_EVENT_DURATION_HOURS).tolist()[0]
+                room = build_event_room(venue, room_cost, cheapest_catering_cost, DEFAULT_EVENT_DURATION_HOURS)
+                room_count += 1
+                yield {"type": "room", "room": room.model_dump(mode="json")}
+
+    yield {
+        "type": "summary",
+        "recommended_combinations": [c.model_dump(mode="json") for c in recommended_combinations],
+        "summary_text": summary_text(
+            location=request.location,
+            event_date=request.event_date,
+            number_of_guests=guests,
+            cuisines_found=sorted(cuisines_found),
+            provider_entries=provider_entries,
+            min_cost=min_cost or 0,
+            max_cost=max_cost or 0,
+            room_count=room_count,
+            paged=is_paged(request, cursor, after)
+        ),
+        "next_cursor": cursor.next_token(request, after)
+    }
 
 
 def build_summary_text(
@@ -132,43 +587,69 @@ def build_summary_text(
     number_of_guests: int,
     catering_analysis: CateringAnalysis,
     event_rooms: List,
-    cuisine_preferences: List[str] = None
+    cuisine_preferences: List[str] = None,
+    paged: bool = False
 ) -> str:
-    if not catering_analysis.by_cuisine and not event_rooms:
+    all_costs = [
+        provider.cost_breakdown.effective_cost_per_guest
+        for cuisine_group in catering_analysis.by_cuisine
+        for provider in cuisine_group.providers
+    ]
+    return summary_text(
+        location=location,
+        event_date=event_date,
+        number_of_guests=number_of_guests,
+        cuisines_found=[c.cuisine for c in catering_analysis.by_cuisine],
+        provider_entries=len(all_costs),
+        min_cost=min(all_costs) if all_costs else 0,
+        max_cost=max(all_costs) if all_costs else 0,
+        room_count=len(event_rooms),
+        paged=paged
+    )
+
+
+def summary_text(
+    location: str,
+    event_date: str,
+    number_of_guests: int,
+    cuisines_found: List[str],
+    provider_entries: int,
+    min_cost: float,
+    max_cost: float,
+    room_count: int,
+    paged: bool = False
+) -> str:
+    """With `paged`, the counts are of one page of several and an empty
+    list only means that page holds none."""
+    if not cuisines_found and not room_count and not paged:
         return (
             f"Unfortunately, we found no catering services or event rooms matching your requirements "
             f"for {number_of_guests} guests in {location} on {event_date}. "
             f"Please try a different location or adjust your guest count."
         )
     
+    on_page = " on this page" if paged else ""
     catering_summary = ""
-    if catering_analysis.by_cuisine:
-        total_providers = sum(len(c.providers) for c in catering_analysis.by_cuisine)
-        cuisines_found = [c.cuisine for c in catering_analysis.by_cuisine]
-        
-        all_costs = []
-        for cuisine_group in catering_analysis.by_cuisine:
-            for provider in cuisine_group.providers:
-                all_costs.append(provider.cost_breakdown.effective_cost_per_guest)
-        
-        min_cost = min(all_costs) if all_costs else 0
-        max_cost = max(all_costs) if all_costs else 0
-        
+    if cuisines_found:
         cuisine_text = ", ".join(cuisines_found[:3])
         if len(cuisines_found) > 3:
             cuisine_text += f" and {len(cuisines_found) - 3} more"
         
         catering_summary = (
-            f"Found {total_providers} catering provider(s) offering {cuisine_text} cuisine, "
+            f"Found {provider_entries} catering provider(s){on_page} offering {cuisine_text} cuisine, "
             f"with per-guest costs ranging from ${min_cost:.2f} to ${max_cost:.2f}. "
         )
+    elif paged:
+        catering_summary = "No catering services on this page. "
     else:
         catering_summary = f"No catering services found in {location}. "
     
     room_summary = ""
-    if event_rooms:
-        room_summary = f"{len(event_rooms)} event room(s) fit your capacity and location requirements."
-    elif catering_analysis.by_cuisine:
+    if room_count:
+        room_summary = f"{room_count} event room(s){on_page} fit your capacity and location requirements."
+    elif paged:
+        room_summary = "No event rooms on this page."
+    elif cuisines_found:
         room_summary = "No event rooms available for your requirements."
     
     return (
@@ -177,6 +658,10 @@ def build_summary_text(
     )
 
 
+_ROUTE_PATHS = frozenset(route.path for route in app.routes)
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, workers=settings.web_concurrency)
+
@@ -0,0 +1,185 @@
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+
+Interval = Tuple[int, int, int]
+
+
+class IntervalTree:
+    """Centered interval tree over closed ranges `[low, high]`.
+
+    `overlapping(a, b)` returns the payload of every interval with
+    `low <= b and high >= a` in O(log n + k).
+    """
+
+    __slots__ = ("center", "by_low", "by_high", "left", "right")
+
+    def __init__(self, intervals: List[Interval]):
+        endpoints = sorted(point for low, high, _ in intervals for point in (low, high))
+        self.center = endpoints[len(endpoints) // 2] if endpoints else 0
+
+        here, lower, upper = [], [], []
+        for interval in intervals:
+            if interval[1] < self.center:
+                lower.append(interval)
+            elif interval[0] > self.center:
+                upper.append(interval)
+            else:
+                here.append(interval)
+
+        self.by_low = sorted(here, key=lambda i: i[0])
+        self.by_high = sorted(here, key=lambda i: i[1], reverse=True)
+        self.left = IntervalTree(lower) if lower else None
+        self.right = IntervalTree(upper) if upper else None
+
+    def overlapping(self, a: int, b: int) -> List[int]:
+        found: List[int] = []
+        node = self
+        pending = []
+        while node is not None:
+            if b < node.center:
+                for low, _, payload in node.by_low:
+                    if low > b:
+                        break
+                    found.append(payload)
+                node = node.left
+            elif a > node.center:
+                for _, high, payload in node.by_high:
+                    if high < a:
+                        break
+                    found.append(payload)
+                node = node.right
+            else:
+                found.extend(payload for _, _, payload in node.by_low)
+                if node.right is not None:
+                    pending.append(node.right)
+                node = node.left
+            if node is None and pending:
+                node = pending.pop()
+        return found
+
+
+class LocationPartition:
+    __slots__ = ("ranges", "tree", "cuisine_masks", "postings", "size")
+
+    def __init__(
+        self,
+        rows: List[Tuple[int, Dict[str, Any]]],
+        low_key: str,
+        high_key: str,
+        cuisine_bits: Optional[Dict[str, int]],
+        cuisines_key: Optional[str]
+    ):
+        self.size = len(rows)
+        self.ranges: Dict[int, Tuple[int, int]] = {}
+        self.cuisine_masks: Dict[int, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+
+        intervals = []
+        for position, row in rows:
+            low, high = row[low_key], row[high_key]
+            self.ranges[position] = (low, high)
+            intervals.append((low, high, position))
+
+            if cuisines_key is not None:
+                mask = 0
+                for cuisine in row[cuisines_key] or ():
+                    bit = cuisine_bits.setdefault(cuisine, len(cuisine_bits))
+                    mask |= 1 << bit
+                    self.postings.setdefault(cuisine, []).append(position)
+                self.cuisine_masks[position] = mask
+
+        self.tree = IntervalTree(intervals)
+
+    def query(
+        self,
+        a: Optional[int],
+        b: Optional[int],
+        cuisines: Optional[List[str]],
+        cuisine_bits: Dict[str, int]
+    ) -> List[int]:
+        low_bound = a if a is not None else -(1 << 62)
+        high_bound = b if b is not None else 1 << 62
+
+        if not cuisines:
+            return self.tree.overlapping(low_bound, high_bound)
+
+        wanted = {c for c in cuisines if c in self.postings}
+        if not wanted:
+            return []
+
+        posted = sum(len(self.postings[c]) for c in wanted)
+        if posted * 4 < self.size:
+            # Cuisine side is selective: walk its postings and test ranges.
+            seen = set()
+            for cuisine in wanted:
+                for position in self.postings[cuisine]:
+                    low, high = self.ranges[position]
+                    if low <= high_bound and high >= low_bound:
+                        seen.add(position)
+            return list(seen)
+
+        query_mask = 0
+        for cuisine in wanted:
+            query_mask |= 1 << cuisine_bits[cuisine]
+        masks = self.cuisine_masks
+        return [
+            position for position in self.tree.overlapping(low_bound, high_bound)
+            if masks[position] & query_mask
+        ]
+
+
+class ProviderIndex:
+    """Per-location index over providers with a `[low, high]` capacity
+    range and, optionally, a cuisine array.
+
+    Results are returned in the order of the input rows, so an index built
+    from rows sorted by name answers with `ORDER BY name` semantics.
+    """
+
+    def __init__(
+        self,
+        rows: List[Dict[str, Any]],
+        low_key: str,
+        high_key: str,
+        cuisines_key: Optional[str] = None
+    ):
+        self.rows = rows
+        self.cuisine_bits: Dict[str, int] = {}
+
+        grouped: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for position, row in enumerate(rows):
+            grouped.setdefault(row['location'].lower(), []).append((position, row))
+
+        self.partitions = {
+            location: LocationPartition(members, low_key, high_key, self.cuisine_bits, cuisines_key)
+            for location, members in grouped.items()
+        }
+
+    def search(
+        self,
+        location: Optional[str] = None,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        cuisines: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        if location:
+            partition = self.partitions.get(location.lower())
+            partitions: Iterable[LocationPartition] = (partition,) if partition else ()
+        else:
+            partitions = self.partitions.values()
+
+        positions: List[int] = []
+        for partition in partitions:
+            positions.extend(partition.query(min_value, max_value, cuisines, self.cuisine_bits))
+
+        positions.sort()
+        rows = self.rows
+        return [rows[position] for position in positions]
+
+
+def caterer_index(caterers: List[Dict[str, Any]]) -> ProviderIndex:
+    return ProviderIndex(caterers, 'min_guests', 'max_guests', 'supported_cuisines')
+
+
+def venue_index(venues: List[Dict[str, Any]]) -> ProviderIndex:
+    return ProviderIndex(venues, 'capacity_min', 'capacity_max')
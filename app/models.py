@@ -1,7 +1,28 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import date
 
+from app.config import PLAN_BATCH_MAX_REQUESTS, PLAN_MAX_PAGE_SIZE, AVAILABILITY_SEARCH_MAX_DAYS, SUPPORTED_CUISINES
+from app.locations import canonical_location
+
+
+def _canonical_location(v: str) -> str:
+    location = canonical_location(v)
+    if not location:
+        raise ValueError('location must not be blank')
+    return location
+
+
+_CUISINES = {cuisine.casefold(): cuisine for cuisine in SUPPORTED_CUISINES}
+
+
+def _canonical_cuisines(v: Optional[List[str]]) -> Optional[List[str]]:
+    """Supported cuisines in their stored spelling, which the searches
+    match exactly; others are only trimmed. The order is kept."""
+    if v is None:
+        return v
+    return [_CUISINES.get(cuisine.strip().casefold(), cuisine.strip()) for cuisine in v]
+
 
 class EventPlanRequest(BaseModel):
     event_date: str = Field(..., description="Event date in YYYY-MM-DD format")
@@ -12,6 +33,14 @@ class EventPlanRequest(BaseModel):
     event_type: Optional[str] = Field(default=None, description="Type of event")
     needs_event_room: bool = Field(default=False, description="Whether an event room is needed")
     special_requirements: Optional[str] = Field(default=None, description="Special dietary or other requirements")
+    rank_by_rating: bool = Field(default=False, description="List the highest-rated caterers and rooms first")
+    sort_by: Literal['name', 'cost'] = Field(default='name', description="Pick caterers and rooms by name or cheapest first")
+    limit: Optional[int] = Field(
+        default=None, ge=1, le=PLAN_MAX_PAGE_SIZE,
+        description="Page size: most caterers and most rooms to consider (default and maximum PLAN_MAX_PAGE_SIZE)"
+    )
+    offset: int = Field(default=0, ge=0, description="Caterers and rooms to skip, in sort_by order")
+    cursor: Optional[str] = Field(default=None, description="next_cursor of the previous page")
 
     @field_validator('event_date')
     @classmethod
@@ -22,6 +51,24 @@ class EventPlanRequest(BaseModel):
             raise ValueError('event_date must be in YYYY-MM-DD format')
         return v
 
+    @field_validator('location')
+    @classmethod
+    def validate_location(cls, v: str) -> str:
+        return _canonical_location(v)
+
+    @field_validator('cuisine_preferences')
+    @classmethod
+    def validate_cuisines(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        return _canonical_cuisines(v)
+
+    @model_validator(mode='after')
+    def validate_page(self) -> 'EventPlanRequest':
+        if self.cursor is not None and self.offset:
+            raise ValueError('cursor and offset cannot be combined; a cursor already marks where the page starts')
+        if self.rank_by_rating and (self.cursor is not None or self.offset):
+            raise ValueError('rank_by_rating orders the whole result and cannot be paged with cursor or offset')
+        return self
+
 
 class CostBreakdown(BaseModel):
     food_cost: float
@@ -38,6 +85,8 @@ class CateringProvider(BaseModel):
     cuisines: List[str]
     cost_breakdown: CostBreakdown
     notes: Optional[str] = None
+    average_rating: Optional[float] = None
+    review_count: int = 0
 
 
 class CuisineAnalysis(BaseModel):
@@ -67,6 +116,19 @@ class EventRoom(BaseModel):
     includes_catering: bool
     supported_cuisines_if_included: Optional[List[str]] = None
     estimated_combined_cost_with_cheapest_catering: Optional[float] = None
+    average_rating: Optional[float] = None
+    review_count: int = 0
+
+
+class VenueCatererCombination(BaseModel):
+    room_id: str
+    room_name: str
+    provider_id: str
+    provider_name: str
+    room_cost: float
+    catering_cost: float
+    total_cost: float
+    cost_per_guest: float
 
 
 class InputSummary(BaseModel):
@@ -81,7 +143,127 @@ class EventPlanResponse(BaseModel):
     input_summary: InputSummary
     catering_analysis: CateringAnalysis
     event_rooms: List[EventRoom]
+    recommended_combinations: List[VenueCatererCombination] = []
     summary_text: str
+    next_cursor: Optional[str] = None
+
+
+class BatchEventPlanRequest(BaseModel):
+    requests: List[EventPlanRequest] = Field(..., min_length=1, description="Planning requests to evaluate")
+
+    @field_validator('requests')
+    @classmethod
+    def validate_batch_size(cls, v: List[EventPlanRequest]) -> List[EventPlanRequest]:
+        if len(v) > PLAN_BATCH_MAX_REQUESTS:
+            raise ValueError(f'a batch may contain at most {PLAN_BATCH_MAX_REQUESTS} requests')
+        return v
+
+
+class BatchEventPlanResponse(BaseModel):
+    results: List[EventPlanResponse]
+
+
+class AvailabilitySearchRequest(BaseModel):
+    start_date: str = Field(..., description="First date of the search window (YYYY-MM-DD)")
+    end_date: str = Field(..., description="Last date of the search window (YYYY-MM-DD), inclusive")
+    location: str = Field(..., description="City or region for the event")
+    number_of_guests: int = Field(..., gt=0, description="Number of guests attending")
+    cuisine_preferences: Optional[List[str]] = Field(default=None, description="Preferred cuisines")
+    weekdays: Optional[List[int]] = Field(default=None, description="Only these weekdays (0=Monday ... 6=Sunday)")
+    needs_event_room: bool = Field(default=True, description="Whether an event room is needed")
+
+    @field_validator('start_date', 'end_date')
+    @classmethod
+    def validate_date(cls, v: str) -> str:
+        try:
+            date.fromisoformat(v)
+        except ValueError:
+            raise ValueError('dates must be in YYYY-MM-DD format')
+        return v
+
+    @field_validator('location')
+    @classmethod
+    def validate_location(cls, v: str) -> str:
+        return _canonical_location(v)
+
+    @field_validator('cuisine_preferences')
+    @classmethod
+    def validate_cuisines(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        return _canonical_cuisines(v)
+
+    @field_validator('weekdays')
+    @classmethod
+    def validate_weekdays(cls, v: Optional[List[int]]) -> Optional[List[int]]:
+        if v is not None and any(day < 0 or day > 6 for day in v):
+            raise ValueError('weekdays must be between 0 (Monday) and 6 (Sunday)')
+        return v
+
+    @model_validator(mode='after')
+    def validate_window(self) -> 'AvailabilitySearchRequest':
+        days = (date.fromisoformat(self.end_date) - date.fromisoformat(self.start_date)).days + 1
+        if days < 1:
+            raise ValueError('end_date must not be before start_date')
+        if days > AVAILABILITY_SEARCH_MAX_DAYS:
+            raise ValueError(f'the search window may span at most {AVAILABILITY_SEARCH_MAX_DAYS} days')
+        return self
+
+
+class ProviderSummary(BaseModel):
+    id: str
+    name: str
+
+
+class DateAvailability(BaseModel):
+    date: str
+    venues: List[ProviderSummary]
+    caterers: List[ProviderSummary]
+
+
+class AvailabilitySearchResponse(BaseModel):
+    location: str
+    number_of_guests: int
+    dates: List[DateAvailability]
+
+
+class BookingRequest(BaseModel):
+    client_id: str = Field(..., description="Booking client (users.id)")
+    venue_id: Optional[str] = Field(default=None, description="Venue to reserve")
+    caterer_id: Optional[str] = Field(default=None, description="Caterer to reserve")
+    event_date: str = Field(..., description="Event date in YYYY-MM-DD format")
+    number_of_guests: int = Field(..., gt=0, description="Number of guests attending")
+    event_type: Optional[str] = Field(default=None, description="Type of event")
+    cuisine_preferences: Optional[List[str]] = Field(default=None, description="Preferred cuisines")
+    special_requirements: Optional[str] = Field(default=None, description="Special dietary or other requirements")
+    venue_cost: Optional[float] = Field(default=None, ge=0)
+    catering_cost: Optional[float] = Field(default=None, ge=0)
+    total_cost: Optional[float] = Field(default=None, ge=0)
+
+    @field_validator('event_date')
+    @classmethod
+    def validate_date(cls, v: str) -> str:
+        try:
+            date.fromisoformat(v)
+        except ValueError:
+            raise ValueError('event_date must be in YYYY-MM-DD format')
+        return v
+
+    @model_validator(mode='after')
+    def validate_providers(self) -> 'BookingRequest':
+        if self.venue_id is None and self.caterer_id is None:
+            raise ValueError('a booking needs a venue_id, a caterer_id or both')
+        return self
+
+
+class BookingResponse(BaseModel):
+    id: str
+    booking_reference: str
+    client_id: str
+    venue_id: Optional[str] = None
+    caterer_id: Optional[str] = None
+    event_date: str
+    number_of_guests: int
+    status: str
+    total_cost: Optional[float] = None
 
 
 class CateringService(BaseModel):
@@ -0,0 +1,145 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.config import CURSOR_SECRET, DEFAULT_EVENT_DURATION_HOURS, PLAN_MAX_PAGE_SIZE
+from app.models import EventPlanRequest
+from app.services.pricing_service import price_event_rooms, round_cents, scalar_cost_breakdown
+
+CURSOR_VERSION = 2
+
+# Without CURSOR_SECRET each process signs with its own random key, so a
+# cursor only works against the worker that issued it.
+_CURSOR_KEY = CURSOR_SECRET.encode() if CURSOR_SECRET else os.urandom(32)
+
+# The two candidate lists a plan pages through independently.
+CATERERS = "caterers"
+ROOMS = "rooms"
+
+
+def page_size(request: EventPlanRequest) -> int:
+    return request.limit or PLAN_MAX_PAGE_SIZE
+
+
+def query_fingerprint(request: EventPlanRequest) -> str:
+    """Everything that decides which rows a page holds and their order,
+    so a cursor cannot be replayed against a different query."""
+    cuisines = sorted(c.lower() for c in request.cuisine_preferences) if request.cuisine_preferences else None
+    query = [
+        request.location.strip().lower(), request.number_of_guests, request.event_date, cuisines,
+        request.budget_per_guest, request.needs_event_room, request.sort_by, page_size(request)
+    ]
+    return hashlib.sha256(json.dumps(query).encode()).hexdigest()[:16]
+
+
+def _signature(request: EventPlanRequest, payload: str) -> str:
+    message = f"{query_fingerprint(request)}.{payload}".encode()
+    digest = hmac.new(_CURSOR_KEY, message, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def _after_key(request: EventPlanRequest, key: Any) -> Optional[List]:
+    """A decoded `(sort_cost, name, id)` key, checked before it reaches a
+    query parameter."""
+    if key is None:
+        return None
+    if not isinstance(key, list) or len(key) != 3:
+        raise ValueError("Malformed cursor")
+    cost, name, row_id = key
+    if not all(isinstance(part, str) for part in (name, row_id)) or not isinstance(cost, (str, type(None))):
+        raise ValueError("Malformed cursor")
+    try:
+        UUID(row_id)
+        parsed = Decimal(cost) if cost is not None else None
+    except (ValueError, InvalidOperation):
+        raise ValueError("Malformed cursor")
+    if (parsed is not None) != (request.sort_by == 'cost') or (parsed is not None and not parsed.is_finite()):
+        raise ValueError("Malformed cursor")
+    return key
+
+
+class PageCursor:
+    """Where the next page of a plan starts: the `(sort_cost, name, id)`
+    key of the last caterer and last room sent, or None for a list that is
+    exhausted. Clients get it as an opaque base64url token, signed with
+    CURSOR_SECRET together with the query it belongs to."""
+
+    def __init__(self, after: Dict[str, Optional[List]], first: bool = True):
+        self.after = after
+        self.first = first
+
+    @classmethod
+    def for_request(cls, request: EventPlanRequest) -> 'PageCursor':
+        if request.cursor is None:
+            return cls({CATERERS: None, ROOMS: None})
+        payload, _, signature = request.cursor.partition(".")
+        if not hmac.compare_digest(signature.encode(), _signature(request, payload).encode()):
+            raise ValueError("Cursor does not belong to this query; start again without one")
+        try:
+            state = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            version, after = state["v"], state["a"]
+        except (ValueError, binascii.Error, KeyError, TypeError):
+            raise ValueError("Malformed cursor")
+        if version != CURSOR_VERSION or not isinstance(after, dict):
+            raise ValueError("Malformed cursor")
+        return cls(
+            {CATERERS: _after_key(request, after.get(CATERERS)), ROOMS: _after_key(request, after.get(ROOMS))},
+            first=False
+        )
+
+    def exhausted(self, kind: str) -> bool:
+        return not self.first and self.after[kind] is None
+
+    def after_key(self, kind: str) -> Optional[Tuple]:
+        key = self.after[kind]
+        return tuple(key) if key is not None else None
+
+    def next_token(self, request: EventPlanRequest, after: Dict[str, Optional[List]]) -> Optional[str]:
+        if all(key is None for key in after.values()):
+            return None
+        state = {"v": CURSOR_VERSION, "a": after}
+        payload = base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+        return f"{payload}.{_signature(request, payload)}"
+
+
+def sort_key(row: Dict[str, Any], kind: str, request: EventPlanRequest) -> List:
+    """The `(sort_cost, name, id)` key of a row as the search statements
+    compare it; the cost is only kept when ordering by it. Rows from the
+    database carry `sort_cost`; rows from the catalog snapshot are priced
+    here the same way, rounded half away from zero like numeric ROUND."""
+    if request.sort_by != 'cost':
+        return [None, row['name'], str(row['id'])]
+    cost = row.get('sort_cost')
+    if cost is None:
+        if kind == CATERERS:
+            cost = scalar_cost_breakdown(row, request.number_of_guests)[3]
+        else:
+            cost = price_event_rooms([row], DEFAULT_EVENT_DURATION_HOURS).tolist()[0]
+    return [str(round_cents(cost)), row['name'], str(row['id'])]
+
+
+def candidate_query(request: EventPlanRequest, cursor: PageCursor, kind: str) -> Dict[str, Any]:
+    """Budget filter and page arguments for one candidate query. One row
+    past the page is asked for to learn whether another page follows."""
+    return {
+        "budget_per_guest": request.budget_per_guest,
+        "order_by": request.sort_by,
+        "limit": page_size(request) + 1,
+        "offset": request.offset,
+        "after": cursor.after_key(kind)
+    }
+
+
+def take_page(rows: List[Dict[str, Any]], request: EventPlanRequest, kind: str) -> Tuple[List[Dict[str, Any]], Optional[List]]:
+    """The page's rows and, when more follow, the key to continue after."""
+    size = page_size(request)
+    if len(rows) <= size:
+        return rows, None
+    page = rows[:size]
+    return page, sort_key(page[-1], kind, request)
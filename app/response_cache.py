@@ -0,0 +1,189 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Hashable
+
+from app.config import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_MAX_BYTES,
+    CATALOG_NOTIFY_CHANNEL,
+    AVAILABILITY_NOTIFY_CHANNEL
+)
+from app.database import NotificationListener
+from app.models import EventPlanRequest
+from app.responses import etag_for
+
+
+# Rough per-entry bookkeeping cost (key tuple, OrderedDict node, entry object).
+_ENTRY_OVERHEAD_BYTES = 512
+
+# How often a lookup may try to reconnect a dropped listener.
+_RECONNECT_INTERVAL_SECONDS = 5.0
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "expires_at")
+
+    def __init__(self, body: bytes, ttl: float):
+        self.body = body
+        self.etag = etag_for(body)
+        self.expires_at = time.monotonic() + ttl
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + _ENTRY_OVERHEAD_BYTES
+
+
+class PlanResponseCache:
+    """LRU + TTL cache of serialized /plan-event responses.
+
+    Entries are keyed on the canonicalized request. The whole cache is dropped
+    whenever the catalog or an availability calendar changes. While either
+    listener is down nothing is cached, and lookups try to reconnect it.
+    Each drop bumps `generation`, so a response built from data read before
+    a change is not stored after it.
+    """
+
+    _entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+    _bytes: int = 0
+    _listeners: Tuple[NotificationListener, ...] = ()
+    _next_reconnect: float = 0.0
+    generation: int = 0
+    ttl: float = RESPONSE_CACHE_TTL_SECONDS
+    max_entries: int = RESPONSE_CACHE_MAX_ENTRIES
+    max_bytes: int = RESPONSE_CACHE_MAX_BYTES
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return RESPONSE_CACHE_ENABLED
+
+    @staticmethod
+    def key_for(request: EventPlanRequest) -> Hashable:
+        """The request as `input_summary` echoes it, so a hit never answers
+        with another request's spelling. EventPlanRequest has already folded
+        the case of supported cities and cuisines; the cuisine order is
+        echoed, so it stays in the key."""
+        cuisines = tuple(request.cuisine_preferences) if request.cuisine_preferences else None
+        return (
+            request.location,
+            cuisines,
+            request.number_of_guests,
+            request.event_date,
+            request.needs_event_room,
+            request.budget_per_guest,
+            request.rank_by_rating,
+            request.sort_by,
+            request.limit,
+            request.offset,
+            request.cursor
+        )
+
+    @classmethod
+    def listening(cls) -> bool:
+        return bool(cls._listeners) and all(listener.listening for listener in cls._listeners)
+
+    @classmethod
+    async def _reconnect(cls) -> bool:
+        if cls.listening():
+            return True
+        now = time.monotonic()
+        if not cls._listeners or now < cls._next_reconnect:
+            return False
+        cls._next_reconnect = now + _RECONNECT_INTERVAL_SECONDS
+        for listener in cls._listeners:
+            await listener.ensure()
+        if not cls.listening():
+            return False
+        # Changes made while disconnected were never announced.
+        cls.invalidate()
+        return True
+
+    @classmethod
+    async def get(cls, key: Hashable) -> Optional[CachedResponse]:
+        if not await cls._reconnect():
+            cls.misses += 1
+            return None
+        entry = cls._entries.get(key)
+        if entry is None:
+            cls.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            cls._remove(key)
+            cls.misses += 1
+            return None
+        cls._entries.move_to_end(key)
+        cls.hits += 1
+        return entry
+
+    @classmethod
+    def put(cls, key: Hashable, body: bytes, generation: int) -> CachedResponse:
+        """Store `body` unless the cache was dropped since `generation` was
+        read, before the data behind it was fetched."""
+        entry = CachedResponse(body, cls.ttl)
+        if generation != cls.generation or not cls.listening() or entry.size > cls.max_bytes:
+            return entry
+
+        if key in cls._entries:
+            cls._remove(key)
+        cls._entries[key] = entry
+        cls._bytes += entry.size
+
+        while len(cls._entries) > cls.max_entries or cls._bytes > cls.max_bytes:
+            oldest = next(iter(cls._entries))
+            cls._remove(oldest)
+            cls.evictions += 1
+
+        return entry
+
+    @classmethod
+    def _remove(cls, key: Hashable) -> None:
+        entry = cls._entries.pop(key)
+        cls._bytes -= entry.size
+
+    @classmethod
+    def invalidate(cls, *args) -> None:
+        cls._entries.clear()
+        cls._bytes = 0
+        cls.generation += 1
+        cls.invalidations += 1
+
+    @classmethod
+    async def start(cls) -> None:
+        if not cls.enabled():
+            return
+        cls._listeners = tuple(
+            NotificationListener(channel, cls.invalidate, cls.invalidate)
+            for channel in (CATALOG_NOTIFY_CHANNEL, AVAILABILITY_NOTIFY_CHANNEL)
+        )
+        for listener in cls._listeners:
+            await listener.ensure()
+
+    @classmethod
+    async def stop(cls) -> None:
+        for listener in cls._listeners:
+            await listener.close()
+        cls._listeners = ()
+        cls.invalidate()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        lookups = cls.hits + cls.misses
+        return {
+            "enabled": cls.enabled(),
+            "entries": len(cls._entries),
+            "bytes": cls._bytes,
+            "max_entries": cls.max_entries,
+            "max_bytes": cls.max_bytes,
+            "ttl_seconds": cls.ttl,
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": round(cls.hits / lookups, 4) if lookups else 0.0,
+            "evictions": cls.evictions,
+            "invalidations": cls.invalidations,
+            "listening": cls.listening()
+        }
@@ -0,0 +1,55 @@
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelResponse(Response):
+    """JSON response for a model that was validated when it was built.
+
+    Routes still declare `response_model` for the OpenAPI schema, but
+    returning this response bypasses FastAPI's second validation pass and
+    its jsonable_encoder/json.dumps step: pydantic-core writes the JSON
+    bytes directly.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def conditional_response(body: bytes, etag: str, if_none_match: Optional[str] = None) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def frame_stream(frames: AsyncIterator[Dict[str, Any]], sse: bool = False) -> AsyncIterator[bytes]:
+    """Encodes frames as NDJSON lines, or as server-sent events named after
+    each frame's `type`. An error after the first frame can no longer change
+    the status code, so it is sent as a final `error` frame."""
+    try:
+        async for frame in frames:
+            data = json.dumps(frame, separators=(",", ":"))
+            yield (f"event: {frame['type']}\ndata: {data}\n\n" if sse else data + "\n").encode()
+    except Exception as e:
+        data = json.dumps({"type": "error", "detail": str(e)})
+        yield (f"event: error\ndata: {data}\n\n" if sse else data + "\n").encode()
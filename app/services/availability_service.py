@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+from typing import List, Dict
+
+from app.models import (
+    AvailabilitySearchRequest,
+    AvailabilitySearchResponse,
+    DateAvailability,
+    ProviderSummary
+)
+from app.availability import AvailabilityIndex, free_days_by_date, weekday_mask
+from app.services.catering_service import filter_catering_services
+from app.services.venue_service import filter_event_rooms
+from app.services.stages import run_stages
+
+
+def _summaries(providers: List[Dict]) -> List[ProviderSummary]:
+    return [ProviderSummary(id=str(p['id']), name=p['name']) for p in providers]
+
+
+async def search_availability(request: AvailabilitySearchRequest) -> AvailabilitySearchResponse:
+    start = date.fromisoformat(request.start_date)
+    days = (date.fromisoformat(request.end_date) - start).days + 1
+
+    stages = {
+        "catering": filter_catering_services(
+            location=request.location,
+            number_of_guests=request.number_of_guests,
+            cuisine_preferences=request.cuisine_preferences
+        ),
+        "calendar": AvailabilityIndex.get_bitmaps()
+    }
+    if request.needs_event_room:
+        stages["rooms"] = filter_event_rooms(
+            location=request.location,
+            number_of_guests=request.number_of_guests
+        )
+
+    results = await run_stages(stages)
+    bitmaps = results["calendar"]
+    day_mask = weekday_mask(start, days, request.weekdays)
+
+    caterers_by_day = free_days_by_date(bitmaps, 'caterer', results["catering"], start, days, day_mask)
+    venues_by_day = free_days_by_date(bitmaps, 'venue', results.get("rooms", []), start, days, day_mask)
+
+    dates = []
+    for offset in range(days):
+        if not day_mask >> offset & 1:
+            continue
+        dates.append(DateAvailability(
+            date=(start + timedelta(days=offset)).isoformat(),
+            venues=_summaries(venues_by_day.get(offset, [])),
+            caterers=_summaries(caterers_by_day.get(offset, []))
+        ))
+
+    return AvailabilitySearchResponse(
+        location=request.location,
+        number_of_guests=request.number_of_guests,
+        dates=dates
+    )
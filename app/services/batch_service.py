@@ -0,0 +1,155 @@
+from typing import List, Dict, Tuple, Optional, Set
+from datetime import date
+
+from app.models import EventPlanRequest
+from app.database import DatabaseService, as_date
+from app.catalog import CatalogCache
+from app.matching import ProviderIndex, caterer_index, venue_index
+from app.services.stages import run_stages
+from app.services.pricing_service import CateringPriceTable, price_catering_services
+from app.services.catering_service import select_caterers
+from app.services.venue_service import select_rooms
+from app.pagination import CATERERS, ROOMS, PageCursor, candidate_query
+from app.config import COMBINATION_TOP_K
+
+
+class LocationGroup:
+    """Candidates for every batch request that shares a location.
+
+    Caterers and venues are fetched once for the group's whole guest-count
+    range, and their calendars are checked for all of the group's dates in
+    one batched lookup. Each request is then narrowed in memory with the
+    same capacity/cuisine/availability semantics as the single-request SQL,
+    and every caterer is priced for all of the group's guest counts in one
+    pass.
+    """
+
+    def __init__(self, location: str, requests: List[EventPlanRequest]):
+        self.location = location
+        self.min_guests = min(r.number_of_guests for r in requests)
+        self.max_guests = max(r.number_of_guests for r in requests)
+        self.needs_rooms = any(r.needs_event_room for r in requests)
+        self.guest_counts = [r.number_of_guests for r in requests]
+        self.dates = sorted({as_date(r.event_date) for r in requests})
+        self.caterers: Optional[ProviderIndex] = None
+        self.venues: Optional[ProviderIndex] = None
+        self.price_table: Optional[CateringPriceTable] = None
+        self.unavailable_caterers: Set[Tuple[str, date]] = set()
+        self.unavailable_venues: Set[Tuple[str, date]] = set()
+
+    async def fetch_caterers(self) -> List[Dict]:
+        if CatalogCache.enabled():
+            snapshot = await CatalogCache.get_snapshot()
+            return snapshot.find_caterers(self.location, self.min_guests, self.max_guests)
+        return await DatabaseService.fetch_caterers(
+            location=self.location,
+            min_guests=self.min_guests,
+            max_guests=self.max_guests
+        )
+
+    async def fetch_venues(self) -> List[Dict]:
+        if CatalogCache.enabled():
+            snapshot = await CatalogCache.get_snapshot()
+            return snapshot.find_venues(self.location, self.min_guests, self.max_guests)
+        return await DatabaseService.fetch_venues(
+            location=self.location,
+            min_capacity=self.min_guests,
+            max_capacity=self.max_guests
+        )
+
+    def candidates_for(
+        self,
+        request: EventPlanRequest,
+        cursor: Optional[PageCursor] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """The request's caterers and rooms as the search statements would
+        return them, including the one row past the page that
+        `app.pagination.take_page` looks for."""
+        guests = request.number_of_guests
+        cursor = cursor or PageCursor.for_request(request)
+
+        caterers = []
+        if not cursor.exhausted(CATERERS):
+            caterers = select_caterers(
+                self.matching_caterers(request), guests, **candidate_query(request, cursor, CATERERS),
+                price_table=self.price_table
+            )
+        rooms = []
+        if request.needs_event_room and not cursor.exhausted(ROOMS):
+            rooms = select_rooms(self.matching_rooms(request), guests, **candidate_query(request, cursor, ROOMS))
+        return caterers, rooms
+
+    def cheapest_for(self, request: EventPlanRequest) -> Tuple[List[Dict], List[Dict]]:
+        """The COMBINATION_TOP_K cheapest caterers and catering-free rooms of
+        the request's whole filtered set, as `app.main.fetch_cheapest_*`
+        pick them from the database."""
+        if not request.needs_event_room or COMBINATION_TOP_K <= 0:
+            return [], []
+        guests = request.number_of_guests
+        caterers = select_caterers(
+            self.matching_caterers(request), guests, request.budget_per_guest, 'cost', COMBINATION_TOP_K,
+            price_table=self.price_table
+        )
+        rooms = select_rooms(
+            [room for room in self.matching_rooms(request) if not room['includes_catering']],
+            guests, request.budget_per_guest, 'cost', COMBINATION_TOP_K
+        )
+        return caterers, rooms
+
+    def matching_caterers(self, request: EventPlanRequest) -> List[Dict]:
+        guests = request.number_of_guests
+        event_date = as_date(request.event_date)
+        return [
+            c for c in self.caterers.search(None, guests, guests, request.cuisine_preferences)
+            if (str(c['id']), event_date) not in self.unavailable_caterers
+        ]
+
+    def matching_rooms(self, request: EventPlanRequest) -> List[Dict]:
+        if self.venues is None:
+            return []
+        guests = request.number_of_guests
+        event_date = as_date(request.event_date)
+        return [
+            v for v in self.venues.search(None, guests, guests)
+            if (str(v['id']), event_date) not in self.unavailable_venues
+        ]
+
+
+async def fetch_batch_candidates(requests: List[EventPlanRequest]) -> Dict[str, LocationGroup]:
+    grouped: Dict[str, List[EventPlanRequest]] = {}
+    for request in requests:
+        grouped.setdefault(request.location.lower(), []).append(request)
+
+    groups = {key: LocationGroup(members[0].location, members) for key, members in grouped.items()}
+
+    stages = {}
+    for key, group in groups.items():
+        stages[f"catering:{key}"] = group.fetch_caterers()
+        if group.needs_rooms:
+            stages[f"rooms:{key}"] = group.fetch_venues()
+
+    fetched = await run_stages(stages)
+
+    calendar_stages = {}
+    for key, group in groups.items():
+        caterers = fetched[f"catering:{key}"]
+        group.caterers = caterer_index(caterers)
+        group.price_table = price_catering_services(caterers, group.guest_counts)
+        calendar_stages[f"caterer_calendar:{key}"] = DatabaseService.fetch_unavailable_caterers(
+            [c['id'] for c in caterers], group.dates
+        )
+        if group.needs_rooms:
+            venues = fetched[f"rooms:{key}"]
+            group.venues = venue_index(venues)
+            calendar_stages[f"venue_calendar:{key}"] = DatabaseService.fetch_unavailable_venues(
+                [v['id'] for v in venues], group.dates
+            )
+
+    calendars = await run_stages(calendar_stages)
+
+    for key, group in groups.items():
+        group.unavailable_caterers = calendars[f"caterer_calendar:{key}"]
+        if group.needs_rooms:
+            group.unavailable_venues = calendars[f"venue_calendar:{key}"]
+
+    return groups
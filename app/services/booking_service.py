@@ -0,0 +1,111 @@
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+import asyncpg
+
+from app.config import BOOKING_IMPORT_BATCH_SIZE
+from app.database import DatabaseService, as_date
+from app.models import BookingRequest, BookingResponse
+
+
+def _uuid(value: Any, field: str) -> uuid.UUID:
+    try:
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    except ValueError:
+        raise ValueError(f"{field} must be a UUID")
+
+
+def _optional_uuid(value: Any, field: str) -> Optional[uuid.UUID]:
+    return _uuid(value, field) if value not in (None, '') else None
+
+
+def _optional_decimal(value: Any) -> Optional[Decimal]:
+    return Decimal(str(value)) if value not in (None, '') else None
+
+
+def _cuisines(value: Any) -> Optional[List[str]]:
+    if value in (None, ''):
+        return None
+    if isinstance(value, str):
+        return [cuisine.strip() for cuisine in value.split(';') if cuisine.strip()]
+    return list(value)
+
+
+def booking_response(row: Dict[str, Any]) -> BookingResponse:
+    return BookingResponse(
+        id=str(row['id']),
+        booking_reference=row['booking_reference'],
+        client_id=str(row['client_id']),
+        venue_id=str(row['venue_id']) if row['venue_id'] else None,
+        caterer_id=str(row['caterer_id']) if row['caterer_id'] else None,
+        event_date=row['event_date'].isoformat(),
+        number_of_guests=row['number_of_guests'],
+        status=row['status'],
+        total_cost=float(row['total_cost']) if row['total_cost'] is not None else None
+    )
+
+
+async def create_booking(request: BookingRequest) -> BookingResponse:
+    fields = request.model_dump()
+    fields['client_id'] = _uuid(request.client_id, 'client_id')
+    fields['venue_id'] = _optional_uuid(request.venue_id, 'venue_id')
+    fields['caterer_id'] = _optional_uuid(request.caterer_id, 'caterer_id')
+    for cost in ('venue_cost', 'catering_cost', 'total_cost'):
+        fields[cost] = _optional_decimal(fields[cost])
+    try:
+        row = await DatabaseService.create_booking(**fields)
+    except asyncpg.ForeignKeyViolationError:
+        raise ValueError("Unknown client, venue or caterer")
+    return booking_response(row)
+
+
+def import_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Typed `bookings` row from one record of the old system's export."""
+    return {
+        'id': uuid.uuid4(),
+        'client_id': _uuid(row['client_id'], 'client_id'),
+        'venue_id': _optional_uuid(row.get('venue_id'), 'venue_id'),
+        'caterer_id': _optional_uuid(row.get('caterer_id'), 'caterer_id'),
+        'event_date': as_date(row['event_date']),
+        'number_of_guests': int(row['number_of_guests']),
+        'event_type': row.get('event_type') or None,
+        'cuisine_preferences': _cuisines(row.get('cuisine_preferences')),
+        'special_requirements': row.get('special_requirements') or None,
+        'status': row.get('status') or 'pending',
+        'venue_cost': _optional_decimal(row.get('venue_cost')),
+        'catering_cost': _optional_decimal(row.get('catering_cost')),
+        'total_cost': _optional_decimal(row.get('total_cost'))
+    }
+
+
+async def import_bookings(
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = BOOKING_IMPORT_BATCH_SIZE
+) -> Dict[str, Any]:
+    """COPY bookings in batches of `batch_size`, one transaction per batch.
+
+    Conflicting rows are skipped and reported by their 0-based position in
+    `rows`.
+    """
+    imported = 0
+    conflicts: List[Dict[str, Any]] = []
+    offset = 0
+    batch: List[Dict[str, Any]] = []
+
+    async def flush() -> None:
+        nonlocal imported, offset
+        skipped = await DatabaseService.import_bookings(batch)
+        conflicts.extend({"row": offset + index, "kind": kind} for index, kind in skipped)
+        imported += len(batch) - len(skipped)
+        offset += len(batch)
+        batch.clear()
+
+    for row in rows:
+        batch.append(import_record(row))
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    return {"imported": imported, "conflicts": conflicts}
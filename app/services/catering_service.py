@@ -1,100 +1,171 @@
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from app.models import CostBreakdown, CateringProvider, CuisineAnalysis, CateringAnalysis
-from app.database import DatabaseService
+from app.database import DatabaseService, as_date
+from app.catalog import CatalogCache
+from app.services.combination_service import order_by_rating
+from app.services.pricing_service import (
+    BREAKDOWN_FIELDS,
+    CateringPriceTable,
+    scalar_cost_breakdown,
+    resolve_price_table,
+    select_candidates
+)
 
 
 async def filter_catering_services(
     location: str,
     number_of_guests: int,
-    cuisine_preferences: List[str] = None
+    cuisine_preferences: List[str] = None,
+    event_date: Optional[str] = None,
+    budget_per_guest: Optional[float] = None,
+    order_by: str = 'name',
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Tuple] = None
 ) -> List[Dict]:
+    if CatalogCache.enabled():
+        snapshot = await CatalogCache.get_snapshot()
+        caterers = snapshot.find_caterers(
+            location=location,
+            min_guests=number_of_guests,
+            max_guests=number_of_guests,
+            cuisines=cuisine_preferences
+        )
+        if event_date is not None and caterers:
+            unavailable = await DatabaseService.fetch_unavailable_caterers(
+                [c['id'] for c in caterers],
+                [event_date]
+            )
+            caterers = [c for c in caterers if (str(c['id']), as_date(event_date)) not in unavailable]
+        return select_caterers(caterers, number_of_guests, budget_per_guest, order_by, limit, offset, after)
+
     caterers = await DatabaseService.fetch_caterers(
         location=location,
         min_guests=number_of_guests,
         max_guests=number_of_guests,
-        cuisines=cuisine_preferences
+        cuisines=cuisine_preferences,
+        available_on=event_date,
+        number_of_guests=number_of_guests,
+        budget_per_guest=budget_per_guest,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        after=after
     )
     return caterers
 
 
+def select_caterers(
+    services: List[Dict],
+    number_of_guests: int,
+    budget_per_guest: Optional[float] = None,
+    order_by: str = 'name',
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Tuple] = None,
+    price_table: Optional[CateringPriceTable] = None
+) -> List[Dict]:
+    """Caterers within budget, in `order_by` order, cut to one page; the
+    same selection `DatabaseService.fetch_caterers` makes in SQL."""
+    if budget_per_guest is None and order_by == 'name' and limit is None and not offset and after is None:
+        return services
+    totals = per_guest = None
+    if budget_per_guest is not None or order_by == 'cost':
+        price_table = resolve_price_table(services, number_of_guests, price_table)
+        totals = price_table.totals(services, number_of_guests)
+        per_guest = price_table.per_guest(services, number_of_guests)
+    return select_candidates(
+        services, totals, number_of_guests, budget_per_guest, order_by, limit, offset, after, per_guest=per_guest
+    )
+
+
 def calculate_cost_breakdown(service: Dict, number_of_guests: int) -> CostBreakdown:
-    food_cost = service['base_price_per_guest'] * number_of_guests
-    service_fee = service['service_fee_flat']
-    tax = (food_cost + service_fee) * (service['tax_rate_percent'] / 100)
-    total_cost = food_cost + service_fee + tax
-    effective_cost_per_guest = total_cost / number_of_guests
-
-    return CostBreakdown(
-        food_cost=round(float(food_cost), 2),
-        service_fee=round(float(service_fee), 2),
-        tax=round(float(tax), 2),
-        total_cost=round(float(total_cost), 2),
-        effective_cost_per_guest=round(float(effective_cost_per_guest), 2)
+    return CostBreakdown(**dict(zip(
+        BREAKDOWN_FIELDS,
+        scalar_cost_breakdown(service, number_of_guests)
+    )))
+
+
+def build_catering_provider(service: Dict, cost_breakdown: CostBreakdown) -> CateringProvider:
+    return CateringProvider(
+        provider_id=str(service['id']),
+        provider_name=service['name'],
+        location=service['location'],
+        cuisines=service['supported_cuisines'],
+        cost_breakdown=cost_breakdown,
+        notes=service.get('notes'),
+        average_rating=service.get('average_rating'),
+        review_count=service.get('review_count') or 0
     )
 
 
+def preference_set(cuisine_preferences: Optional[List[str]] = None) -> Optional[FrozenSet[str]]:
+    """Cuisine preferences lowercased once per request; None when there
+    are none."""
+    if not cuisine_preferences:
+        return None
+    return frozenset(pref.lower() for pref in cuisine_preferences)
+
+
+def listed_cuisines(service: Dict, preferences: Optional[FrozenSet[str]] = None) -> List[str]:
+    """The cuisines a provider is listed under: its preferred ones, or all
+    of them when there are no preferences. Takes `preference_set(...)`."""
+    if preferences is None:
+        return list(service['supported_cuisines'])
+    return [cuisine for cuisine in service['supported_cuisines'] if cuisine.lower() in preferences]
+
+
+def group_by_cuisine(services: List[Dict], preferences: Optional[FrozenSet[str]] = None) -> Dict[str, List[int]]:
+    """Positions in `services` of the providers listed under each cuisine,
+    in one pass over their cuisines. Only preferred cuisines are kept, unless
+    no provider offers one: then every cuisine is, from the same groups."""
+    groups: Dict[str, List[int]] = {}
+    for position, service in enumerate(services):
+        for cuisine in service['supported_cuisines']:
+            members = groups.get(cuisine)
+            if members is None:
+                members = groups[cuisine] = []
+            members.append(position)
+
+    if preferences is None:
+        return groups
+    preferred = {cuisine: members for cuisine, members in groups.items() if cuisine.lower() in preferences}
+    return preferred or groups
+
+
 async def build_catering_analysis(
     services: List[Dict],
     number_of_guests: int,
-    cuisine_preferences: List[str] = None
+    cuisine_preferences: List[str] = None,
+    price_table: Optional[CateringPriceTable] = None,
+    rank_by_rating: bool = False
 ) -> CateringAnalysis:
-    cuisine_map: Dict[str, List[CateringProvider]] = {}
-
-    for service in services:
-        cost_breakdown = calculate_cost_breakdown(service, number_of_guests)
-
-        provider = CateringProvider(
-            provider_id=str(service['id']),
-            provider_name=service['name'],
-            location=service['location'],
-            cuisines=service['supported_cuisines'],
-            cost_breakdown=cost_breakdown,
-            notes=service.get('notes')
-        )
+    price_table = resolve_price_table(services, number_of_guests, price_table)
+    groups = group_by_cuisine(services, preference_set(cuisine_preferences))
 
-        for cuisine in service['supported_cuisines']:
-            if cuisine_preferences:
-                if not any(pref.lower() == cuisine.lower() for pref in cuisine_preferences):
-                    continue
-
-            if cuisine not in cuisine_map:
-                cuisine_map[cuisine] = []
-            cuisine_map[cuisine].append(provider)
-
-    if not cuisine_map and services:
-        for service in services:
-            cost_breakdown = calculate_cost_breakdown(service, number_of_guests)
-            provider = CateringProvider(
-                provider_id=str(service['id']),
-                provider_name=service['name'],
-                location=service['location'],
-                cuisines=service['supported_cuisines'],
-                cost_breakdown=cost_breakdown,
-                notes=service.get('notes')
-            )
-            for cuisine in service['supported_cuisines']:
-                if cuisine not in cuisine_map:
-                    cuisine_map[cuisine] = []
-                cuisine_map[cuisine].append(provider)
-
-    by_cuisine = [
-        CuisineAnalysis(cuisine=cuisine, providers=providers)
-        for cuisine, providers in cuisine_map.items()
+    providers = [
+        build_catering_provider(service, price_table.breakdown(service, number_of_guests))
+        for service in services
     ]
 
-    by_cuisine.sort(key=lambda x: x.cuisine)
+    by_cuisine = []
+    for cuisine in sorted(groups):
+        members = [providers[position] for position in groups[cuisine]]
+        by_cuisine.append(CuisineAnalysis(
+            cuisine=cuisine,
+            providers=order_by_rating(members) if rank_by_rating else members
+        ))
 
     return CateringAnalysis(by_cuisine=by_cuisine)
 
 
-async def get_cheapest_catering_cost(services: List[Dict], number_of_guests: int) -> float:
+async def get_cheapest_catering_cost(
+    services: List[Dict],
+    number_of_guests: int,
+    price_table: Optional[CateringPriceTable] = None
+) -> float:
     if not services:
         return 0.0
 
-    min_cost = float('inf')
-    for service in services:
-        breakdown = calculate_cost_breakdown(service, number_of_guests)
-        if breakdown.total_cost < min_cost:
-            min_cost = breakdown.total_cost
-
-    return min_cost
+    price_table = resolve_price_table(services, number_of_guests, price_table)
+    return price_table.cheapest_total(services, number_of_guests)
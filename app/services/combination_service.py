@@ -0,0 +1,107 @@
+import heapq
+from bisect import bisect_right
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from app.models import EventRoom, VenueCatererCombination
+from app.config import COMBINATION_TOP_K
+from app.services.pricing_service import CateringPriceTable, budget_total, round_cents
+
+
+def order_by_rating(items: List) -> List:
+    """Highest average rating first, more reviews breaking ties. Unrated
+    items keep their relative order after the rated ones."""
+    return sorted(
+        items,
+        key=lambda item: (item.average_rating is None, -(item.average_rating or 0.0), -item.review_count)
+    )
+
+
+def _serves_preferred_cuisine(service: Dict, preferences: set) -> bool:
+    return any(cuisine.lower() in preferences for cuisine in service['supported_cuisines'])
+
+
+def _cents(cost: float) -> float:
+    return float(round_cents(cost))
+
+
+def rank_combinations(
+    event_rooms: List[EventRoom],
+    services: List[Dict],
+    price_table: CateringPriceTable,
+    number_of_guests: int,
+    cuisine_preferences: Optional[List[str]] = None,
+    budget_per_guest: Optional[float] = None,
+    top_k: int = COMBINATION_TOP_K
+) -> List[VenueCatererCombination]:
+    """Cheapest (room, caterer) pairs under the cuisine and budget limits.
+
+    Rooms and caterers are each sorted by cost, and pairs are drawn from a
+    frontier heap in increasing total cost. The search stops after `top_k`
+    pairs or at the first pair over budget, so it never builds the full
+    cross product.
+    """
+    if top_k <= 0:
+        return []
+
+    rooms = sorted(
+        (room for room in event_rooms if not room.includes_catering),
+        key=lambda room: room.pricing.estimated_room_total_cost
+    )
+
+    if cuisine_preferences:
+        preferences = {pref.lower() for pref in cuisine_preferences}
+        services = [s for s in services if _serves_preferred_cuisine(s, preferences)]
+
+    if not rooms or not services:
+        return []
+
+    catering_totals = price_table.totals(services, number_of_guests)
+    order = np.argsort(catering_totals, kind='stable')
+    catering_costs = catering_totals[order].tolist()
+    caterers = [services[j] for j in order]
+    room_costs = [room.pricing.estimated_room_total_cost for room in rooms]
+
+    limit = float('inf')
+    if budget_per_guest is not None:
+        # Pair totals are compared in cents, like the search statements'
+        # budget filter, so a pair costing exactly the budget stays in.
+        limit = budget_total(budget_per_guest, number_of_guests)
+        # Neither side can exceed the limit minus the other side's cheapest cost.
+        rooms = rooms[:bisect_right(room_costs, limit, key=lambda cost: _cents(cost + catering_costs[0]))]
+        room_costs = room_costs[:len(rooms)]
+        if not rooms:
+            return []
+        cutoff = bisect_right(catering_costs, limit, key=lambda cost: _cents(cost + room_costs[0]))
+        caterers, catering_costs = caterers[:cutoff], catering_costs[:cutoff]
+        if not caterers:
+            return []
+
+    frontier = [(room_costs[0] + catering_costs[0], 0, 0)]
+    seen = {(0, 0)}
+    combinations = []
+
+    while frontier and len(combinations) < top_k:
+        total, i, j = heapq.heappop(frontier)
+        if _cents(total) > limit:
+            break
+
+        total_cost = round(room_costs[i] + catering_costs[j], 2)
+        combinations.append(VenueCatererCombination(
+            room_id=rooms[i].room_id,
+            room_name=rooms[i].room_name,
+            provider_id=str(caterers[j]['id']),
+            provider_name=caterers[j]['name'],
+            room_cost=room_costs[i],
+            catering_cost=catering_costs[j],
+            total_cost=total_cost,
+            cost_per_guest=round(total_cost / number_of_guests, 2)
+        ))
+
+        for ni, nj in ((i + 1, j), (i, j + 1)):
+            if ni < len(rooms) and nj < len(caterers) and (ni, nj) not in seen:
+                seen.add((ni, nj))
+                heapq.heappush(frontier, (room_costs[ni] + catering_costs[nj], ni, nj))
+
+    return combinations
@@ -0,0 +1,196 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import List, Dict, Iterable, Tuple, Optional
+
+import numpy as np
+
+from app.models import CostBreakdown
+from app.config import DEFAULT_EVENT_DURATION_HOURS
+
+
+# Values whose cent fraction lies this close to .5 are re-rounded with the
+# scalar path so results match `round_cents` bit for bit.
+_TIE_TOLERANCE = 1e-6
+_CENT = Decimal('0.01')
+
+BREAKDOWN_FIELDS = ('food_cost', 'service_fee', 'tax', 'total_cost', 'effective_cost_per_guest')
+
+
+def _round_cents(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    scaled = values * 100
+    rounded = np.rint(scaled) / 100
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE
+    return rounded, ambiguous
+
+
+def _column(rows: List[Dict], key: str) -> np.ndarray:
+    return np.fromiter((float(row[key] or 0) for row in rows), dtype=np.float64, count=len(rows))
+
+
+def round_cents(value) -> Decimal:
+    """`value` rounded to cents half away from zero, as the search
+    statements' numeric ROUND does. Floats are taken at their shortest
+    decimal spelling."""
+    if not isinstance(value, Decimal):
+        value = Decimal(repr(float(value)))
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def budget_total(budget_per_guest: float, number_of_guests: int) -> float:
+    """The budget for all guests as the search statements compute it
+    (`$n::float8::numeric * guests`)."""
+    return float(Decimal(repr(budget_per_guest)) * number_of_guests)
+
+
+def scalar_cost_breakdown(service: Dict, number_of_guests: int) -> Tuple[float, ...]:
+    food_cost = service['base_price_per_guest'] * number_of_guests
+    service_fee = service['service_fee_flat']
+    tax = (food_cost + service_fee) * (service['tax_rate_percent'] / 100)
+    total_cost = food_cost + service_fee + tax
+    effective_cost_per_guest = total_cost / number_of_guests
+    return tuple(
+        float(round_cents(value))
+        for value in (food_cost, service_fee, tax, total_cost, effective_cost_per_guest)
+    )
+
+
+def scalar_room_cost(room: Dict, duration_hours: int = DEFAULT_EVENT_DURATION_HOURS) -> float:
+    return float(round_cents(room['base_room_rental_fee'] + (room.get('hourly_rate') or 0) * duration_hours))
+
+
+class CateringPriceTable:
+    """Cost breakdowns for a set of caterers at one or more guest counts.
+
+    All columns are computed in a single vectorized pass with shape
+    `(len(guest_counts), len(services))`; `CostBreakdown` models are built
+    lazily and memoized, so each provider is priced once per guest count.
+    """
+
+    def __init__(self, services: List[Dict], guest_counts: Iterable[int]):
+        self.services = services
+        self.guest_counts = list(dict.fromkeys(guest_counts))
+        self._rows = {n: i for i, n in enumerate(self.guest_counts)}
+        self._columns = {service['id']: j for j, service in enumerate(services)}
+        self._models: Dict[Tuple[int, int], CostBreakdown] = {}
+        self._row_values: Dict[int, List[List[float]]] = {}
+
+        guests = np.asarray(self.guest_counts, dtype=np.float64).reshape(-1, 1)
+        price = _column(services, 'base_price_per_guest')
+        fee = np.broadcast_to(_column(services, 'service_fee_flat'), (len(self.guest_counts), len(services)))
+        rate = _column(services, 'tax_rate_percent')
+
+        food_cost = price * guests
+        tax = (food_cost + fee) * (rate / 100)
+        total_cost = food_cost + fee + tax
+        effective_cost_per_guest = total_cost / guests
+
+        ambiguous = np.zeros(food_cost.shape, dtype=bool)
+        columns = []
+        for raw in (food_cost, fee, tax, total_cost, effective_cost_per_guest):
+            rounded, ties = _round_cents(raw)
+            columns.append(rounded)
+            ambiguous |= ties
+
+        for i, j in zip(*np.nonzero(ambiguous)):
+            exact = scalar_cost_breakdown(services[j], self.guest_counts[i])
+            for column, value in zip(columns, exact):
+                column[i, j] = value
+
+        (self.food_cost, self.service_fee, self.tax,
+         self.total_cost, self.effective_cost_per_guest) = columns
+        self._stacked = np.stack(columns, axis=-1)
+
+    def breakdown(self, service: Dict, number_of_guests: int) -> CostBreakdown:
+        row = self._rows[number_of_guests]
+        key = (row, self._columns[service['id']])
+        model = self._models.get(key)
+        if model is None:
+            values = self._row_values.get(row)
+            if values is None:
+                values = self._row_values[row] = self._stacked[row].tolist()
+            model = CostBreakdown(**dict(zip(BREAKDOWN_FIELDS, values[key[1]])))
+            self._models[key] = model
+        return model
+
+    def totals(self, services: List[Dict], number_of_guests: int) -> np.ndarray:
+        columns = [self._columns[service['id']] for service in services]
+        return self.total_cost[self._rows[number_of_guests], columns]
+
+    def per_guest(self, services: List[Dict], number_of_guests: int) -> np.ndarray:
+        columns = [self._columns[service['id']] for service in services]
+        return self.effective_cost_per_guest[self._rows[number_of_guests], columns]
+
+    def cheapest_total(self, services: List[Dict], number_of_guests: int) -> float:
+        if not services:
+            return 0.0
+        return float(self.totals(services, number_of_guests).min())
+
+    def covers(self, services: List[Dict], number_of_guests: int) -> bool:
+        return number_of_guests in self._rows and all(
+            service['id'] in self._columns for service in services
+        )
+
+
+def price_catering_services(
+    services: List[Dict],
+    guest_counts: Iterable[int]
+) -> CateringPriceTable:
+    return CateringPriceTable(services, guest_counts)
+
+
+def price_event_rooms(
+    rooms: List[Dict],
+    duration_hours: int = DEFAULT_EVENT_DURATION_HOURS
+) -> np.ndarray:
+    raw = _column(rooms, 'base_room_rental_fee') + _column(rooms, 'hourly_rate') * duration_hours
+    rounded, ambiguous = _round_cents(raw)
+    for j in np.nonzero(ambiguous)[0]:
+        rounded[j] = scalar_room_cost(rooms[j], duration_hours)
+    return rounded
+
+
+def select_candidates(
+    rows: List[Dict],
+    totals: Optional[np.ndarray],
+    number_of_guests: int,
+    budget_per_guest: Optional[float] = None,
+    order_by: str = 'name',
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Tuple] = None,
+    per_guest: Optional[np.ndarray] = None
+) -> List[Dict]:
+    """The in-memory counterpart of the search statements' budget filter and
+    page, for rows already in (name, id) order with their rounded `totals`.
+    `totals` may be None when there is no budget and the order is by name.
+    With rounded `per_guest` costs the budget applies to those, as shown in
+    a cost breakdown; otherwise to the totals. `after` is the
+    `(sort_cost, name, id)` key the page continues from."""
+    indices = np.arange(len(rows))
+    if budget_per_guest is not None:
+        if per_guest is not None:
+            indices = indices[per_guest <= budget_per_guest]
+        else:
+            indices = indices[totals <= budget_total(budget_per_guest, number_of_guests)]
+    if order_by == 'cost':
+        indices = indices[np.argsort(totals[indices], kind='stable')]
+    if after is not None:
+        after_cost, after_name, after_id = after
+        if order_by == 'cost':
+            key = (float(after_cost), after_name, after_id)
+            indices = indices[[(totals[i], rows[i]['name'], str(rows[i]['id'])) > key for i in indices.tolist()]]
+        else:
+            key = (after_name, after_id)
+            indices = indices[[(rows[i]['name'], str(rows[i]['id'])) > key for i in indices.tolist()]]
+    start = offset or 0
+    end = None if limit is None else start + limit
+    return [rows[i] for i in indices[start:end].tolist()]
+
+
+def resolve_price_table(
+    services: List[Dict],
+    number_of_guests: int,
+    price_table: Optional[CateringPriceTable]
+) -> CateringPriceTable:
+    if price_table is not None and price_table.covers(services, number_of_guests):
+        return price_table
+    return price_catering_services(services, [number_of_guests])
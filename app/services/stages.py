@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Dict, Optional
+
+from app.config import PLANNING_STAGE_TIMEOUT_SECONDS
+from app.tracing import stage_span
+
+
+class StageTimeoutError(Exception):
+    def __init__(self, stage: str, timeout: float):
+        super().__init__(f"Planning stage '{stage}' timed out after {timeout:g}s")
+        self.stage = stage
+        self.timeout = timeout
+
+
+async def _run_stage(name: str, awaitable: Awaitable, timeout: Optional[float]) -> Any:
+    """Only the stage's own deadline becomes a StageTimeoutError; a timeout
+    raised inside the stage (e.g. waiting for a pooled connection)
+    propagates as it is."""
+    deadline = asyncio.timeout(timeout)
+    try:
+        with stage_span(name):
+            async with deadline:
+                return await awaitable
+    except TimeoutError:
+        if deadline.expired():
+            raise StageTimeoutError(name, timeout)
+        raise
+
+
+async def run_stages(
+    stages: Dict[str, Awaitable],
+    timeout: Optional[float] = PLANNING_STAGE_TIMEOUT_SECONDS
+) -> Dict[str, Any]:
+    if timeout is not None and timeout <= 0:
+        timeout = None
+
+    tasks = {
+        name: asyncio.ensure_future(_run_stage(name, awaitable, timeout))
+        for name, awaitable in stages.items()
+    }
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return {name: task.result() for name, task in tasks.items()}
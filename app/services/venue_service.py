@@ -1,21 +1,72 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from app.models import EventRoom, RoomPricing
 from app.config import DEFAULT_EVENT_DURATION_HOURS
-from app.database import DatabaseService
+from app.database import DatabaseService, as_date
+from app.catalog import CatalogCache
+from app.services.pricing_service import price_event_rooms, select_candidates
+from app.services.combination_service import order_by_rating
 
 
 async def filter_event_rooms(
     location: str,
-    number_of_guests: int
+    number_of_guests: int,
+    event_date: Optional[str] = None,
+    budget_per_guest: Optional[float] = None,
+    order_by: str = 'name',
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Tuple] = None
 ) -> List[Dict]:
+    if CatalogCache.enabled():
+        snapshot = await CatalogCache.get_snapshot()
+        venues = snapshot.find_venues(
+            location=location,
+            min_capacity=number_of_guests,
+            max_capacity=number_of_guests
+        )
+        if event_date is not None and venues:
+            unavailable = await DatabaseService.fetch_unavailable_venues(
+                [v['id'] for v in venues],
+                [event_date]
+            )
+            venues = [v for v in venues if (str(v['id']), as_date(event_date)) not in unavailable]
+        return select_rooms(venues, number_of_guests, budget_per_guest, order_by, limit, offset, after)
+
     venues = await DatabaseService.fetch_venues(
         location=location,
         min_capacity=number_of_guests,
-        max_capacity=number_of_guests
+        max_capacity=number_of_guests,
+        available_on=event_date,
+        number_of_guests=number_of_guests,
+        budget_per_guest=budget_per_guest,
+        order_by=order_by,
+        limit=limit,
+        offset=offset,
+        after=after
     )
     return venues
 
 
+def select_rooms(
+    rooms: List[Dict],
+    number_of_guests: int,
+    budget_per_guest: Optional[float] = None,
+    order_by: str = 'name',
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Tuple] = None,
+    duration_hours: int = DEFAULT_EVENT_DURATION_HOURS
+) -> List[Dict]:
+    """Rooms within budget, in `order_by` order, cut to one page; the same
+    selection `DatabaseService.fetch_venues` makes in SQL."""
+    if budget_per_guest is None and order_by == 'name' and limit is None and not offset and after is None:
+        return rooms
+    totals = None
+    if budget_per_guest is not None or order_by == 'cost':
+        totals = price_event_rooms(rooms, duration_hours)
+    return select_candidates(rooms, totals, number_of_guests, budget_per_guest, order_by, limit, offset, after)
+
+
 def calculate_room_cost(room: Dict, duration_hours: int = DEFAULT_EVENT_DURATION_HOURS) -> float:
     base_cost = room['base_room_rental_fee']
 
@@ -26,42 +77,55 @@ def calculate_room_cost(room: Dict, duration_hours: int = DEFAULT_EVENT_DURATION
     return float(base_cost)
 
 
-async def build_event_room_response(
-    rooms: List[Dict],
+def build_event_room(
+    room: Dict,
+    room_total_cost: float,
     cheapest_catering_cost: float,
     duration_hours: int = DEFAULT_EVENT_DURATION_HOURS
-) -> List[EventRoom]:
-    event_rooms = []
+) -> EventRoom:
+    pricing = RoomPricing(
+        base_room_rental_fee=float(room['base_room_rental_fee']),
+        hourly_rate=float(room['hourly_rate']) if room.get('hourly_rate') else None,
+        assumed_hours=duration_hours,
+        estimated_room_total_cost=room_total_cost
+    )
 
-    for room in rooms:
-        room_total_cost = calculate_room_cost(room, duration_hours)
+    combined_cost = None
+    if not room['includes_catering'] and cheapest_catering_cost > 0:
+        combined_cost = round(room_total_cost + cheapest_catering_cost, 2)
 
-        pricing = RoomPricing(
-            base_room_rental_fee=float(room['base_room_rental_fee']),
-            hourly_rate=float(room['hourly_rate']) if room.get('hourly_rate') else None,
-            assumed_hours=duration_hours,
-            estimated_room_total_cost=round(room_total_cost, 2)
-        )
+    return EventRoom(
+        room_id=str(room['id']),
+        room_name=room['name'],
+        location=room['location'],
+        capacity_min=room['capacity_min'],
+        capacity_max=room['capacity_max'],
+        amenities=room['amenities'],
+        pricing=pricing,
+        includes_catering=room['includes_catering'],
+        supported_cuisines_if_included=room.get('supported_cuisines_if_included'),
+        estimated_combined_cost_with_cheapest_catering=combined_cost,
+        average_rating=room.get('average_rating'),
+        review_count=room.get('review_count') or 0
+    )
 
-        combined_cost = None
-        if not room['includes_catering'] and cheapest_catering_cost > 0:
-            combined_cost = round(room_total_cost + cheapest_catering_cost, 2)
-
-        event_room = EventRoom(
-            room_id=str(room['id']),
-            room_name=room['name'],
-            location=room['location'],
-            capacity_min=room['capacity_min'],
-            capacity_max=room['capacity_max'],
-            amenities=room['amenities'],
-            pricing=pricing,
-            includes_catering=room['includes_catering'],
-            supported_cuisines_if_included=room.get('supported_cuisines_if_included'),
-            estimated_combined_cost_with_cheapest_catering=combined_cost
-        )
 
-        event_rooms.append(event_room)
+async def build_event_room_response(
+    rooms: List[Dict],
+    cheapest_catering_cost: float,
+    duration_hours: int = DEFAULT_EVENT_DURATION_HOURS,
+    rank_by_rating: bool = False
+) -> List[EventRoom]:
+    """Rooms in the order given, which for a page is its cursor order, or
+    highest rated first."""
+    room_totals = price_event_rooms(rooms, duration_hours)
+    event_rooms = [
+        build_event_room(room, room_total_cost, cheapest_catering_cost, duration_hours)
+        for room, room_total_cost in zip(rooms, room_totals.tolist())
+    ]
 
-    event_rooms.sort(key=lambda x: x.pricing.estimated_room_total_cost)
+    if rank_by_rating:
+        # Stable, so equally rated rooms keep the page order.
+        event_rooms = order_by_rating(event_rooms)
 
     return event_rooms
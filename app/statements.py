@@ -0,0 +1,303 @@
+import time
+from typing import Dict, Any
+
+import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
+
+
+_VENUE_COLUMNS = """
+    id, name, location, address, capacity_min, capacity_max,
+    base_room_rental_fee, hourly_rate, includes_catering,
+    supported_cuisines_if_included, amenities, description,
+    contact_email, contact_phone, is_active
+"""
+
+# Joined from the trigger-maintained stats tables, so rating comes with the
+# search row instead of aggregating bookings and reviews per request.
+_STATS_COLUMNS = """
+    COALESCE(s.booking_count, 0) AS booking_count,
+    (s.rating_sum::float8 / NULLIF(s.rating_count, 0)) AS average_rating,
+    COALESCE(s.rating_count, 0) AS review_count
+"""
+
+_CATERER_COLUMNS = """
+    id, name, location, address, supported_cuisines,
+    base_price_per_guest, service_fee_flat, tax_rate_percent,
+    min_guests, max_guests, notes, contact_email, contact_phone,
+    is_active
+"""
+
+# Both searches price each row for the request (`priced.total_cost`, rounded
+# half away from zero to cents like `pricing_service.round_cents`) so
+# over-budget providers are dropped and a cost-ordered page is cut in the
+# database. Caterers are held to the budget by their rounded cost per guest,
+# the figure a cost breakdown shows; rooms by their total. The guest count
+# is a parameter, so the cost cannot come from an index. The cost is
+# returned as `sort_cost` for building continuation cursors.
+#
+# Pages continue after the (cost, name, id) or (name, id) key in $10-$12.
+# Names compare byte-wise (COLLATE "C") so that the in-memory paths, which
+# compare Python strings, see the same order.
+_AFTER_KEY = """
+      AND ($10::text IS NULL OR CASE WHEN $7::bool
+          THEN (priced.total_cost, name COLLATE "C", id) > ($12::numeric, $10::text COLLATE "C", $11::uuid)
+          ELSE (name COLLATE "C", id) > ($10::text COLLATE "C", $11::uuid)
+      END)
+"""
+
+# A search filters on one location or on none, in separate statements: a
+# prepared statement moves to a generic plan after five executions, and
+# `$1 IS NULL OR LOWER(location) = ...` cannot use the location index in a
+# plan made without the value of $1.
+_LOCATED = """
+      AND LOWER(location) = LOWER($1::text)
+"""
+
+_ANYWHERE = """
+      AND $1::text IS NULL
+"""
+
+_VENUE_FROM = f"""
+    SELECT {_VENUE_COLUMNS}, {_STATS_COLUMNS}, priced.total_cost AS sort_cost
+    FROM venues
+    LEFT JOIN venue_stats s ON s.venue_id = venues.id
+    CROSS JOIN LATERAL (
+        SELECT ROUND(base_room_rental_fee + COALESCE(hourly_rate, 0) * $5::int, 2) AS total_cost
+    ) priced
+    WHERE is_active = TRUE
+"""
+
+_VENUE_FILTERS = """
+      AND ($2::int IS NULL OR capacity_max >= $2::int)
+      AND ($3::int IS NULL OR capacity_min <= $3::int)
+      AND ($6::float8 IS NULL OR priced.total_cost <= $6::float8::numeric * $4::int)
+""" + _AFTER_KEY
+
+_CATERER_FROM = f"""
+    SELECT {_CATERER_COLUMNS}, {_STATS_COLUMNS}, priced.total_cost AS sort_cost
+    FROM caterers
+    LEFT JOIN caterer_stats s ON s.caterer_id = caterers.id
+    CROSS JOIN LATERAL (
+        SELECT (base_price_per_guest * $5::int + COALESCE(service_fee_flat, 0))
+            * (1 + COALESCE(tax_rate_percent, 0) / 100) AS cost
+    ) raw
+    CROSS JOIN LATERAL (
+        SELECT ROUND(raw.cost, 2) AS total_cost, ROUND(raw.cost / $5::int, 2) AS cost_per_guest
+    ) priced
+    WHERE is_active = TRUE
+"""
+
+_CATERER_FILTERS = """
+      AND ($2::int IS NULL OR max_guests >= $2::int)
+      AND ($3::int IS NULL OR min_guests <= $3::int)
+      AND ($4::text[] IS NULL OR supported_cuisines && $4::text[])
+      AND ($6::float8 IS NULL OR priced.cost_per_guest <= $6::float8::numeric)
+""" + _AFTER_KEY
+
+# Cheapest first when $7 is set, by name otherwise; id breaks ties so pages
+# are stable. A NULL limit returns every row.
+_SEARCH_PAGE = """
+    ORDER BY CASE WHEN $7::bool THEN priced.total_cost END, name COLLATE "C", id
+    LIMIT $8::bigint OFFSET $9::bigint
+"""
+
+# The date filter is an anti-join rather than `$n IS NULL OR NOT EXISTS`, so
+# it gets its own variant and the planner can still use the partial index.
+_VENUE_UNAVAILABLE = """
+      AND NOT EXISTS (
+          SELECT 1 FROM venue_availability va
+          WHERE va.venue_id = venues.id
+            AND va.date = $13::date
+            AND va.is_available = FALSE
+      )
+"""
+
+_CATERER_UNAVAILABLE = """
+      AND NOT EXISTS (
+          SELECT 1 FROM caterer_availability ca
+          WHERE ca.caterer_id = caterers.id
+            AND ca.date = $13::date
+            AND ca.is_available = FALSE
+      )
+"""
+
+
+def _search_variants(name: str, head: str, filters: str, unavailable: str) -> Dict[str, str]:
+    """`name` searches one location and `name_anywhere` every location,
+    each with an `_available_on` variant that adds the date filter."""
+    variants = {}
+    for suffix, location in (("", _LOCATED), ("_anywhere", _ANYWHERE)):
+        search = head + location + filters
+        variants[name + suffix] = search + _SEARCH_PAGE
+        variants[f"{name}{suffix}_available_on"] = search + unavailable + _SEARCH_PAGE
+    return variants
+
+
+STATEMENTS: Dict[str, str] = {
+    **_search_variants("venues", _VENUE_FROM, _VENUE_FILTERS, _VENUE_UNAVAILABLE),
+    **_search_variants("caterers", _CATERER_FROM, _CATERER_FILTERS, _CATERER_UNAVAILABLE),
+    "create_booking": """
+        INSERT INTO bookings (
+            client_id, venue_id, caterer_id, event_date, number_of_guests,
+            event_type, cuisine_preferences, special_requirements,
+            venue_cost, catering_cost, total_cost, status
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, 'pending')
+        RETURNING *
+    """,
+    # Blocks the slot unless it is already blocked; no row back means the
+    # slot was taken. The upsert locks the (provider, date) row, so a
+    # concurrent reservation waits and then sees the blocked slot.
+    "reserve_venue": """
+        INSERT INTO venue_availability (venue_id, date, is_available, booking_id)
+        VALUES ($1, $2, FALSE, $3)
+        ON CONFLICT (venue_id, date) DO UPDATE
+            SET is_available = FALSE, booking_id = EXCLUDED.booking_id
+            WHERE venue_availability.is_available IS DISTINCT FROM FALSE
+        RETURNING id
+    """,
+    "reserve_caterer": """
+        INSERT INTO caterer_availability (caterer_id, date, is_available, booking_id)
+        VALUES ($1, $2, FALSE, $3)
+        ON CONFLICT (caterer_id, date) DO UPDATE
+            SET is_available = FALSE, booking_id = EXCLUDED.booking_id
+            WHERE caterer_availability.is_available IS DISTINCT FROM FALSE
+        RETURNING id
+    """,
+    "reserve_venues": """
+        INSERT INTO venue_availability (venue_id, date, is_available, booking_id)
+        SELECT venue_id, date, FALSE, booking_id
+        FROM unnest($1::uuid[], $2::date[], $3::uuid[]) AS slot(venue_id, date, booking_id)
+        ON CONFLICT (venue_id, date) DO UPDATE
+            SET is_available = FALSE, booking_id = EXCLUDED.booking_id
+            WHERE venue_availability.is_available IS DISTINCT FROM FALSE
+    """,
+    "reserve_caterers": """
+        INSERT INTO caterer_availability (caterer_id, date, is_available, booking_id)
+        SELECT caterer_id, date, FALSE, booking_id
+        FROM unnest($1::uuid[], $2::date[], $3::uuid[]) AS slot(caterer_id, date, booking_id)
+        ON CONFLICT (caterer_id, date) DO UPDATE
+            SET is_available = FALSE, booking_id = EXCLUDED.booking_id
+            WHERE caterer_availability.is_available IS DISTINCT FROM FALSE
+    """,
+    "venue_availability": """
+        SELECT is_available
+        FROM venue_availability
+        WHERE venue_id = $1 AND date = $2
+    """,
+    "caterer_availability": """
+        SELECT is_available
+        FROM caterer_availability
+        WHERE caterer_id = $1 AND date = $2
+    """,
+    "unavailable_venues": """
+        SELECT venue_id, date
+        FROM venue_availability
+        WHERE venue_id = ANY($1::uuid[])
+          AND date = ANY($2::date[])
+          AND is_available = FALSE
+    """,
+    "unavailable_caterers": """
+        SELECT caterer_id, date
+        FROM caterer_availability
+        WHERE caterer_id = ANY($1::uuid[])
+          AND date = ANY($2::date[])
+          AND is_available = FALSE
+    """,
+    "blocked_venue_dates": """
+        SELECT venue_id AS provider_id, date
+        FROM venue_availability
+        WHERE is_available = FALSE AND date >= $1
+    """,
+    "blocked_caterer_dates": """
+        SELECT caterer_id AS provider_id, date
+        FROM caterer_availability
+        WHERE is_available = FALSE AND date >= $1
+    """,
+}
+
+
+# Everything else in STATEMENTS is read-only and may run on a replica.
+WRITE_STATEMENTS = frozenset({
+    "create_booking", "reserve_venue", "reserve_caterer", "reserve_venues", "reserve_caterers"
+})
+
+
+class StatementRegistry:
+    """Process-wide counters for the statements in `STATEMENTS`.
+
+    A hit is an execution that reused a statement already prepared on its
+    connection; the Parse/Describe round trip it avoided is estimated from
+    the measured prepare time of that statement. Planning is left
+    out: it happens when a prepared statement executes, not when it is
+    prepared.
+    """
+
+    prepares: int = 0
+    prepare_failures: int = 0
+    prepare_seconds: Dict[str, float] = {}
+    prepare_counts: Dict[str, int] = {}
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+
+    @classmethod
+    def record_prepare(cls, name: str, seconds: float) -> None:
+        cls.prepares += 1
+        cls.prepare_seconds[name] = cls.prepare_seconds.get(name, 0.0) + seconds
+        cls.prepare_counts[name] = cls.prepare_counts.get(name, 0) + 1
+
+    @classmethod
+    def record_hit(cls, name: str) -> None:
+        cls.hits += 1
+        count = cls.prepare_counts.get(name)
+        if count:
+            cls.saved_seconds += cls.prepare_seconds[name] / count
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        lookups = cls.hits + cls.misses
+        return {
+            "statements": len(STATEMENTS),
+            "prepares": cls.prepares,
+            "prepare_failures": cls.prepare_failures,
+            "prepare_ms_total": round(sum(cls.prepare_seconds.values()) * 1000, 3),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": round(cls.hits / lookups, 4) if lookups else 0.0,
+            "estimated_parse_ms_saved": round(cls.saved_seconds * 1000, 3)
+        }
+
+
+class StatementConnection(asyncpg.Connection):
+    """Pool connection that keeps every registered statement prepared."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._registered: Dict[str, PreparedStatement] = {}
+
+    async def _prepare_registered(self, name: str) -> PreparedStatement:
+        started = time.perf_counter()
+        statement = await self.prepare(STATEMENTS[name])
+        StatementRegistry.record_prepare(name, time.perf_counter() - started)
+        self._registered[name] = statement
+        return statement
+
+    async def prepare_all(self) -> None:
+        for name in STATEMENTS:
+            try:
+                await self._prepare_registered(name)
+            except asyncpg.PostgresError:
+                # Leave it to the first execution to prepare and raise.
+                StatementRegistry.prepare_failures += 1
+
+    async def registered_statement(self, name: str, refresh: bool = False) -> PreparedStatement:
+        statement = None if refresh else self._registered.get(name)
+        if statement is None:
+            StatementRegistry.misses += 1
+            return await self._prepare_registered(name)
+        StatementRegistry.record_hit(name)
+        return statement
+
+
+async def prepare_statements(connection: StatementConnection) -> None:
+    await connection.prepare_all()
@@ -0,0 +1,224 @@
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+
+# Upper bounds in seconds; the last bucket is +Inf.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_HELP = {
+    "http_request_seconds": "Request latency by route.",
+    "plan_stage_seconds": "Planning pipeline stage latency.",
+    "db_query_seconds": "Registered statement execution time, excluding pool acquire.",
+    "db_pool_acquire_seconds": "Time waiting for a pooled connection.",
+}
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class Metrics:
+    """Process-wide latency histograms, rendered in the Prometheus text
+    format by `GET /metrics`. Each uvicorn worker keeps its own."""
+
+    _histograms: Dict[Tuple[str, str, str], Histogram] = {}
+
+    @classmethod
+    def observe(cls, metric: str, label: str, value: str, seconds: float) -> None:
+        key = (metric, label, value)
+        histogram = cls._histograms.get(key)
+        if histogram is None:
+            histogram = cls._histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+    @classmethod
+    def render(cls) -> str:
+        lines: List[str] = []
+        for metric in sorted({key[0] for key in cls._histograms}):
+            lines.append(f"# HELP {metric} {METRIC_HELP.get(metric, metric)}")
+            lines.append(f"# TYPE {metric} histogram")
+            for (name, label, value), histogram in sorted(cls._histograms.items()):
+                if name != metric:
+                    continue
+                value = value.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{label}="{value}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{{label}="{value}"}} {histogram.sum:.6f}')
+                lines.append(f'{metric}_count{{{label}="{value}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._histograms = {}
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("metric", "label", "value", "started", "otel")
+
+    def __init__(self, metric: str, label: str, value: str):
+        self.metric = metric
+        self.label = label
+        self.value = value
+        self.otel = None
+
+    def __enter__(self):
+        if Tracer._tracer is not None:
+            self.otel = Tracer._tracer.start_as_current_span(
+                f"{self.metric.rsplit('_', 1)[0]}.{self.value}", attributes={self.label: self.value}
+            )
+            self.otel.__enter__()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        if Tracer.metrics_enabled:
+            Metrics.observe(self.metric, self.label, self.value, elapsed)
+        if self.otel is not None:
+            self.otel.__exit__(*exc)
+        return False
+
+
+class Tracer:
+    """Timing spans for the request path.
+
+    Every span feeds a `Metrics` histogram unless METRICS_ENABLED is off.
+    With TRACING_EXPORTER set to `otlp` or `console`, spans are also
+    exported through OpenTelemetry, which is then an extra dependency. With
+    both off, `span()` returns a shared no-op context manager.
+    """
+
+    metrics_enabled: bool = settings.metrics_enabled
+    _tracer: Any = None
+
+    @classmethod
+    def configure(cls, exporter: str = settings.tracing_exporter) -> None:
+        if exporter == "none":
+            cls._tracer = None
+            return
+        try:
+            from opentelemetry import trace
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+        except ImportError:
+            raise RuntimeError(
+                f"TRACING_EXPORTER={exporter} needs opentelemetry-sdk "
+                "(and opentelemetry-exporter-otlp for otlp) to be installed"
+            )
+        if exporter == "otlp":
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+            span_exporter = OTLPSpanExporter()
+        elif exporter == "console":
+            span_exporter = ConsoleSpanExporter()
+        else:
+            raise ValueError(f"Unknown TRACING_EXPORTER {exporter!r}; use none, console or otlp")
+
+        provider = TracerProvider(resource=Resource.create({"service.name": settings.tracing_service_name}))
+        provider.add_span_processor(BatchSpanProcessor(span_exporter))
+        trace.set_tracer_provider(provider)
+        cls._tracer = trace.get_tracer("app")
+
+    @classmethod
+    def span(cls, metric: str, label: str, value: str):
+        if cls._tracer is None and not cls.metrics_enabled:
+            return _NOOP_SPAN
+        return _Span(metric, label, value)
+
+
+def stage_span(stage: str):
+    return Tracer.span("plan_stage_seconds", "stage", stage)
+
+
+def query_span(statement: str):
+    return Tracer.span("db_query_seconds", "statement", statement)
+
+
+def request_span(route: str):
+    return Tracer.span("http_request_seconds", "route", route)
+
+
+class RequestTimingMiddleware:
+    """Times each HTTP request into `http_request_seconds`, labelled by
+    `label(path)`. A plain ASGI middleware: the app call it wraps returns
+    only once the last body chunk is sent, so streamed responses are timed
+    in full, and no task or body queue is added per request."""
+
+    def __init__(self, app, label: Callable[[str], str]):
+        self.app = app
+        self.label = label
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_span(self.label(scope["path"])):
+            await self.app(scope, receive, send)
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack at a fixed interval from a
+    background thread and aggregates the samples as folded stacks
+    (`frame;frame;frame count`), the input format of flamegraph.pl and
+    speedscope. Only one profile runs at a time."""
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def profile(cls, seconds: float, interval: float, thread_id: Optional[int] = None) -> str:
+        """Blocks the calling thread for `seconds`; run it off the profiled
+        thread (e.g. in a worker thread) so the target keeps running."""
+        thread_id = thread_id or threading.main_thread().ident
+        if not cls._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already being captured")
+        try:
+            stacks: Counter = Counter()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                frame = sys._current_frames().get(thread_id)
+                if frame is not None:
+                    stacks[cls._fold(frame)] += 1
+                time.sleep(interval)
+            return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        finally:
+            cls._lock.release()
+
+    @staticmethod
+    def _fold(frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
@@ -0,0 +1,78 @@
+"""Stored benchmark results and the regression check against them.
+
+`benchmarks/baseline.json` holds one section per benchmark (`micro`,
+`load`). Load figures only compare on the setup that recorded them, so
+record that section on the box or CI runner that checks against it. The
+microbenchmarks are checked as multiples of their calibration loop, which
+carries over between machines far better than raw times.
+"""
+import json
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+def load(section: str) -> Dict[str, float]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text()).get(section, {})
+
+
+def save(section: str, results: Dict[str, float]) -> None:
+    stored = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    stored[section] = {name: round(value, 3) for name, value in results.items()}
+    BASELINE_PATH.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+
+
+def regressions(
+    section: str,
+    results: Dict[str, float],
+    tolerance: float,
+    higher_is_better: FrozenSet[str] = frozenset(),
+    reference: Optional[str] = None
+) -> List[str]:
+    """Results worse than the stored baseline by more than `tolerance`
+    (0.25 = 25%). With a `reference` metric, both sides are divided by it
+    first. Metrics missing from the baseline are not checked."""
+    baseline = load(section)
+    found = []
+    for name, value in sorted(results.items()):
+        expected = baseline.get(name)
+        if not expected or name == reference:
+            continue
+        if reference is not None and baseline.get(reference):
+            value, expected = value / results[reference], expected / baseline[reference]
+        if name in higher_is_better:
+            change = expected / value - 1 if value else float("inf")
+        else:
+            change = value / expected - 1
+        if change > tolerance:
+            found.append(f"{name}: {value:.4g} vs baseline {expected:.4g} ({change:+.0%} worse)")
+    return found
+
+
+def finish(
+    section: str,
+    results: Dict[str, float],
+    args,
+    higher_is_better: FrozenSet[str] = frozenset(),
+    reference: Optional[str] = None
+) -> None:
+    """Apply the `--save-baseline` / `--check` flags of a benchmark run."""
+    if args.save_baseline:
+        save(section, results)
+        print(f"saved {len(results)} {section} results to {BASELINE_PATH}")
+    if args.check:
+        if not load(section):
+            raise SystemExit(f"no {section} baseline in {BASELINE_PATH}; record one with --save-baseline")
+        found = regressions(section, results, args.tolerance, higher_is_better, reference)
+        if found:
+            raise SystemExit("regressions against the baseline:\n  " + "\n  ".join(found))
+        print(f"no regressions beyond {args.tolerance:.0%} against the {section} baseline")
+
+
+def add_arguments(parser) -> None:
+    parser.add_argument("--save-baseline", action="store_true", help=f"store the results in {BASELINE_PATH.name}")
+    parser.add_argument("--check", action="store_true", help="exit non-zero on a regression against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before --check fails")
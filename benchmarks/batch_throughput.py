@@ -0,0 +1,56 @@
+"""Throughput of POST /plan-events versus N sequential POST /plan-event calls.
+
+Start the API first (uvicorn app.main:app), then:
+
+    python -m benchmarks.batch_throughput --base-url http://localhost:8000 --scenarios 300
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import httpx
+
+from app.config import SUPPORTED_CUISINES, SUPPORTED_LOCATIONS
+
+
+def scenarios(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    start = date(2025, 6, 1)
+    return [
+        {
+            "event_date": (start + timedelta(days=rng.randint(0, 180))).isoformat(),
+            "location": rng.choice(SUPPORTED_LOCATIONS),
+            "number_of_guests": rng.randint(20, 300),
+            "cuisine_preferences": rng.sample(SUPPORTED_CUISINES, rng.randint(0, 2)) or None,
+            "needs_event_room": rng.random() < 0.7,
+        }
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scenarios", type=int, default=300)
+    args = parser.parse_args()
+
+    payloads = scenarios(args.scenarios)
+
+    with httpx.Client(base_url=args.base_url, timeout=120) as client:
+        start = time.perf_counter()
+        for payload in payloads:
+            client.post("/plan-event", json=payload).raise_for_status()
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        client.post("/plan-events", json={"requests": payloads}).raise_for_status()
+        batched = time.perf_counter() - start
+
+    print(f"sequential: {sequential:.3f}s  {len(payloads) / sequential:8.1f} plans/s")
+    print(f"batched:    {batched:.3f}s  {len(payloads) / batched:8.1f} plans/s")
+    print(f"speedup:    {sequential / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Budget filter and cost-ordered page in SQL vs fetching every caterer and pricing it in Python.
+
+    python -m benchmarks.budget_pushdown --providers 20000 --limit 20
+
+Adds `--providers` synthetic caterers in one city to the database at
+DATABASE_URL inside a transaction that is rolled back at the end. For a
+range of budgets it times the search statement with the budget, cost order
+and limit as parameters against the same statement without them followed by
+pricing, filtering and sorting in Python, and reports rows shipped per
+request for both.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import asyncpg
+
+from app.config import DATABASE_URL
+from app.services.catering_service import select_caterers
+from app.statements import STATEMENTS
+from benchmarks.matching_engine import synthetic_caterers
+
+
+CITY = "Benchmark City"
+
+
+def report(label: str, samples: List[float], rows: int) -> None:
+    ordered = sorted(samples)
+    print(
+        f"{label:<10} p50={ordered[len(ordered) // 2] * 1e3:8.3f}ms "
+        f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1e3:8.3f}ms "
+        f"mean={statistics.fmean(samples) * 1e3:8.3f}ms rows_shipped={rows / len(samples):.1f}"
+    )
+
+
+async def run(args) -> None:
+    rows = synthetic_caterers(args.providers, 1)
+    for row in rows:
+        row["location"] = CITY
+    columns = list(rows[0].keys())
+
+    conn = await asyncpg.connect(DATABASE_URL)
+    transaction = conn.transaction()
+    await transaction.start()
+    try:
+        await conn.copy_records_to_table(
+            "caterers", records=[tuple(row[c] for c in columns) for row in rows], columns=columns
+        )
+        await conn.execute("ANALYZE caterers")
+        statement = await conn.prepare(STATEMENTS["caterers"])
+
+        for budget in args.budgets:
+            print(f"budget_per_guest={budget:g} guests={args.guests}")
+            samples, shipped = [], 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fetched = [dict(r) for r in await statement.fetch(
+                    CITY, args.guests, args.guests, None, args.guests, None, False, None, None, None, None, None
+                )]
+                select_caterers(fetched, args.guests, budget, "cost", args.limit)
+                samples.append(time.perf_counter() - start)
+                shipped += len(fetched)
+            report("python", samples, shipped)
+
+            samples, shipped = [], 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fetched = [dict(r) for r in await statement.fetch(
+                    CITY, args.guests, args.guests, None, args.guests, budget, True, args.limit, None, None, None, None
+                )]
+                samples.append(time.perf_counter() - start)
+                shipped += len(fetched)
+            report("pushdown", samples, shipped)
+    finally:
+        await transaction.rollback()
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--providers", type=int, default=20_000)
+    parser.add_argument("--guests", type=int, default=120)
+    parser.add_argument("--budgets", type=float, nargs="+", default=[40, 80, 160])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,79 @@
+"""Scaling of the cuisine grouping stage of a /plan-event response.
+
+Times `group_by_cuisine` and the whole `build_catering_analysis` for a
+growing number of caterers, with matching preferences, with preferences
+nothing matches (the fallback to every cuisine) and with none. Time per
+caterer should stay flat as the count grows. The previous grouping, which
+re-read the preferences for every caterer and walked them all a second
+time for the fallback, is timed alongside. No database is needed:
+
+    python -m benchmarks.catering_analysis --sizes 1000 10000 100000
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from app.services.catering_service import build_catering_analysis, group_by_cuisine, preference_set
+from app.services.pricing_service import price_catering_services
+from benchmarks.matching_engine import synthetic_caterers
+
+
+PREFERENCES = {
+    "matching": ["italian", "Thai", "INDIAN"],
+    "fallback": ["Klingon"],
+    "none": None,
+}
+
+
+def previous_grouping(services: List[Dict], cuisine_preferences: List[str] = None) -> Dict[str, List[int]]:
+    groups: Dict[str, List[int]] = {}
+    for position, service in enumerate(services):
+        if cuisine_preferences:
+            preferences = {pref.lower() for pref in cuisine_preferences}
+            listed = [c for c in service['supported_cuisines'] if c.lower() in preferences]
+        else:
+            listed = list(service['supported_cuisines'])
+        for cuisine in listed:
+            groups.setdefault(cuisine, []).append(position)
+    if not groups and services:
+        for position, service in enumerate(services):
+            for cuisine in service['supported_cuisines']:
+                groups.setdefault(cuisine, []).append(position)
+    return groups
+
+
+def best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args) -> None:
+    print(f"{'caterers':>9} {'preferences':>11} {'previous':>12} {'grouping':>12} {'analysis':>12}   (us per caterer)")
+    for size in args.sizes:
+        services = synthetic_caterers(size, 1)
+        table = price_catering_services(services, [args.guests])
+        for label, cuisines in PREFERENCES.items():
+            preferences = preference_set(cuisines)
+            assert previous_grouping(services, cuisines) == group_by_cuisine(services, preferences)
+            previous = best_of(args.repeat, lambda: previous_grouping(services, cuisines))
+            grouping = best_of(args.repeat, lambda: group_by_cuisine(services, preferences))
+            analysis = best_of(max(1, args.repeat // 5), lambda: asyncio.run(build_catering_analysis(
+                services, args.guests, cuisine_preferences=cuisines, price_table=table
+            )))
+            print(
+                f"{size:>9} {label:>11} {previous / size * 1e6:>12.3f} "
+                f"{grouping / size * 1e6:>12.3f} {analysis / size * 1e6:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--guests", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=10)
+    main(parser.parse_args())
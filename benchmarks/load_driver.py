@@ -0,0 +1,93 @@
+"""Closed-loop load against POST /plan-event: throughput and tail latency.
+
+Start the API first (uvicorn app.main:app), ideally over data from
+benchmarks.synthetic_data, then:
+
+    python -m benchmarks.load_driver --requests 5000 --concurrency 32
+    python -m benchmarks.load_driver --check
+
+`--concurrency` clients each send the next scenario (the same seeded mix
+benchmarks.batch_throughput uses) as soon as their previous response
+arrives. After `--warmup` untimed requests it reports requests per second
+and p50/p95/p99 latency. Non-2xx responses count as errors and are left
+out of the latency figures.
+"""
+import argparse
+import asyncio
+import itertools
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks import baseline
+from benchmarks.batch_throughput import scenarios
+from benchmarks.plan_event_latency import percentile
+
+
+async def drive(client: httpx.AsyncClient, payloads: List[Dict], total: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    sent = itertools.count()
+
+    async def worker() -> None:
+        nonlocal errors
+        while True:
+            i = next(sent)
+            if i >= total:
+                return
+            start = time.perf_counter()
+            try:
+                response = await client.post("/plan-event", json=payloads[i % len(payloads)])
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            if response.is_success:
+                latencies.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    if not latencies:
+        raise SystemExit(f"all {total} requests failed")
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "errors": errors,
+    }
+
+
+async def main(args) -> Dict[str, float]:
+    payloads = scenarios(args.scenarios)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        if args.warmup:
+            await drive(client, payloads, args.warmup, args.concurrency)
+        return await drive(client, payloads, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--scenarios", type=int, default=300)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    baseline.add_arguments(parser)
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} errors={results['errors']:.0f} "
+        f"rps={results['rps']:.1f} p50={results['p50_ms']:.2f}ms "
+        f"p95={results['p95_ms']:.2f}ms p99={results['p99_ms']:.2f}ms"
+    )
+    latency = {name: value for name, value in results.items() if name != "errors"}
+    baseline.finish("load", latency, args, higher_is_better=frozenset({"rps"}))
+    if results["errors"] and args.check:
+        raise SystemExit(f"{results['errors']:.0f} requests failed")
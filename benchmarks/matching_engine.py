@@ -0,0 +1,142 @@
+"""Candidate matching over synthetic providers: index vs linear scan vs SQL.
+
+    python -m benchmarks.matching_engine --providers 100000 --queries 2000
+    python -m benchmarks.matching_engine --sql   # also time the Postgres path
+
+The SQL path loads the same rows into a temporary copy of `caterers` at
+DATABASE_URL and runs the query shape used by DatabaseService.fetch_caterers.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from decimal import Decimal
+from typing import List, Dict, Any, Tuple
+
+import asyncpg
+
+from app.config import DATABASE_URL, SUPPORTED_CUISINES, SUPPORTED_LOCATIONS
+from app.matching import caterer_index
+
+
+SQL_QUERY = """
+    SELECT id, name, location, supported_cuisines, min_guests, max_guests
+    FROM bench_caterers
+    WHERE is_active = TRUE
+      AND LOWER(location) = LOWER($1)
+      AND max_guests >= $2
+      AND min_guests <= $3
+      AND supported_cuisines && $4::text[]
+    ORDER BY name
+"""
+
+
+def synthetic_caterers(count: int, locations: int, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    cities = list(SUPPORTED_LOCATIONS) + [f"City {i:03d}" for i in range(max(0, locations - len(SUPPORTED_LOCATIONS)))]
+    rows = []
+    for i in range(count):
+        min_guests = rng.randint(10, 300)
+        rows.append({
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "name": f"Caterer {i:06d}",
+            "location": rng.choice(cities[:locations]),
+            "supported_cuisines": rng.sample(SUPPORTED_CUISINES, rng.randint(1, 3)),
+            "base_price_per_guest": Decimal(rng.randint(2500, 15000)) / 100,
+            "service_fee_flat": Decimal(rng.randint(0, 1000)),
+            "tax_rate_percent": Decimal("8.75"),
+            "min_guests": min_guests,
+            "max_guests": min_guests + rng.randint(0, 700),
+        })
+    rows.sort(key=lambda row: row["name"])
+    return rows
+
+
+def synthetic_queries(count: int, rows: List[Dict[str, Any]], seed: int = 7) -> List[Tuple]:
+    rng = random.Random(seed)
+    locations = sorted({row["location"] for row in rows})
+    return [
+        (rng.choice(locations), rng.randint(10, 800), rng.sample(SUPPORTED_CUISINES, rng.randint(1, 2)))
+        for _ in range(count)
+    ]
+
+
+def linear_scan(rows, location, guests, cuisines):
+    wanted = set(cuisines)
+    key = location.lower()
+    return [
+        row for row in rows
+        if row["location"].lower() == key
+        and row["max_guests"] >= guests and row["min_guests"] <= guests
+        and not wanted.isdisjoint(row["supported_cuisines"])
+    ]
+
+
+def report(label: str, samples: List[float], matches: int) -> None:
+    ordered = sorted(samples)
+    print(
+        f"{label:<14} p50={ordered[len(ordered) // 2] * 1e3:8.3f}ms "
+        f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1e3:8.3f}ms "
+        f"mean={statistics.fmean(samples) * 1e3:8.3f}ms avg_matches={matches / len(samples):.1f}"
+    )
+
+
+def time_in_memory(label: str, search, queries) -> None:
+    samples, matches = [], 0
+    for location, guests, cuisines in queries:
+        start = time.perf_counter()
+        result = search(location, guests, cuisines)
+        samples.append(time.perf_counter() - start)
+        matches += len(result)
+    report(label, samples, matches)
+
+
+async def time_sql(rows, queries) -> None:
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        await conn.execute("CREATE TEMP TABLE bench_caterers (LIKE caterers INCLUDING DEFAULTS INCLUDING INDEXES)")
+        columns = list(rows[0].keys())
+        await conn.copy_records_to_table(
+            "bench_caterers",
+            records=[tuple(row[c] for c in columns) for row in rows],
+            columns=columns
+        )
+        await conn.execute("ANALYZE bench_caterers")
+
+        samples, matches = [], 0
+        for location, guests, cuisines in queries:
+            start = time.perf_counter()
+            result = await conn.fetch(SQL_QUERY, location, guests, guests, cuisines)
+            samples.append(time.perf_counter() - start)
+            matches += len(result)
+        report("sql", samples, matches)
+    finally:
+        await conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--providers", type=int, default=100_000)
+    parser.add_argument("--locations", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--sql", action="store_true", help="also benchmark the Postgres path")
+    args = parser.parse_args()
+
+    rows = synthetic_caterers(args.providers, args.locations)
+    queries = synthetic_queries(args.queries, rows)
+
+    start = time.perf_counter()
+    index = caterer_index(rows)
+    print(f"providers={len(rows)} locations={args.locations} index_build={time.perf_counter() - start:.2f}s")
+
+    time_in_memory("linear_scan", lambda l, g, c: linear_scan(rows, l, g, c), queries[: max(1, len(queries) // 10)])
+    time_in_memory("index", lambda l, g, c: index.search(l, g, g, c), queries)
+
+    if args.sql:
+        asyncio.run(time_sql(rows, queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""CPU cost of the pure functions behind a /plan-event response.
+
+    python -m benchmarks.microbenchmarks
+    python -m benchmarks.microbenchmarks --check            # fail on a regression
+    python -m benchmarks.microbenchmarks --save-baseline    # record this machine's numbers
+
+Times calculate_cost_breakdown over 100 caterers, and
+build_catering_analysis, build_event_room_response and build_summary_text
+for pages of `--sizes` providers drawn by benchmarks.synthetic_data. Each
+result is the best of `--repeat` timeit runs in microseconds per call,
+also shown as a multiple of a fixed calibration loop; `--check` compares
+those multiples. No database is needed.
+"""
+import argparse
+import timeit
+from typing import Callable, Dict
+
+from app.main import build_summary_text
+from app.services.catering_service import build_catering_analysis, calculate_cost_breakdown
+from app.services.venue_service import build_event_room_response
+from benchmarks import baseline
+from benchmarks.synthetic_data import caterer_records, venue_records
+
+
+GUESTS = 120
+PREFERENCES = ["Italian", "indian", "Thai"]
+
+
+def complete(coroutine):
+    """Result of a coroutine that never suspends, without an event loop."""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("benchmarked coroutine awaited something")
+
+
+def calibration_loop() -> None:
+    prices = {}
+    for i in range(2000):
+        prices[f"caterer-{i}"] = round(i * 1.0875 + 450, 2)
+    sorted(prices.values())
+
+
+def benchmark_cases(sizes) -> Dict[str, Callable[[], object]]:
+    largest = max(sizes)
+    caterers = list(caterer_records(largest))
+    rooms = list(venue_records(largest))
+
+    def cost_breakdowns():
+        for service in caterers[:100]:
+            calculate_cost_breakdown(service, GUESTS)
+
+    # Plain Python work of a fixed size. --check compares every result
+    # relative to it, so a baseline carries over to a faster or slower box.
+    cases = {"calibration": calibration_loop, "calculate_cost_breakdown[100]": cost_breakdowns}
+    for size in sizes:
+        page, room_page = caterers[:size], rooms[:size]
+        analysis = complete(build_catering_analysis(page, GUESTS, PREFERENCES))
+        event_rooms = complete(build_event_room_response(room_page, 9000.0))
+        cases[f"build_catering_analysis[{size}]"] = (
+            lambda page=page: complete(build_catering_analysis(page, GUESTS, PREFERENCES))
+        )
+        cases[f"build_event_room_response[{size}]"] = (
+            lambda room_page=room_page: complete(build_event_room_response(room_page, 9000.0))
+        )
+        cases[f"build_summary_text[{size}]"] = (
+            lambda analysis=analysis, event_rooms=event_rooms:
+                build_summary_text("Chicago", "2025-06-01", GUESTS, analysis, event_rooms, PREFERENCES)
+        )
+    return cases
+
+
+def run_benchmarks(sizes, repeat: int) -> Dict[str, float]:
+    """Best time per call of each case, in microseconds. The cases take
+    turns, one timeit run each per round, so a slow spell on a shared
+    machine does not land on one of them only."""
+    timers = {}
+    for name, case in benchmark_cases(sizes).items():
+        timer = timeit.Timer(case)
+        timers[name] = (timer, timer.autorange()[0])
+
+    best = {name: float("inf") for name in timers}
+    for _ in range(repeat):
+        for name, (timer, number) in timers.items():
+            best[name] = min(best[name], timer.timeit(number) / number * 1e6)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=7)
+    baseline.add_arguments(parser)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.repeat)
+    stored = baseline.load("micro")
+    for name, value in results.items():
+        relative = value / results["calibration"]
+        against = ""
+        if name in stored and stored.get("calibration"):
+            against = f"  baseline {stored[name] / stored['calibration']:9.4f}x"
+        print(f"{name:<34} {value:11.3f}us {relative:9.4f}x{against}")
+    baseline.finish("micro", results, args, reference="calibration")
@@ -0,0 +1,84 @@
+"""Candidate-lookup latency for /plan-event: sequential vs concurrent stages.
+
+Runs against the Postgres at DATABASE_URL (seeded with database/seed_data.sql):
+
+    python -m benchmarks.plan_event_latency --requests 500 --concurrency 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from app.database import DatabaseConnection
+from app.services.catering_service import filter_catering_services
+from app.services.venue_service import filter_event_rooms
+from app.services.stages import run_stages
+
+
+SCENARIOS = [
+    ("San Francisco", 120, ["Italian", "Indian"]),
+    ("New York", 150, ["Italian"]),
+    ("Los Angeles", 80, ["Mexican"]),
+    ("Chicago", 200, None),
+    ("Austin", 60, ["Mediterranean"]),
+]
+
+
+async def sequential_lookup(location: str, guests: int, cuisines: List[str]) -> None:
+    await filter_catering_services(location, guests, cuisines)
+    await filter_event_rooms(location, guests)
+
+
+async def concurrent_lookup(location: str, guests: int, cuisines: List[str]) -> None:
+    await run_stages({
+        "catering": filter_catering_services(location, guests, cuisines),
+        "rooms": filter_event_rooms(location, guests),
+    })
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def measure(lookup, total: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        location, guests, cuisines = SCENARIOS[i % len(SCENARIOS)]
+        async with semaphore:
+            start = time.perf_counter()
+            await lookup(location, guests, cuisines)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return latencies
+
+
+async def main(total: int, concurrency: int, warmup: int) -> None:
+    await DatabaseConnection.get_pool()
+    try:
+        for label, lookup in (("before (sequential)", sequential_lookup),
+                              ("after (concurrent)", concurrent_lookup)):
+            await measure(lookup, warmup, concurrency)
+            samples = await measure(lookup, total, concurrency)
+            print(
+                f"{label:<22} n={len(samples):<6} "
+                f"p50={percentile(samples, 50):7.2f}ms "
+                f"p99={percentile(samples, 99):7.2f}ms "
+                f"mean={statistics.fmean(samples):7.2f}ms"
+            )
+    finally:
+        await DatabaseConnection.close_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.warmup))
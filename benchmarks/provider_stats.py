@@ -0,0 +1,138 @@
+"""Provider ratings from the trigger-maintained stats tables vs aggregating at read time.
+
+    python -m benchmarks.provider_stats --bookings 1000000 --reviews 1000000
+
+Runs against the seeded database at DATABASE_URL inside one transaction
+that is rolled back at the end, so nothing is left behind. It reports:
+
+- the time to load the bookings and reviews, including stats maintenance;
+- the cost of one more booking written as a single-row insert;
+- the venue search with its stats join vs the same search aggregating
+  bookings and reviews per request;
+- the pre-aggregation `active_venues` view, which joins every booking to
+  every review of the same venue, under `--legacy-timeout`.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import asyncpg
+
+from app.config import DATABASE_URL, DEFAULT_EVENT_DURATION_HOURS
+from app.statements import STATEMENTS
+
+
+LIVE_AGGREGATE_QUERY = """
+    SELECT v.id, v.name,
+           (SELECT COUNT(*) FROM bookings b WHERE b.venue_id = v.id) AS booking_count,
+           (SELECT AVG(r.rating) FROM reviews r WHERE r.venue_id = v.id) AS average_rating
+    FROM venues v
+    WHERE v.is_active = TRUE
+      AND LOWER(v.location) = LOWER($1)
+      AND v.capacity_max >= $2 AND v.capacity_min <= $2
+    ORDER BY v.name
+"""
+
+LEGACY_VIEW_QUERY = """
+    SELECT v.id, COUNT(DISTINCT b.id) AS total_bookings, AVG(r.rating) AS average_rating
+    FROM venues v
+    LEFT JOIN bookings b ON v.id = b.venue_id
+    LEFT JOIN reviews r ON v.id = r.venue_id
+    WHERE v.is_active = TRUE
+    GROUP BY v.id
+"""
+
+LOAD_BOOKINGS = """
+    INSERT INTO bookings (client_id, venue_id, caterer_id, event_date, number_of_guests, status)
+    SELECT $1::uuid, venue_ids[1 + i % array_length(venue_ids, 1)],
+           caterer_ids[1 + i % array_length(caterer_ids, 1)],
+           DATE '2020-01-01' + (i % 3650), 10 + i % 300, 'completed'
+    FROM generate_series(0, $2::int - 1) AS i,
+         (SELECT array_agg(id) AS venue_ids FROM venues) v,
+         (SELECT array_agg(id) AS caterer_ids FROM caterers) c
+"""
+
+LOAD_REVIEWS = """
+    INSERT INTO reviews (booking_id, reviewer_id, venue_id, caterer_id, rating)
+    SELECT id, client_id, venue_id, caterer_id, 1 + abs(hashtext(id::text)) % 5
+    FROM bookings
+    WHERE client_id = $1::uuid
+    LIMIT $2::int
+"""
+
+
+def report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    print(
+        f"{label:<16} p50={ordered[len(ordered) // 2] * 1e3:9.3f}ms "
+        f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1e3:9.3f}ms "
+        f"mean={statistics.fmean(samples) * 1e3:9.3f}ms"
+    )
+
+
+async def timed(conn, query: str, *args, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await conn.fetch(query, *args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run(args) -> None:
+    conn = await asyncpg.connect(DATABASE_URL)
+    transaction = conn.transaction()
+    await transaction.start()
+    try:
+        client_id = await conn.fetchval(
+            "INSERT INTO users (email, full_name, user_type) "
+            "VALUES ('bench@example.com', 'Benchmark Client', 'client') RETURNING id"
+        )
+        location, guests = await conn.fetchrow("SELECT location, capacity_min FROM venues LIMIT 1")
+
+        start = time.perf_counter()
+        await conn.execute(LOAD_BOOKINGS, client_id, args.bookings)
+        print(f"load bookings    {args.bookings:>9,} rows {time.perf_counter() - start:8.2f}s")
+        start = time.perf_counter()
+        await conn.execute(LOAD_REVIEWS, client_id, args.reviews)
+        print(f"load reviews     {args.reviews:>9,} rows {time.perf_counter() - start:8.2f}s")
+        await conn.execute("ANALYZE bookings; ANALYZE reviews; ANALYZE venue_stats; ANALYZE caterer_stats")
+
+        venue_id, caterer_id = await conn.fetchrow("SELECT venue_id, caterer_id FROM bookings LIMIT 1")
+        insert = await conn.prepare(
+            "INSERT INTO bookings (client_id, venue_id, caterer_id, event_date, number_of_guests) "
+            "VALUES ($1, $2, $3, DATE '2031-01-01', 50)"
+        )
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            await insert.fetch(client_id, venue_id, caterer_id)
+            samples.append(time.perf_counter() - start)
+        report("single insert", samples)
+
+        report("stats join", await timed(
+            conn, STATEMENTS["venues"], location, guests, guests, guests, DEFAULT_EVENT_DURATION_HOURS,
+            None, False, None, None, None, None, None, repeat=args.repeat
+        ))
+        report("live aggregate", await timed(conn, LIVE_AGGREGATE_QUERY, location, guests, repeat=args.repeat))
+
+        try:
+            async with conn.transaction():
+                await conn.execute(f"SET LOCAL statement_timeout = {int(args.legacy_timeout * 1000)}")
+                report("legacy view", await timed(conn, LEGACY_VIEW_QUERY, repeat=1))
+        except asyncpg.QueryCanceledError:
+            print(f"legacy view      > {args.legacy_timeout:g}s (cancelled)")
+    finally:
+        await transaction.rollback()
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--reviews", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--legacy-timeout", type=float, default=30)
+    asyncio.run(run(parser.parse_args()))
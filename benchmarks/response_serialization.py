@@ -0,0 +1,103 @@
+"""Per-request CPU to build and serialize a /plan-event response.
+
+Compares FastAPI's response_model path (re-validate the returned model,
+jsonable_encoder, json.dumps) with ModelResponse (serialize the
+already-validated model straight to bytes). No database is needed:
+
+    python -m benchmarks.response_serialization --sizes 10 100 1000
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.config import SUPPORTED_CUISINES
+from app.main import assemble_plan
+from app.models import EventPlanRequest, EventPlanResponse
+from app.responses import ModelResponse
+
+
+RESPONSE_FIELD = create_response_field(name="Response_plan_event", type_=EventPlanResponse)
+
+
+def synthetic_candidates(providers: int, seed: int = 3):
+    rng = random.Random(seed)
+    caterers = [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "name": f"Caterer {i:05d}",
+            "location": "Chicago",
+            "supported_cuisines": rng.sample(SUPPORTED_CUISINES, rng.randint(1, 3)),
+            "base_price_per_guest": Decimal(rng.randint(3000, 15000)) / 100,
+            "service_fee_flat": Decimal(rng.randint(0, 800)),
+            "tax_rate_percent": Decimal("10.25"),
+            "min_guests": 10,
+            "max_guests": 1000,
+            "notes": "Vegetarian and gluten-free menus available",
+        }
+        for i in range(providers)
+    ]
+    rooms = [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "name": f"Venue {i:05d}",
+            "location": "Chicago",
+            "capacity_min": 10,
+            "capacity_max": 1000,
+            "base_room_rental_fee": Decimal(rng.randint(100000, 800000)) / 100,
+            "hourly_rate": Decimal(rng.randint(5000, 40000)) / 100,
+            "includes_catering": rng.random() < 0.2,
+            "supported_cuisines_if_included": None,
+            "amenities": ["WiFi", "AV equipment", "Parking"],
+        }
+        for i in range(max(1, providers // 4))
+    ]
+    return caterers, rooms
+
+
+async def fastapi_path(request, caterers, rooms) -> bytes:
+    plan = await assemble_plan(request, caterers, rooms)
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=plan)
+    return JSONResponse(content).body
+
+
+async def lean_path(request, caterers, rooms) -> bytes:
+    plan = await assemble_plan(request, caterers, rooms)
+    return ModelResponse(plan).body
+
+
+async def cpu_per_request(path, request, caterers, rooms, iterations: int) -> float:
+    await path(request, caterers, rooms)
+    start = time.process_time()
+    for _ in range(iterations):
+        await path(request, caterers, rooms)
+    return (time.process_time() - start) / iterations * 1000
+
+
+async def main(sizes, iterations: int) -> None:
+    request = EventPlanRequest(
+        event_date="2025-09-15",
+        location="Chicago",
+        number_of_guests=150,
+        needs_event_room=True
+    )
+    print(f"{'providers':>9} {'response_model':>15} {'ModelResponse':>14} {'speedup':>8}")
+    for size in sizes:
+        caterers, rooms = synthetic_candidates(size)
+        before = await cpu_per_request(fastapi_path, request, caterers, rooms, iterations)
+        after = await cpu_per_request(lean_path, request, caterers, rooms, iterations)
+        print(f"{size:>9} {before:>13.2f}ms {after:>12.2f}ms {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.iterations))
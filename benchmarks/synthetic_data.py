@@ -0,0 +1,276 @@
+"""Synthetic venues, caterers, availability and bookings at 1k/100k/1M scale.
+
+    python -m benchmarks.synthetic_data --scale 100k
+    python -m benchmarks.synthetic_data --scale 1m --replace
+
+Rows follow database/seed_data.sql: the supported cities (joined by
+numbered ones as the catalog grows, about a thousand providers per city),
+street addresses, each city's sales tax, and cuisine and amenity arrays.
+`--scale` providers of each kind get as many bookings, which block their
+venue and caterer slots, plus half as many maintenance blocks per kind.
+Rows are drawn from a seeded generator, so a scale and `--seed` always
+give the same data.
+
+Loads into DATABASE_URL with COPY in one transaction. `--replace` first
+truncates venues and caterers and everything that references them
+(bookings, calendars, stats, reviews, documents). The per-row availability
+notifications are switched off for the load and replaced by one reload
+notification, and the provider stats are maintained by the usual triggers.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import asyncpg
+
+from app.config import DATABASE_URL, SUPPORTED_CUISINES, SUPPORTED_LOCATIONS
+from app.database import BOOKING_IMPORT_COLUMNS
+
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+PROVIDERS_PER_CITY = 1_000
+
+START_DATE = date(2025, 1, 1)
+
+# City, state and sales tax as in database/seed_data.sql.
+CITY_DETAILS = {
+    "San Francisco": ("CA", Decimal("9.5")),
+    "New York": ("NY", Decimal("8.875")),
+    "Los Angeles": ("CA", Decimal("9.5")),
+    "Chicago": ("IL", Decimal("10.25")),
+    "Austin": ("TX", Decimal("8.25")),
+}
+
+STREETS = ["Market St", "Broadway", "Main St", "Ocean Ave", "Congress Ave", "State St", "Park Ave", "Lake Shore Dr"]
+
+AMENITIES = [
+    "AV equipment", "Stage", "Parking", "WiFi", "Dance floor", "Green room", "Catering kitchen",
+    "Outdoor space", "Bar area", "Sound system", "Valet parking", "City views",
+]
+
+VENUE_STYLES = ["Ballroom", "Loft", "Hall", "Estate", "Warehouse Space", "Conference Center", "Beach Club", "Ranch"]
+
+CATERER_NOTES = [
+    "Vegan and gluten-free options available",
+    "Halal certified, extensive vegetarian menu",
+    "Family recipes, customizable menus",
+    "Farm-to-table, nut-free kitchen",
+    None,
+]
+
+VENUE_COLUMNS = (
+    "id", "name", "location", "address", "capacity_min", "capacity_max", "base_room_rental_fee", "hourly_rate",
+    "includes_catering", "supported_cuisines_if_included", "amenities", "description", "is_active",
+)
+
+CATERER_COLUMNS = (
+    "id", "name", "location", "address", "supported_cuisines", "base_price_per_guest", "service_fee_flat",
+    "tax_rate_percent", "min_guests", "max_guests", "notes", "is_active",
+)
+
+AVAILABILITY_COLUMNS = ("date", "is_available", "booking_id", "notes")
+
+_NAMESPACE = uuid.UUID("6f1d9a4e-2c51-4c3e-9a57-5b0c2f1f9e10")
+
+
+def row_id(seed: int, kind: str, index: int) -> uuid.UUID:
+    """Stable id of the `index`-th generated row of `kind`, so bookings can
+    refer to providers without keeping them in memory."""
+    return uuid.uuid5(_NAMESPACE, f"{seed}:{kind}:{index}")
+
+
+def cities(providers: int) -> List[str]:
+    extra = max(0, providers // PROVIDERS_PER_CITY - len(SUPPORTED_LOCATIONS))
+    return list(SUPPORTED_LOCATIONS) + [f"City {i:04d}" for i in range(extra)]
+
+
+def _city_details(city: str, rng: random.Random) -> Tuple[str, Decimal]:
+    if city in CITY_DETAILS:
+        return CITY_DETAILS[city]
+    return rng.choice(["CA", "NY", "TX", "IL", "WA", "FL"]), Decimal(rng.randint(600, 1050)) / 100
+
+
+def _address(rng: random.Random, city: str, state: str) -> str:
+    return f"{rng.randint(1, 9999)} {rng.choice(STREETS)}, {city}, {state} {rng.randint(10000, 99999)}"
+
+
+def venue_records(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(f"{seed}:venues")
+    locations = cities(count)
+    for i in range(count):
+        city = locations[i % len(locations)]
+        state, _ = _city_details(city, rng)
+        capacity_min = rng.choice([20, 30, 40, 50, 60, 80, 100, 150])
+        includes_catering = rng.random() < 0.3
+        yield {
+            "id": row_id(seed, "venue", i),
+            "name": f"{city} {rng.choice(VENUE_STYLES)} {i:07d}",
+            "location": city,
+            "address": _address(rng, city, state),
+            "capacity_min": capacity_min,
+            "capacity_max": capacity_min + rng.choice([50, 100, 150, 200, 300, 450]),
+            "base_room_rental_fee": Decimal(rng.randint(15, 90) * 100),
+            "hourly_rate": Decimal(rng.randint(10, 50) * 10) if rng.random() < 0.9 else None,
+            "includes_catering": includes_catering,
+            "supported_cuisines_if_included": rng.sample(SUPPORTED_CUISINES, 3) if includes_catering else None,
+            "amenities": rng.sample(AMENITIES, rng.randint(3, 6)),
+            "description": f"Event space in {city}",
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def caterer_records(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(f"{seed}:caterers")
+    locations = cities(count)
+    for i in range(count):
+        city = locations[i % len(locations)]
+        state, tax_rate = _city_details(city, rng)
+        min_guests = rng.choice([20, 25, 30, 35, 40, 50])
+        yield {
+            "id": row_id(seed, "caterer", i),
+            "name": f"Caterer {i:07d}",
+            "location": city,
+            "address": _address(rng, city, state),
+            "supported_cuisines": rng.sample(SUPPORTED_CUISINES, rng.randint(1, 4)),
+            "base_price_per_guest": Decimal(rng.randint(4500, 9500)) / 100,
+            "service_fee_flat": Decimal(rng.randint(6, 14) * 50),
+            "tax_rate_percent": tax_rate,
+            "min_guests": min_guests,
+            "max_guests": min_guests + rng.choice([100, 150, 200, 250, 350, 450]),
+            "notes": rng.choice(CATERER_NOTES),
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def client_ids(providers: int, seed: int = 42) -> List[uuid.UUID]:
+    return [row_id(seed, "client", i) for i in range(max(1, providers // 1000))]
+
+
+def booking_records(providers: int, blocked: Dict[str, List[Tuple]], seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Bookings, one at a time. The calendar slots they and the maintenance
+    blocks hold go to `blocked[kind]` as `(provider index, day, booking
+    index or None)`; the lists are complete once the generator is exhausted.
+
+    Each provider's next free day only moves forward, so no two slots ever
+    claim the same provider and date. Cancelled bookings hold nothing.
+    """
+    rng = random.Random(f"{seed}:calendar")
+    clients = client_ids(providers, seed)
+    next_free = {kind: [rng.randrange(365) for _ in range(providers)] for kind in blocked}
+
+    def claim(kind: str, index: int, day: int, booking: Optional[int]) -> None:
+        next_free[kind][index] = day + 1
+        blocked[kind].append((index, day, booking))
+
+    for i in range(providers):
+        venue = rng.randrange(providers)
+        caterer = rng.randrange(providers) if rng.random() < 0.8 else None
+        day = next_free["venue"][venue]
+        if caterer is not None:
+            day = max(day, next_free["caterer"][caterer])
+        day += rng.randint(0, 20)
+        status = rng.choices(["confirmed", "completed", "pending", "cancelled"], [50, 30, 15, 5])[0]
+        guests = rng.randint(20, 300)
+        venue_cost = Decimal(rng.randint(15, 120) * 100)
+        catering_cost = Decimal(guests * rng.randint(50, 110)) if caterer is not None else None
+        if status != "cancelled":
+            claim("venue", venue, day, i)
+            if caterer is not None:
+                claim("caterer", caterer, day, i)
+        yield {
+            "id": row_id(seed, "booking", i),
+            "client_id": clients[i % len(clients)],
+            "venue_id": row_id(seed, "venue", venue),
+            "caterer_id": row_id(seed, "caterer", caterer) if caterer is not None else None,
+            "event_date": START_DATE + timedelta(days=day),
+            "number_of_guests": guests,
+            "event_type": rng.choice(["wedding", "corporate", "birthday", "conference"]),
+            "cuisine_preferences": rng.sample(SUPPORTED_CUISINES, rng.randint(0, 2)) or None,
+            "special_requirements": None,
+            "status": status,
+            "venue_cost": venue_cost,
+            "catering_cost": catering_cost,
+            "total_cost": venue_cost + (catering_cost or 0),
+        }
+
+    for kind in blocked:
+        for _ in range(providers // 2):
+            index = rng.randrange(providers)
+            claim(kind, index, next_free[kind][index] + rng.randint(0, 30), None)
+
+
+def availability_records(kind: str, slots: List[Tuple], seed: int = 42) -> Iterator[Tuple]:
+    """`{kind}_availability` rows, in `(provider id,) + AVAILABILITY_COLUMNS` order."""
+    for index, day, booking in slots:
+        yield (
+            row_id(seed, kind, index), START_DATE + timedelta(days=day), False,
+            row_id(seed, "booking", booking) if booking is not None else None,
+            "Maintenance" if booking is None else None,
+        )
+
+
+async def load(scale: int, seed: int, replace: bool) -> None:
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        async with conn.transaction():
+            if replace:
+                await conn.execute("TRUNCATE venues, caterers CASCADE")
+
+            started = time.perf_counter()
+            await conn.executemany(
+                "INSERT INTO users (id, email, full_name, user_type) VALUES ($1, $2, $3, 'client') "
+                "ON CONFLICT DO NOTHING",
+                [(c, f"client-{seed}-{i}@example.com", f"Synthetic Client {i}") for i, c in enumerate(client_ids(scale, seed))]
+            )
+            await conn.copy_records_to_table(
+                "venues", columns=VENUE_COLUMNS,
+                records=(tuple(row[c] for c in VENUE_COLUMNS) for row in venue_records(scale, seed))
+            )
+            await conn.copy_records_to_table(
+                "caterers", columns=CATERER_COLUMNS,
+                records=(tuple(row[c] for c in CATERER_COLUMNS) for row in caterer_records(scale, seed))
+            )
+            print(f"providers    {2 * scale:>10,} rows {time.perf_counter() - started:8.2f}s")
+
+            started = time.perf_counter()
+            blocked: Dict[str, List[Tuple]] = {"venue": [], "caterer": []}
+            await conn.copy_records_to_table(
+                "bookings", columns=BOOKING_IMPORT_COLUMNS,
+                records=(tuple(row[c] for c in BOOKING_IMPORT_COLUMNS) for row in booking_records(scale, blocked, seed))
+            )
+            print(f"bookings     {scale:>10,} rows {time.perf_counter() - started:8.2f}s")
+
+            started = time.perf_counter()
+            for kind, slots in blocked.items():
+                table = f"{kind}_availability"
+                trigger = f"notify_{kind}_availability_changed"
+                await conn.execute(f"ALTER TABLE {table} DISABLE TRIGGER {trigger}")
+                await conn.copy_records_to_table(
+                    table, columns=(f"{kind}_id",) + AVAILABILITY_COLUMNS,
+                    records=availability_records(kind, slots, seed)
+                )
+                await conn.execute(f"ALTER TABLE {table} ENABLE TRIGGER {trigger}")
+                await conn.execute(
+                    "SELECT pg_notify('availability_changed', json_build_object('kind', $1::text, 'reload', TRUE)::text)",
+                    kind
+                )
+            print(f"availability {sum(map(len, blocked.values())):>10,} rows {time.perf_counter() - started:8.2f}s")
+
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES, key=SCALES.get), default="1k")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--replace", action="store_true", help="truncate the provider tables first")
+    args = parser.parse_args()
+    asyncio.run(load(SCALES[args.scale], args.seed, args.replace))
@@ -0,0 +1,128 @@
+"""Throughput of /plan-event as the number of uvicorn workers grows.
+
+Starts the API once per worker count against the Postgres at DATABASE_URL
+(seeded with database/seed_data.sql), drives it from several client
+processes so the load generator is not the bottleneck, and reports
+requests/second and scaling efficiency relative to one worker:
+
+    python -m benchmarks.worker_scaling --workers 1 2 4 --duration 20 --db-max-connections 80
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from typing import Tuple
+
+import httpx
+
+from app.config import SUPPORTED_CUISINES, SUPPORTED_LOCATIONS
+
+
+def scenario(i: int) -> dict:
+    return {
+        "event_date": f"2025-{6 + i % 6:02d}-{1 + i % 28:02d}",
+        "location": SUPPORTED_LOCATIONS[i % len(SUPPORTED_LOCATIONS)],
+        "number_of_guests": 40 + (i * 37) % 260,
+        "cuisine_preferences": [SUPPORTED_CUISINES[i % len(SUPPORTED_CUISINES)]],
+        "needs_event_room": i % 3 != 0,
+    }
+
+
+async def drive(base_url: str, seed: int, concurrency: int, duration: float) -> Tuple[int, int]:
+    done = errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def loop(worker: int) -> None:
+            nonlocal done, errors
+            i = seed * 100003 + worker * 1009
+            while time.perf_counter() < deadline:
+                response = await client.post("/plan-event", json=scenario(i))
+                i += 1
+                if response.status_code == 200:
+                    done += 1
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(loop(w) for w in range(concurrency)))
+    return done, errors
+
+
+def client_process(base_url: str, seed: int, concurrency: int, duration: float, results) -> None:
+    results.put(asyncio.run(drive(base_url, seed, concurrency, duration)))
+
+
+def wait_until_healthy(base_url: str, timeout: float = 60) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=2).json().get("status") == "healthy":
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"API at {base_url} did not become healthy within {timeout:g}s")
+
+
+def measure(workers: int, args) -> Tuple[float, int]:
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers))
+    if args.db_max_connections:
+        env["DB_MAX_CONNECTIONS"] = str(args.db_max_connections)
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port),
+         "--workers", str(workers), "--no-access-log", "--log-level", "warning"],
+        env=env
+    )
+    try:
+        wait_until_healthy(base_url)
+        # Warm every worker's code paths before timing.
+        asyncio.run(drive(base_url, 0, args.concurrency, 2))
+
+        results = multiprocessing.Queue()
+        clients = [
+            multiprocessing.Process(
+                target=client_process,
+                args=(base_url, seed + 1, args.concurrency, args.duration, results)
+            )
+            for seed in range(args.clients)
+        ]
+        for process in clients:
+            process.start()
+        totals = [results.get() for _ in clients]
+        for process in clients:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    done = sum(t[0] for t in totals)
+    errors = sum(t[1] for t in totals)
+    return done / args.duration, errors
+
+
+def main(args) -> None:
+    baseline = None
+    for workers in args.workers:
+        throughput, errors = measure(workers, args)
+        baseline = baseline or throughput / workers
+        efficiency = throughput / (baseline * workers)
+        print(
+            f"workers={workers:<3} {throughput:9.1f} req/s  "
+            f"speedup={throughput / baseline:5.2f}x  efficiency={efficiency:6.1%}  errors={errors}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--clients", type=int, default=4, help="load generator processes")
+    parser.add_argument("--concurrency", type=int, default=32, help="in-flight requests per client")
+    parser.add_argument("--port", type=int, default=8123)
+    parser.add_argument("--db-max-connections", type=int, default=None)
+    main(parser.parse_args())
@@ -0,0 +1,4 @@
+#!/bin/sh
+# Lets the streaming replica in docker-compose.replica.yml connect.
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -138,6 +138,22 @@ CREATE TABLE reviews (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Per-provider booking and review aggregates, maintained by the
+-- statement-level triggers below so reads never join bookings or reviews.
+CREATE TABLE venue_stats (
+    venue_id UUID PRIMARY KEY REFERENCES venues(id) ON DELETE CASCADE,
+    booking_count BIGINT NOT NULL DEFAULT 0,
+    rating_count BIGINT NOT NULL DEFAULT 0,
+    rating_sum BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE caterer_stats (
+    caterer_id UUID PRIMARY KEY REFERENCES caterers(id) ON DELETE CASCADE,
+    booking_count BIGINT NOT NULL DEFAULT 0,
+    rating_count BIGINT NOT NULL DEFAULT 0,
+    rating_sum BIGINT NOT NULL DEFAULT 0
+);
+
 -- Pricing history (for analytics and dynamic pricing)
 CREATE TABLE pricing_history (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -151,13 +167,17 @@ CREATE TABLE pricing_history (
 );
 
 -- Indexes for performance
-CREATE INDEX idx_venues_location ON venues(location);
+-- The search statements (app/statements.py) filter active rows on
+-- LOWER(location) = $1 and a guest count inside [min, max]. These partial
+-- indexes have exactly that shape: equality on the location expression,
+-- the max bound as the range condition, the min bound checked in the index.
+CREATE INDEX idx_venues_active_location_capacity
+    ON venues(LOWER(location), capacity_max, capacity_min) WHERE is_active = TRUE;
 CREATE INDEX idx_venues_capacity ON venues(capacity_min, capacity_max);
-CREATE INDEX idx_venues_active ON venues(is_active);
 
-CREATE INDEX idx_caterers_location ON caterers(location);
+CREATE INDEX idx_caterers_active_location_capacity
+    ON caterers(LOWER(location), max_guests, min_guests) WHERE is_active = TRUE;
 CREATE INDEX idx_caterers_capacity ON caterers(min_guests, max_guests);
-CREATE INDEX idx_caterers_active ON caterers(is_active);
 CREATE INDEX idx_caterers_cuisines ON caterers USING GIN(supported_cuisines);
 
 CREATE INDEX idx_bookings_client ON bookings(client_id);
@@ -169,6 +189,8 @@ CREATE INDEX idx_bookings_reference ON bookings(booking_reference);
 
 CREATE INDEX idx_venue_availability_date ON venue_availability(venue_id, date);
 CREATE INDEX idx_caterer_availability_date ON caterer_availability(caterer_id, date);
+CREATE INDEX idx_venue_availability_blocked ON venue_availability(venue_id, date) WHERE is_available = FALSE;
+CREATE INDEX idx_caterer_availability_blocked ON caterer_availability(caterer_id, date) WHERE is_available = FALSE;
 
 CREATE INDEX idx_documents_booking ON documents(booking_id);
 CREATE INDEX idx_documents_type ON documents(document_type);
@@ -197,6 +219,200 @@ CREATE TRIGGER update_caterers_updated_at BEFORE UPDATE ON caterers
 CREATE TRIGGER update_bookings_updated_at BEFORE UPDATE ON bookings
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- Catalog change notifications (consumed by the API's in-process catalog cache)
+CREATE OR REPLACE FUNCTION notify_catalog_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('catalog_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER notify_venues_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON venues
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_change();
+
+CREATE TRIGGER notify_caterers_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON caterers
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_change();
+
+-- Availability change notifications (consumed by the API's calendar bitmap index).
+-- TG_ARGV[0] is the provider kind: 'venue' or 'caterer'.
+CREATE OR REPLACE FUNCTION notify_availability_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_LEVEL = 'STATEMENT' THEN
+        PERFORM pg_notify('availability_changed', json_build_object(
+            'kind', TG_ARGV[0], 'reload', TRUE)::text);
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_notify('availability_changed', json_build_object(
+            'kind', TG_ARGV[0],
+            'id', to_jsonb(OLD) ->> (TG_ARGV[0] || '_id'),
+            'date', OLD.date,
+            'available', TRUE)::text);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_notify('availability_changed', json_build_object(
+            'kind', TG_ARGV[0],
+            'id', to_jsonb(NEW) ->> (TG_ARGV[0] || '_id'),
+            'date', NEW.date,
+            'available', NEW.is_available IS DISTINCT FROM FALSE)::text);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER notify_venue_availability_changed AFTER INSERT OR UPDATE OR DELETE ON venue_availability
+    FOR EACH ROW EXECUTE FUNCTION notify_availability_change('venue');
+
+CREATE TRIGGER notify_venue_availability_truncated AFTER TRUNCATE ON venue_availability
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_availability_change('venue');
+
+CREATE TRIGGER notify_caterer_availability_changed AFTER INSERT OR UPDATE OR DELETE ON caterer_availability
+    FOR EACH ROW EXECUTE FUNCTION notify_availability_change('caterer');
+
+CREATE TRIGGER notify_caterer_availability_truncated AFTER TRUNCATE ON caterer_availability
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_availability_change('caterer');
+
+-- Provider stats maintenance. Each call adds `direction` times the given rows to
+-- venue_stats/caterer_stats: a row with a NULL rating is a booking, any
+-- other row is a review. Rows are grouped per provider first, so a COPY of
+-- many bookings costs one upsert per provider, and upserts run in id order
+-- so concurrent statements cannot deadlock on the stats rows.
+CREATE OR REPLACE FUNCTION add_provider_stats(
+    venue_ids UUID[], caterer_ids UUID[], ratings INTEGER[], direction INTEGER
+)
+RETURNS VOID AS $$
+    WITH changed AS (
+        SELECT * FROM unnest(venue_ids, caterer_ids, ratings) AS c(venue_id, caterer_id, rating)
+    ), venue_rows AS (
+        INSERT INTO venue_stats AS s (venue_id, booking_count, rating_count, rating_sum)
+        SELECT venue_id,
+               direction * COUNT(*) FILTER (WHERE rating IS NULL),
+               direction * COUNT(rating),
+               direction * COALESCE(SUM(rating), 0)
+        FROM changed
+        WHERE venue_id IS NOT NULL
+        GROUP BY venue_id
+        ORDER BY venue_id
+        ON CONFLICT (venue_id) DO UPDATE SET
+            booking_count = s.booking_count + EXCLUDED.booking_count,
+            rating_count = s.rating_count + EXCLUDED.rating_count,
+            rating_sum = s.rating_sum + EXCLUDED.rating_sum
+    )
+    INSERT INTO caterer_stats AS s (caterer_id, booking_count, rating_count, rating_sum)
+    SELECT caterer_id,
+           direction * COUNT(*) FILTER (WHERE rating IS NULL),
+           direction * COUNT(rating),
+           direction * COALESCE(SUM(rating), 0)
+    FROM changed
+    WHERE caterer_id IS NOT NULL
+    GROUP BY caterer_id
+    ORDER BY caterer_id
+    ON CONFLICT (caterer_id) DO UPDATE SET
+        booking_count = s.booking_count + EXCLUDED.booking_count,
+        rating_count = s.rating_count + EXCLUDED.rating_count,
+        rating_sum = s.rating_sum + EXCLUDED.rating_sum;
+$$ language 'sql';
+
+-- Transition tables need one trigger per event. Updates only count rows
+-- whose provider (or, for reviews, rating) actually changed.
+CREATE OR REPLACE FUNCTION maintain_booking_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+    moved RECORD;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(venue_id) AS venues, array_agg(caterer_id) AS caterers INTO moved FROM new_rows;
+        PERFORM add_provider_stats(moved.venues, moved.caterers, NULL, 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(venue_id) AS venues, array_agg(caterer_id) AS caterers INTO moved FROM old_rows;
+        PERFORM add_provider_stats(moved.venues, moved.caterers, NULL, -1);
+    ELSE
+        SELECT array_agg(o.venue_id) AS old_venues, array_agg(o.caterer_id) AS old_caterers,
+               array_agg(n.venue_id) AS new_venues, array_agg(n.caterer_id) AS new_caterers
+        INTO moved
+        FROM old_rows o JOIN new_rows n ON n.id = o.id
+        WHERE o.venue_id IS DISTINCT FROM n.venue_id
+           OR o.caterer_id IS DISTINCT FROM n.caterer_id;
+        PERFORM add_provider_stats(moved.old_venues, moved.old_caterers, NULL, -1);
+        PERFORM add_provider_stats(moved.new_venues, moved.new_caterers, NULL, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER count_inserted_bookings AFTER INSERT ON bookings
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION maintain_booking_stats();
+
+CREATE TRIGGER count_updated_bookings AFTER UPDATE ON bookings
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION maintain_booking_stats();
+
+CREATE TRIGGER count_deleted_bookings AFTER DELETE ON bookings
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION maintain_booking_stats();
+
+CREATE OR REPLACE FUNCTION maintain_review_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+    moved RECORD;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(venue_id) AS venues, array_agg(caterer_id) AS caterers,
+               array_agg(rating) AS ratings
+        INTO moved FROM new_rows;
+        PERFORM add_provider_stats(moved.venues, moved.caterers, moved.ratings, 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(venue_id) AS venues, array_agg(caterer_id) AS caterers,
+               array_agg(rating) AS ratings
+        INTO moved FROM old_rows;
+        PERFORM add_provider_stats(moved.venues, moved.caterers, moved.ratings, -1);
+    ELSE
+        SELECT array_agg(o.venue_id) AS old_venues, array_agg(o.caterer_id) AS old_caterers,
+               array_agg(o.rating) AS old_ratings,
+               array_agg(n.venue_id) AS new_venues, array_agg(n.caterer_id) AS new_caterers,
+               array_agg(n.rating) AS new_ratings
+        INTO moved
+        FROM old_rows o JOIN new_rows n ON n.id = o.id
+        WHERE o.venue_id IS DISTINCT FROM n.venue_id
+           OR o.caterer_id IS DISTINCT FROM n.caterer_id
+           OR o.rating IS DISTINCT FROM n.rating;
+        PERFORM add_provider_stats(moved.old_venues, moved.old_caterers, moved.old_ratings, -1);
+        PERFORM add_provider_stats(moved.new_venues, moved.new_caterers, moved.new_ratings, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER count_inserted_reviews AFTER INSERT ON reviews
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION maintain_review_stats();
+
+CREATE TRIGGER count_updated_reviews AFTER UPDATE ON reviews
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION maintain_review_stats();
+
+CREATE TRIGGER count_deleted_reviews AFTER DELETE ON reviews
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION maintain_review_stats();
+
+-- Recomputes both stats tables from bookings and reviews: once on an
+-- existing database, or after TRUNCATE or a load with triggers disabled.
+--     SELECT rebuild_provider_stats();
+CREATE OR REPLACE FUNCTION rebuild_provider_stats()
+RETURNS VOID AS $$
+    LOCK TABLE bookings, reviews IN SHARE MODE;
+    DELETE FROM venue_stats;
+    DELETE FROM caterer_stats;
+    SELECT add_provider_stats(array_agg(venue_id), array_agg(caterer_id), NULL, 1) FROM bookings;
+    SELECT add_provider_stats(array_agg(venue_id), array_agg(caterer_id), array_agg(rating), 1) FROM reviews;
+$$ language 'sql';
+
 -- Function to generate booking reference
 CREATE OR REPLACE FUNCTION generate_booking_reference()
 RETURNS TRIGGER AS $$
@@ -215,24 +431,22 @@ CREATE TRIGGER set_booking_reference BEFORE INSERT ON bookings
 CREATE VIEW active_venues AS
 SELECT 
     v.*,
-    COUNT(DISTINCT b.id) as total_bookings,
-    AVG(r.rating) as average_rating
+    COALESCE(s.booking_count, 0) as total_bookings,
+    s.rating_sum::numeric / NULLIF(s.rating_count, 0) as average_rating,
+    COALESCE(s.rating_count, 0) as review_count
 FROM venues v
-LEFT JOIN bookings b ON v.id = b.venue_id
-LEFT JOIN reviews r ON v.id = r.venue_id
-WHERE v.is_active = TRUE
-GROUP BY v.id;
+LEFT JOIN venue_stats s ON s.venue_id = v.id
+WHERE v.is_active = TRUE;
 
 CREATE VIEW active_caterers AS
 SELECT 
     c.*,
-    COUNT(DISTINCT b.id) as total_bookings,
-    AVG(r.rating) as average_rating
+    COALESCE(s.booking_count, 0) as total_bookings,
+    s.rating_sum::numeric / NULLIF(s.rating_count, 0) as average_rating,
+    COALESCE(s.rating_count, 0) as review_count
 FROM caterers c
-LEFT JOIN bookings b ON c.id = b.caterer_id
-LEFT JOIN reviews r ON c.id = r.caterer_id
-WHERE c.is_active = TRUE
-GROUP BY c.id;
+LEFT JOIN caterer_stats s ON s.caterer_id = c.id
+WHERE c.is_active = TRUE;
 
 CREATE VIEW upcoming_bookings AS
 SELECT 
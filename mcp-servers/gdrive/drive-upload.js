@@ -0,0 +1,144 @@
+const fs = require('fs');
+
+const DRIVE_UPLOAD_URL = 'https://www.googleapis.com/upload/drive/v3/files';
+const TOKEN_URL = 'https://oauth2.googleapis.com/token';
+
+// Drive requires every chunk but the last to be a multiple of 256 KiB.
+const CHUNK_QUANTUM = 256 * 1024;
+const DEFAULT_CHUNK_SIZE = 32 * CHUNK_QUANTUM;
+
+function checkChunkSize(chunkSize, name = 'chunkSize') {
+  if (!Number.isInteger(chunkSize) || chunkSize <= 0 || chunkSize % CHUNK_QUANTUM !== 0) {
+    throw new Error(`${name} must be a positive multiple of ${CHUNK_QUANTUM} bytes`);
+  }
+}
+
+// Bytes of the file Drive has stored, from the Range header of a 308.
+function storedBytes(response) {
+  const range = /^bytes=0-(\d+)$/.exec(response.headers.get('range') || '');
+  return range ? Number(range[1]) + 1 : 0;
+}
+
+// Streams `source` (any async-iterable of Buffers, e.g. an HTTP request)
+// into a Drive resumable upload session. One chunk is held in memory at a
+// time and the source is not read while a chunk is being sent, so memory
+// per upload is bounded by `chunkSize` however large the file is.
+async function uploadStream(source, { name, mimeType, folderId }, {
+  accessToken,
+  uploadUrl = DRIVE_UPLOAD_URL,
+  chunkSize = DEFAULT_CHUNK_SIZE
+}) {
+  checkChunkSize(chunkSize);
+
+  const session = await fetch(`${uploadUrl}?uploadType=resumable&fields=id,name,mimeType,size,webViewLink`, {
+    method: 'POST',
+    headers: {
+      Authorization: `Bearer ${accessToken}`,
+      'Content-Type': 'application/json; charset=UTF-8',
+      'X-Upload-Content-Type': mimeType
+    },
+    body: JSON.stringify({ name, mimeType, parents: folderId ? [folderId] : undefined })
+  });
+  if (!session.ok) {
+    throw new Error(`Drive refused the upload session: ${session.status} ${await session.text()}`);
+  }
+  const sessionUrl = session.headers.get('location');
+
+  const chunk = Buffer.allocUnsafe(chunkSize);
+  let filled = 0;
+  let sent = 0;
+
+  // Sends the first `length` bytes of `chunk`, which start at byte `sent`
+  // of the file. A 308 says in its Range header how much Drive has stored;
+  // the rest of the chunk is sent again from there.
+  const send = async (length, total) => {
+    const start = sent;
+    const end = start + length;
+    let stalled = false;
+    for (;;) {
+      const range = sent < end ? `bytes ${sent}-${end - 1}/${total}` : `bytes */${total}`;
+      const response = await fetch(sessionUrl, {
+        method: 'PUT',
+        headers: { 'Content-Length': String(end - sent), 'Content-Range': range },
+        body: chunk.subarray(sent - start, length)
+      });
+      if (response.status !== 308) {
+        if (total === '*') {
+          throw new Error(`Drive rejected a chunk: ${response.status} ${await response.text()}`);
+        }
+        if (!response.ok) {
+          throw new Error(`Drive rejected the upload: ${response.status} ${await response.text()}`);
+        }
+        sent = end;
+        return response.json();
+      }
+
+      const stored = storedBytes(response);
+      if (stored < start || stored > end) {
+        throw new Error(`Drive reports ${stored} bytes stored while bytes ${start}-${end - 1} were sent`);
+      }
+      if (stored === sent && stalled) {
+        throw new Error(`Drive stopped storing the upload at byte ${stored}`);
+      }
+      stalled = stored === sent;
+      sent = stored;
+      if (total === '*' && sent === end) {
+        return null;
+      }
+    }
+  };
+
+  for await (const data of source) {
+    let offset = 0;
+    while (offset < data.length) {
+      const copied = data.copy(chunk, filled, offset);
+      filled += copied;
+      offset += copied;
+      if (filled === chunkSize) {
+        await send(filled, '*');
+        filled = 0;
+      }
+    }
+  }
+
+  const file = await send(filled, sent + filled);
+  return { file, sizeBytes: sent };
+}
+
+// Access token for the Drive API. Uses the credentials file written by the
+// gdrive MCP server's auth flow and refreshes it when it has expired.
+async function driveAccessToken({
+  credentialsPath,
+  clientId,
+  clientSecret,
+  tokenUrl = TOKEN_URL
+}) {
+  const credentials = JSON.parse(await fs.promises.readFile(credentialsPath, 'utf8'));
+  if (credentials.access_token && (!credentials.expiry_date || credentials.expiry_date > Date.now() + 60000)) {
+    return credentials.access_token;
+  }
+
+  const response = await fetch(tokenUrl, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+    body: new URLSearchParams({
+      client_id: clientId,
+      client_secret: clientSecret,
+      refresh_token: credentials.refresh_token,
+      grant_type: 'refresh_token'
+    })
+  });
+  if (!response.ok) {
+    throw new Error(`Could not refresh the Drive token: ${response.status} ${await response.text()}`);
+  }
+  const token = await response.json();
+  const refreshed = {
+    ...credentials,
+    access_token: token.access_token,
+    expiry_date: Date.now() + token.expires_in * 1000
+  };
+  await fs.promises.writeFile(credentialsPath, JSON.stringify(refreshed));
+  return refreshed.access_token;
+}
+
+module.exports = { CHUNK_QUANTUM, checkChunkSize, uploadStream, driveAccessToken };
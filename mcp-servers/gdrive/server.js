@@ -1,166 +1,155 @@
 const express = require('express');
 const bodyParser = require('body-parser');
 const cors = require('cors');
-const { spawn } = require('child_process');
+const { McpSessionPool } = require('../shared/session-pool');
+const { checkChunkSize, uploadStream, driveAccessToken } = require('./drive-upload');
 
 const app = express();
 app.use(cors());
-app.use(bodyParser.json());
+
+// JSON is parsed per route: /mcp/upload/stream reads the raw body itself,
+// and a global parser would swallow JSON files before it got to them.
+const json = bodyParser.json();
 
 const GOOGLE_CLIENT_ID = process.env.GOOGLE_CLIENT_ID;
 const GOOGLE_CLIENT_SECRET = process.env.GOOGLE_CLIENT_SECRET;
-
-app.get('/health', (req, res) => {
-  res.json({ status: 'healthy', service: 'mcp-gdrive' });
+const GDRIVE_CREDENTIALS_PATH = process.env.GDRIVE_CREDENTIALS_PATH || '/app/tokens/.gdrive-server-credentials.json';
+const GDRIVE_UPLOAD_URL = process.env.GDRIVE_UPLOAD_URL;
+const UPLOAD_CHUNK_BYTES = parseInt(process.env.UPLOAD_CHUNK_BYTES || String(8 * 1024 * 1024), 10);
+// Checked at startup rather than on the first upload.
+checkChunkSize(UPLOAD_CHUNK_BYTES, 'UPLOAD_CHUNK_BYTES');
+const DOCUMENT_TYPES = ['contract', 'menu', 'floor_plan', 'invoice', 'receipt', 'other'];
+
+// Uploaded files are recorded in `documents` when DATABASE_URL is set.
+const db = process.env.DATABASE_URL
+  ? new (require('pg').Pool)({ connectionString: process.env.DATABASE_URL, max: 4 })
+  : null;
+
+// The MCP server package is installed with the bridge, so npx resolves it
+// locally; it is started once per session rather than once per request.
+const pool = new McpSessionPool({
+  command: 'npx',
+  args: ['--no-install', '@modelcontextprotocol/server-gdrive'],
+  env: {
+    ...process.env,
+    GOOGLE_CLIENT_ID,
+    GOOGLE_CLIENT_SECRET
+  },
+  clientName: 'mcp-gdrive-bridge',
+  size: parseInt(process.env.MCP_POOL_SIZE || '2', 10),
+  requestTimeoutMs: parseInt(process.env.MCP_REQUEST_TIMEOUT_MS || '30000', 10),
+  healthIntervalMs: parseInt(process.env.MCP_HEALTH_INTERVAL_MS || '15000', 10)
 });
 
-app.post('/mcp/upload', async (req, res) => {
-  const { filename, content, mimeType, folderId } = req.body;
-
+async function callTool(res, name, args) {
   try {
-    const mcp = spawn('npx', [
-      '-y',
-      '@modelcontextprotocol/server-gdrive'
-    ], {
-      env: {
-        ...process.env,
-        GOOGLE_CLIENT_ID,
-        GOOGLE_CLIENT_SECRET
-      }
-    });
-
-    const request = {
-      jsonrpc: '2.0',
-      method: 'tools/call',
-      params: {
-        name: 'upload_file',
-        arguments: {
-          filename,
-          content,
-          mimeType: mimeType || 'application/octet-stream',
-          folderId: folderId || null
-        }
-      },
-      id: Date.now()
-    };
-
-    mcp.stdin.write(JSON.stringify(request) + '\n');
-    mcp.stdin.end();
-
-    let output = '';
-    let errorOutput = '';
-
-    mcp.stdout.on('data', (data) => {
-      output += data.toString();
-    });
-
-    mcp.stderr.on('data', (data) => {
-      errorOutput += data.toString();
-    });
-
-    mcp.on('close', (code) => {
-      if (code !== 0) {
-        console.error('MCP Error:', errorOutput);
-        return res.status(500).json({
-          error: 'MCP server error',
-          details: errorOutput
-        });
-      }
-
-      try {
-        const lines = output.trim().split('\n');
-        const response = JSON.parse(lines[lines.length - 1]);
-        res.json(response);
-      } catch (error) {
-        console.error('Parse error:', error.message);
-        res.status(500).json({
-          error: 'Failed to parse MCP response',
-          details: error.message
-        });
-      }
-    });
+    res.json(await pool.callTool(name, args));
   } catch (error) {
-    console.error('Request error:', error);
+    console.error('MCP Error:', error.message);
     res.status(500).json({
-      error: 'Internal server error',
+      error: 'MCP server error',
       details: error.message
     });
   }
+}
+
+app.get('/health', (req, res) => {
+  const sessions = pool.stats();
+  res.json({
+    status: sessions.live > 0 ? 'healthy' : 'degraded',
+    service: 'mcp-gdrive',
+    sessions
+  });
 });
 
-app.post('/mcp/list', async (req, res) => {
-  const { folderId, query } = req.body;
+app.post('/mcp/upload', json, (req, res) => {
+  const { filename, content, mimeType, folderId } = req.body;
+  return callTool(res, 'upload_file', {
+    filename,
+    content,
+    mimeType: mimeType || 'application/octet-stream',
+    folderId: folderId || null
+  });
+});
 
-  try {
-    const mcp = spawn('npx', [
-      '-y',
-      '@modelcontextprotocol/server-gdrive'
-    ], {
-      env: {
-        ...process.env,
-        GOOGLE_CLIENT_ID,
-        GOOGLE_CLIENT_SECRET
-      }
-    });
+// Streams the raw request body to Drive; the body is the file itself and
+// Content-Type is its MIME type. Metadata comes in the query string:
+// filename (required), folderId, documentType, bookingId, venueId,
+// catererId, uploadedBy.
+app.post('/mcp/upload/stream', async (req, res) => {
+  const { filename, folderId, bookingId, venueId, catererId, uploadedBy } = req.query;
+  const documentType = req.query.documentType || 'other';
+  const mimeType = req.headers['content-type'] || 'application/octet-stream';
+
+  if (!filename) {
+    return res.status(400).json({ error: 'filename is required' });
+  }
+  if (!DOCUMENT_TYPES.includes(documentType)) {
+    return res.status(400).json({ error: `documentType must be one of ${DOCUMENT_TYPES.join(', ')}` });
+  }
 
-    const request = {
-      jsonrpc: '2.0',
-      method: 'tools/call',
-      params: {
-        name: 'list_files',
-        arguments: {
-          folderId: folderId || null,
-          query: query || null
-        }
-      },
-      id: Date.now()
-    };
-
-    mcp.stdin.write(JSON.stringify(request) + '\n');
-    mcp.stdin.end();
-
-    let output = '';
-    let errorOutput = '';
-
-    mcp.stdout.on('data', (data) => {
-      output += data.toString();
+  try {
+    const accessToken = await driveAccessToken({
+      credentialsPath: GDRIVE_CREDENTIALS_PATH,
+      clientId: GOOGLE_CLIENT_ID,
+      clientSecret: GOOGLE_CLIENT_SECRET
     });
-
-    mcp.stderr.on('data', (data) => {
-      errorOutput += data.toString();
+    const { file, sizeBytes } = await uploadStream(req, { name: filename, mimeType, folderId }, {
+      accessToken,
+      uploadUrl: GDRIVE_UPLOAD_URL,
+      chunkSize: UPLOAD_CHUNK_BYTES
     });
 
-    mcp.on('close', (code) => {
-      if (code !== 0) {
-        console.error('MCP Error:', errorOutput);
-        return res.status(500).json({
-          error: 'MCP server error',
-          details: errorOutput
-        });
-      }
-
-      try {
-        const lines = output.trim().split('\n');
-        const response = JSON.parse(lines[lines.length - 1]);
-        res.json(response);
-      } catch (error) {
-        console.error('Parse error:', error.message);
-        res.status(500).json({
-          error: 'Failed to parse MCP response',
-          details: error.message
-        });
-      }
+    let documentId = null;
+    if (db) {
+      const { rows } = await db.query(
+        `INSERT INTO documents (
+           booking_id, venue_id, caterer_id, document_type, document_name,
+           google_drive_file_id, google_drive_url, file_size_bytes, mime_type, uploaded_by
+         ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+         RETURNING id`,
+        [bookingId || null, venueId || null, catererId || null, documentType, filename,
+          file.id, file.webViewLink || null, sizeBytes, file.mimeType || mimeType, uploadedBy || null]
+      );
+      documentId = rows[0].id;
+    }
+
+    res.status(201).json({
+      document_id: documentId,
+      file_id: file.id,
+      url: file.webViewLink || null,
+      file_size_bytes: sizeBytes,
+      mime_type: file.mimeType || mimeType
     });
   } catch (error) {
-    console.error('Request error:', error);
-    res.status(500).json({
-      error: 'Internal server error',
+    console.error('Upload error:', error.message);
+    req.resume();
+    res.status(502).json({
+      error: 'Upload failed',
       details: error.message
     });
   }
 });
 
-const PORT = process.env.PORT || 3000;
-app.listen(PORT, '0.0.0.0', () => {
-  console.log(`MCP Google Drive HTTP server listening on port ${PORT}`);
+app.post('/mcp/list', json, (req, res) => {
+  const { folderId, query } = req.body;
+  return callTool(res, 'list_files', {
+    folderId: folderId || null,
+    query: query || null
+  });
 });
+
+if (require.main === module) {
+  const PORT = process.env.PORT || 3000;
+  const server = app.listen(PORT, '0.0.0.0', () => {
+    console.log(`MCP Google Drive HTTP server listening on port ${PORT}`);
+  });
+  pool.start();
+
+  process.on('SIGTERM', () => {
+    pool.close();
+    server.close(() => process.exit(0));
+  });
+}
+
+module.exports = { app };
@@ -0,0 +1,139 @@
+const assert = require('node:assert');
+const crypto = require('node:crypto');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { Readable } = require('node:stream');
+const test = require('node:test');
+
+const { CHUNK_QUANTUM, checkChunkSize, uploadStream, driveAccessToken } = require('../drive-upload');
+const { stubDrive } = require('./stub-drive');
+
+// Yields `total` pseudo-random bytes in odd-sized pieces without keeping them.
+async function* generated(total, hash) {
+  let produced = 0;
+  let piece = 0;
+  while (produced < total) {
+    const size = Math.min(total - produced, 1000 + (piece++ * 7919) % 70000);
+    const data = crypto.randomBytes(size);
+    hash.update(data);
+    produced += size;
+    yield data;
+  }
+}
+
+test('streams the file to Drive in bounded chunks', async () => {
+  const { server, state } = await stubDrive();
+  const uploadUrl = `http://127.0.0.1:${server.address().port}/upload`;
+  const sent = crypto.createHash('sha256');
+  const total = 5 * CHUNK_QUANTUM + 12345;
+
+  try {
+    const { file, sizeBytes } = await uploadStream(
+      generated(total, sent),
+      { name: 'contract.pdf', mimeType: 'application/pdf', folderId: 'folder-9' },
+      { accessToken: 'token', uploadUrl, chunkSize: 2 * CHUNK_QUANTUM }
+    );
+
+    assert.strictEqual(sizeBytes, total);
+    assert.strictEqual(file.id, 'file-1');
+    assert.strictEqual(state.received, total);
+    assert.strictEqual(state.hash.digest('hex'), sent.digest('hex'));
+    assert.ok(state.maxChunk <= 2 * CHUNK_QUANTUM);
+    assert.strictEqual(state.chunks.length, 3);
+    assert.ok(state.chunks.at(-1).endsWith(`/${total}`));
+    assert.deepStrictEqual(state.metadata, { name: 'contract.pdf', mimeType: 'application/pdf', parents: ['folder-9'] });
+    assert.strictEqual(state.authorization, 'Bearer token');
+  } finally {
+    server.close();
+  }
+});
+
+test('finalizes files that end on a chunk boundary or are empty', async () => {
+  for (const total of [2 * CHUNK_QUANTUM, 0]) {
+    const { server, state } = await stubDrive();
+    try {
+      const { sizeBytes } = await uploadStream(
+        Readable.from(total ? [Buffer.alloc(total, 1)] : []),
+        { name: 'menu.txt', mimeType: 'text/plain' },
+        { accessToken: 'token', uploadUrl: `http://127.0.0.1:${server.address().port}/upload`, chunkSize: CHUNK_QUANTUM }
+      );
+      assert.strictEqual(sizeBytes, total);
+      assert.strictEqual(state.chunks.at(-1), `bytes */${total}`);
+    } finally {
+      server.close();
+    }
+  }
+});
+
+test('resends the part of a chunk Drive did not store', async () => {
+  const { server, state } = await stubDrive();
+  const uploadUrl = `http://127.0.0.1:${server.address().port}/upload`;
+  const sent = crypto.createHash('sha256');
+  const total = 5 * CHUNK_QUANTUM + 12345;
+  // Half of the first chunk, then nothing once, then the rest; the last
+  // chunk is also stored in two goes.
+  state.keep = [CHUNK_QUANTUM, 0, CHUNK_QUANTUM, 2 * CHUNK_QUANTUM, 100];
+
+  try {
+    const { sizeBytes } = await uploadStream(
+      generated(total, sent),
+      { name: 'contract.pdf', mimeType: 'application/pdf' },
+      { accessToken: 'token', uploadUrl, chunkSize: 2 * CHUNK_QUANTUM }
+    );
+
+    assert.strictEqual(sizeBytes, total);
+    assert.strictEqual(state.received, total);
+    assert.strictEqual(state.hash.digest('hex'), sent.digest('hex'));
+    assert.deepStrictEqual(state.chunks, [
+      `bytes 0-${2 * CHUNK_QUANTUM - 1}/*`,
+      `bytes ${CHUNK_QUANTUM}-${2 * CHUNK_QUANTUM - 1}/*`,
+      `bytes ${CHUNK_QUANTUM}-${2 * CHUNK_QUANTUM - 1}/*`,
+      `bytes ${2 * CHUNK_QUANTUM}-${4 * CHUNK_QUANTUM - 1}/*`,
+      `bytes ${4 * CHUNK_QUANTUM}-${total - 1}/${total}`,
+      `bytes ${4 * CHUNK_QUANTUM + 100}-${total - 1}/${total}`
+    ]);
+  } finally {
+    server.close();
+  }
+});
+
+test('gives up when Drive stores nothing twice in a row', async () => {
+  const { server, state } = await stubDrive();
+  state.keep = [0, 0];
+  try {
+    await assert.rejects(uploadStream(
+      Readable.from([Buffer.alloc(2 * CHUNK_QUANTUM, 1)]),
+      { name: 'menu.txt', mimeType: 'text/plain' },
+      { accessToken: 'token', uploadUrl: `http://127.0.0.1:${server.address().port}/upload`, chunkSize: CHUNK_QUANTUM }
+    ), /stopped storing the upload at byte 0/);
+  } finally {
+    server.close();
+  }
+});
+
+test('accepts only whole multiples of the chunk quantum', () => {
+  checkChunkSize(4 * CHUNK_QUANTUM);
+  for (const size of [0, CHUNK_QUANTUM + 1, NaN, -CHUNK_QUANTUM]) {
+    assert.throws(() => checkChunkSize(size, 'UPLOAD_CHUNK_BYTES'), /UPLOAD_CHUNK_BYTES must be/);
+  }
+});
+
+test('refreshes an expired access token and saves it', async () => {
+  const { server, state } = await stubDrive();
+  const credentialsPath = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'gdrive-')), 'credentials.json');
+  fs.writeFileSync(credentialsPath, JSON.stringify({ access_token: 'old', refresh_token: 'r1', expiry_date: Date.now() - 1 }));
+
+  try {
+    const token = await driveAccessToken({
+      credentialsPath, clientId: 'id', clientSecret: 'secret',
+      tokenUrl: `http://127.0.0.1:${server.address().port}/token`
+    });
+    assert.strictEqual(token, 'fresh');
+    assert.strictEqual(state.refreshed.get('refresh_token'), 'r1');
+    assert.strictEqual(JSON.parse(fs.readFileSync(credentialsPath)).access_token, 'fresh');
+    assert.strictEqual(await driveAccessToken({ credentialsPath }), 'fresh');
+  } finally {
+    server.close();
+  }
+});
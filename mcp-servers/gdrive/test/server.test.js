@@ -0,0 +1,56 @@
+const assert = require('node:assert');
+const crypto = require('node:crypto');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const test = require('node:test');
+
+const { CHUNK_QUANTUM } = require('../drive-upload');
+const { stubDrive } = require('./stub-drive');
+
+// The bridge reads its settings when it is loaded, so it is loaded once the
+// stub Drive is listening.
+async function bridge(drive) {
+  const credentialsPath = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'gdrive-')), 'credentials.json');
+  fs.writeFileSync(credentialsPath, JSON.stringify({ access_token: 'token' }));
+  process.env.GDRIVE_CREDENTIALS_PATH = credentialsPath;
+  process.env.GDRIVE_UPLOAD_URL = `http://127.0.0.1:${drive.address().port}/upload`;
+  process.env.UPLOAD_CHUNK_BYTES = String(CHUNK_QUANTUM);
+  delete process.env.DATABASE_URL;
+
+  const { app } = require('../server');
+  return new Promise((resolve) => {
+    const server = app.listen(0, '127.0.0.1', () => resolve(server));
+  });
+}
+
+test('streams JSON files to Drive untouched by the JSON parser', async () => {
+  const { server: drive, state } = await stubDrive();
+  let server;
+
+  try {
+    server = await bridge(drive);
+    const url = `http://127.0.0.1:${server.address().port}/mcp/upload/stream`;
+    // One small enough for a JSON parser to read, one over its 100 KB limit.
+    for (const items of [3, 20000]) {
+      const body = Buffer.from(JSON.stringify({ menu: Array.from({ length: items }, (_, i) => `dish ${i}`) }));
+      Object.assign(state, { received: 0, hash: crypto.createHash('sha256') });
+
+      const response = await fetch(`${url}?filename=menu.json&documentType=menu`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body
+      });
+
+      assert.strictEqual(response.status, 201);
+      const uploaded = await response.json();
+      assert.strictEqual(uploaded.file_size_bytes, body.length);
+      assert.strictEqual(uploaded.mime_type, 'application/json');
+      assert.strictEqual(state.hash.digest('hex'), crypto.createHash('sha256').update(body).digest('hex'));
+    }
+    assert.deepStrictEqual(state.metadata, { name: 'menu.json', mimeType: 'application/json' });
+  } finally {
+    if (server) server.close();
+    drive.close();
+  }
+});
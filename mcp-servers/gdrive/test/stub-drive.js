@@ -0,0 +1,45 @@
+const assert = require('node:assert');
+const crypto = require('node:crypto');
+const http = require('node:http');
+
+// Minimal stand-in for the Drive resumable upload and token endpoints.
+// `state.keep` lists how many bytes of each coming chunk to store; a chunk
+// with no entry left is stored whole.
+function stubDrive() {
+  const state = { chunks: [], hash: crypto.createHash('sha256'), received: 0, maxChunk: 0, keep: [] };
+  const server = http.createServer(async (req, res) => {
+    const body = [];
+    for await (const data of req) body.push(data);
+    const payload = Buffer.concat(body);
+
+    if (req.method === 'POST' && req.url.startsWith('/token')) {
+      state.refreshed = new URLSearchParams(payload.toString());
+      res.setHeader('Content-Type', 'application/json');
+      return res.end(JSON.stringify({ access_token: 'fresh', expires_in: 3600 }));
+    }
+    if (req.method === 'POST') {
+      state.metadata = JSON.parse(payload.toString());
+      state.authorization = req.headers.authorization;
+      res.writeHead(200, { Location: `http://127.0.0.1:${server.address().port}/session/1` });
+      return res.end();
+    }
+    const [, start, end, total] = /bytes (?:(\d+)-(\d+)|\*)\/(\d+|\*)/.exec(req.headers['content-range']);
+    assert.strictEqual(Number(start || state.received), state.received);
+    if (end !== undefined) assert.strictEqual(Number(end) - Number(start) + 1, payload.length);
+    state.chunks.push(req.headers['content-range']);
+    state.maxChunk = Math.max(state.maxChunk, payload.length);
+    const kept = payload.subarray(0, state.keep.length ? state.keep.shift() : payload.length);
+    state.hash.update(kept);
+    state.received += kept.length;
+    if (total === '*' || state.received < Number(total)) {
+      res.writeHead(308, state.received ? { Range: `bytes=0-${state.received - 1}` } : {});
+      return res.end();
+    }
+    res.setHeader('Content-Type', 'application/json');
+    res.end(JSON.stringify({ id: 'file-1', name: state.metadata.name, mimeType: state.metadata.mimeType,
+      size: String(state.received), webViewLink: 'https://drive.example/file-1' }));
+  });
+  return new Promise((resolve) => server.listen(0, '127.0.0.1', () => resolve({ server, state })));
+}
+
+module.exports = { stubDrive };
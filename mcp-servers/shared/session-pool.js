@@ -0,0 +1,242 @@
+const { spawn } = require('child_process');
+const readline = require('readline');
+
+const PROTOCOL_VERSION = '2024-11-05';
+const STDERR_TAIL_BYTES = 4096;
+
+// One long-lived MCP server process spoken to over newline-delimited
+// JSON-RPC on stdin/stdout. Requests are matched to responses by id, so
+// any number can be in flight at once.
+class McpSession {
+  constructor(command, args, env, clientName) {
+    this.command = command;
+    this.args = args;
+    this.env = env;
+    this.clientName = clientName;
+    this.nextId = 0;
+    this.pending = new Map();
+    this.alive = false;
+    this.ready = false;
+    this.stderr = '';
+    this.child = null;
+    this.onExit = null;
+  }
+
+  get inFlight() {
+    return this.pending.size;
+  }
+
+  async start(timeoutMs) {
+    this.child = spawn(this.command, this.args, {
+      env: this.env,
+      stdio: ['pipe', 'pipe', 'pipe']
+    });
+    this.alive = true;
+
+    readline.createInterface({ input: this.child.stdout }).on('line', (line) => this.receive(line));
+    this.child.stderr.on('data', (data) => {
+      this.stderr = (this.stderr + data.toString()).slice(-STDERR_TAIL_BYTES);
+    });
+    this.child.stdin.on('error', () => {});
+    this.child.on('error', (error) => this.exited(error.message));
+    this.child.on('exit', (code, signal) => this.exited(`exited with ${signal || code}`));
+
+    await this.request('initialize', {
+      protocolVersion: PROTOCOL_VERSION,
+      capabilities: {},
+      clientInfo: { name: this.clientName, version: '1.0.0' }
+    }, timeoutMs);
+    this.notify('notifications/initialized');
+    this.ready = true;
+  }
+
+  receive(line) {
+    if (!line.trim()) {
+      return;
+    }
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch (error) {
+      console.error(`Unparseable MCP output: ${line}`);
+      return;
+    }
+    const waiter = this.pending.get(message.id);
+    if (!waiter) {
+      // Notifications and server-initiated requests are not used here.
+      return;
+    }
+    this.pending.delete(message.id);
+    clearTimeout(waiter.timer);
+    waiter.resolve(message);
+  }
+
+  exited(reason) {
+    if (!this.alive) {
+      return;
+    }
+    this.alive = false;
+    this.ready = false;
+    const error = new Error(`MCP server ${reason}: ${this.stderr.trim()}`);
+    for (const waiter of this.pending.values()) {
+      clearTimeout(waiter.timer);
+      waiter.reject(error);
+    }
+    this.pending.clear();
+    if (this.onExit) {
+      this.onExit(this);
+    }
+  }
+
+  // Resolves with the whole JSON-RPC response, `error` member included.
+  request(method, params, timeoutMs) {
+    if (!this.alive) {
+      return Promise.reject(new Error('MCP session is not running'));
+    }
+    const id = ++this.nextId;
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(id);
+        reject(new Error(`MCP request ${method} timed out after ${timeoutMs}ms`));
+      }, timeoutMs);
+      this.pending.set(id, { resolve, reject, timer });
+      this.child.stdin.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
+    });
+  }
+
+  notify(method, params) {
+    this.child.stdin.write(JSON.stringify({ jsonrpc: '2.0', method, params }) + '\n');
+  }
+
+  close() {
+    this.onExit = null;
+    if (this.child) {
+      this.child.kill();
+    }
+  }
+}
+
+// A fixed number of MCP sessions started once and reused for every HTTP
+// request. Calls go to the live session with the fewest requests in flight.
+// A session that exits or stops answering pings is replaced, backing off
+// exponentially while replacements keep failing to start.
+class McpSessionPool {
+  constructor({
+    command,
+    args,
+    env = process.env,
+    clientName = 'mcp-http-bridge',
+    size = 2,
+    requestTimeoutMs = 30000,
+    healthIntervalMs = 15000,
+    restartDelayMs = 1000,
+    maxRestartDelayMs = 30000
+  }) {
+    this.command = command;
+    this.args = args;
+    this.env = env;
+    this.clientName = clientName;
+    this.size = size;
+    this.requestTimeoutMs = requestTimeoutMs;
+    this.healthIntervalMs = healthIntervalMs;
+    this.restartDelayMs = restartDelayMs;
+    this.maxRestartDelayMs = maxRestartDelayMs;
+    this.failedStarts = 0;
+    this.sessions = [];
+    this.restarts = 0;
+    this.calls = 0;
+    this.failures = 0;
+    this.healthTimer = null;
+    this.closed = false;
+  }
+
+  async start() {
+    await Promise.all(Array.from({ length: this.size }, () => this.spawnSession()));
+    this.healthTimer = setInterval(() => this.checkHealth(), this.healthIntervalMs);
+    this.healthTimer.unref();
+  }
+
+  async spawnSession() {
+    const session = new McpSession(this.command, this.args, this.env, this.clientName);
+    session.onExit = () => this.replace(session);
+    this.sessions.push(session);
+    try {
+      await session.start(this.requestTimeoutMs);
+      this.failedStarts = 0;
+    } catch (error) {
+      this.failedStarts += 1;
+      console.error(`MCP session failed to start: ${error.message}`);
+      session.close();
+      this.replace(session);
+    }
+  }
+
+  replace(session) {
+    if (this.closed || !this.sessions.includes(session)) {
+      return;
+    }
+    this.sessions = this.sessions.filter((s) => s !== session);
+    this.restarts += 1;
+    const delay = Math.min(this.restartDelayMs * 2 ** this.failedStarts, this.maxRestartDelayMs);
+    setTimeout(() => {
+      if (!this.closed) {
+        this.spawnSession();
+      }
+    }, delay).unref();
+  }
+
+  async checkHealth() {
+    await Promise.all(this.sessions.filter((s) => s.ready).map(async (session) => {
+      try {
+        await session.request('ping', {}, Math.min(this.requestTimeoutMs, 5000));
+      } catch (error) {
+        console.error(`MCP session unhealthy, restarting: ${error.message}`);
+        session.close();
+        this.replace(session);
+      }
+    }));
+  }
+
+  async call(method, params) {
+    const live = this.sessions.filter((s) => s.ready);
+    if (live.length === 0) {
+      this.failures += 1;
+      throw new Error('No MCP session is available');
+    }
+    const session = live.reduce((a, b) => (b.inFlight < a.inFlight ? b : a));
+    this.calls += 1;
+    try {
+      return await session.request(method, params, this.requestTimeoutMs);
+    } catch (error) {
+      this.failures += 1;
+      throw error;
+    }
+  }
+
+  callTool(name, args) {
+    return this.call('tools/call', { name, arguments: args });
+  }
+
+  stats() {
+    const live = this.sessions.filter((s) => s.ready);
+    return {
+      size: this.size,
+      live: live.length,
+      in_flight: live.reduce((total, s) => total + s.inFlight, 0),
+      calls: this.calls,
+      failures: this.failures,
+      restarts: this.restarts
+    };
+  }
+
+  close() {
+    this.closed = true;
+    clearInterval(this.healthTimer);
+    for (const session of this.sessions) {
+      session.close();
+    }
+    this.sessions = [];
+  }
+}
+
+module.exports = { McpSession, McpSessionPool };
@@ -0,0 +1,34 @@
+// Stand-in MCP server for the session pool tests, speaking newline-delimited
+// JSON-RPC on stdin/stdout. It only serves when `serve()` is called, as the
+// test runner loads every file in this directory. With FAKE_MCP_FAIL_START
+// set it exits before answering `initialize`.
+const readline = require('readline');
+
+function reply(id, result) {
+  process.stdout.write(JSON.stringify({ jsonrpc: '2.0', id, result }) + '\n');
+}
+
+function serve() {
+  if (process.env.FAKE_MCP_FAIL_START) {
+    process.stderr.write('cannot start\n');
+    process.exit(2);
+  }
+  readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    const { id, method, params } = JSON.parse(line);
+    if (id === undefined) {
+      return;
+    }
+    if (method === 'echo') {
+      // Answers after `delayMs`, so later requests can be answered first.
+      process.stdout.write(JSON.stringify({ jsonrpc: '2.0', method: 'notifications/progress' }) + '\n');
+      setTimeout(() => reply(id, { value: params.value }), params.delayMs);
+    } else if (method === 'exit') {
+      process.stderr.write('exiting on request\n');
+      process.exit(3);
+    } else if (method !== 'hang') {
+      reply(id, {});
+    }
+  });
+}
+
+module.exports = { serve };
@@ -0,0 +1,100 @@
+const assert = require('node:assert');
+const path = require('node:path');
+const { performance } = require('node:perf_hooks');
+const test = require('node:test');
+
+const { McpSession, McpSessionPool } = require('../session-pool');
+
+const FAKE_SERVER = ['-e', `require(${JSON.stringify(path.join(__dirname, 'fake-mcp-server.js'))}).serve()`];
+
+async function startedSession() {
+  const session = new McpSession(process.execPath, FAKE_SERVER, process.env, 'test');
+  await session.start(5000);
+  return session;
+}
+
+test('matches responses to requests by id when they arrive out of order', async () => {
+  const session = await startedSession();
+  try {
+    const answered = [];
+    const requests = [300, 150, 0].map((delayMs, value) =>
+      session.request('echo', { delayMs, value }, 5000).then((response) => {
+        answered.push(value);
+        return response;
+      })
+    );
+    assert.strictEqual(session.inFlight, 3);
+
+    const responses = await Promise.all(requests);
+    assert.deepStrictEqual(answered, [2, 1, 0]);
+    assert.deepStrictEqual(responses.map((response) => response.result.value), [0, 1, 2]);
+    assert.deepStrictEqual(responses.map((response) => response.id), [2, 3, 4]);
+    assert.strictEqual(session.inFlight, 0);
+  } finally {
+    session.close();
+  }
+});
+
+test('rejects every pending request when the session dies', async () => {
+  const session = await startedSession();
+  let exits = 0;
+  session.onExit = () => { exits += 1; };
+
+  const pending = session.request('hang', {}, 5000);
+  const dying = session.request('exit', {}, 5000);
+
+  for (const request of [pending, dying]) {
+    await assert.rejects(request, /MCP server exited with 3/);
+  }
+  assert.strictEqual(session.inFlight, 0);
+  assert.strictEqual(session.ready, false);
+  assert.strictEqual(exits, 1);
+  await assert.rejects(session.request('echo', { delayMs: 0 }, 5000), /not running/);
+});
+
+test('backs off exponentially, up to the cap, while restarts keep failing', async () => {
+  const pool = new McpSessionPool({
+    command: process.execPath,
+    args: FAKE_SERVER,
+    env: { ...process.env, FAKE_MCP_FAIL_START: '1' },
+    size: 1,
+    restartDelayMs: 50,
+    maxRestartDelayMs: 200
+  });
+  const attempts = [];
+  const spawnSession = pool.spawnSession.bind(pool);
+  // The pool's restart timers do not hold the process open; this does.
+  let failedFive;
+  let deadline;
+  const done = new Promise((resolve, reject) => {
+    failedFive = resolve;
+    deadline = setTimeout(() => reject(new Error(`only ${attempts.length} starts in 5s`)), 5000);
+  });
+  pool.spawnSession = async () => {
+    const attempt = { started: performance.now() };
+    attempts.push(attempt);
+    await spawnSession();
+    attempt.failed = performance.now();
+    if (attempts.length === 5) {
+      failedFive();
+    }
+  };
+
+  try {
+    await pool.start();
+    await done;
+  } finally {
+    clearTimeout(deadline);
+    pool.close();
+  }
+
+  // The first restart waits 50ms, and each failed start since doubles
+  // that, up to the 200ms cap.
+  const gaps = attempts.slice(1).map((attempt, i) => attempt.started - attempts[i].failed);
+  [50, 100, 200, 200].forEach((delay, i) => {
+    assert.ok(gaps[i] >= delay - 5, `waited ${gaps[i].toFixed(0)}ms, expected at least ${delay}ms`);
+  });
+  assert.ok(gaps[3] < 400, `waited ${gaps[3].toFixed(0)}ms past the 200ms cap`);
+  assert.strictEqual(pool.stats().live, 0);
+  assert.ok(pool.stats().restarts >= 4);
+});
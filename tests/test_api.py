@@ -1,4 +1,5 @@
 import pytest
+from datetime import date
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -178,3 +179,59 @@ def test_plan_event_room_pricing_structure():
         assert "estimated_room_total_cost" in pricing
         
         assert pricing["assumed_hours"] == 4
+
+
+def test_plan_events_returns_results_in_input_order():
+    payload = {
+        "requests": [
+            {"event_date": "2025-09-15", "location": "San Francisco", "number_of_guests": 120,
+             "cuisine_preferences": ["Italian"], "needs_event_room": True},
+            {"event_date": "2025-09-16", "location": "Chicago", "number_of_guests": 200,
+             "needs_event_room": True},
+            {"event_date": "2025-09-17", "location": "san francisco", "number_of_guests": 60},
+        ]
+    }
+
+    response = client.post("/plan-events", json=payload)
+    assert response.status_code == 200
+
+    results = response.json()["results"]
+    assert [r["input_summary"]["event_date"] for r in results] == ["2025-09-15", "2025-09-16", "2025-09-17"]
+    assert results[2]["event_rooms"] == []
+
+    for room in results[0]["event_rooms"]:
+        assert room["capacity_min"] <= 120 <= room["capacity_max"]
+
+
+def test_plan_events_empty_batch():
+    response = client.post("/plan-events", json={"requests": []})
+    assert response.status_code == 422
+
+
+def test_availability_search_returns_requested_weekdays():
+    payload = {
+        "start_date": "2025-07-01",
+        "end_date": "2025-09-30",
+        "location": "Chicago",
+        "number_of_guests": 200,
+        "weekdays": [5]
+    }
+
+    response = client.post("/availability/search", json=payload)
+    assert response.status_code == 200
+
+    dates = response.json()["dates"]
+    assert len(dates) == 13
+    assert all(date.fromisoformat(d["date"]).weekday() == 5 for d in dates)
+
+
+def test_availability_search_rejects_inverted_window():
+    payload = {
+        "start_date": "2025-09-30",
+        "end_date": "2025-07-01",
+        "location": "Chicago",
+        "number_of_guests": 200
+    }
+
+    response = client.post("/availability/search", json=payload)
+    assert response.status_code == 422
@@ -0,0 +1,58 @@
+from datetime import date
+
+from app.availability import CalendarBitmaps, AvailabilityIndex, free_days_by_date, weekday_mask
+
+
+def test_free_mask_clears_blocked_days():
+    bitmaps = CalendarBitmaps(date(2025, 6, 1))
+    bitmaps.set_blocked("venue", "v1", date(2025, 6, 3), True)
+    bitmaps.set_blocked("venue", "v1", date(2025, 6, 5), True)
+    bitmaps.set_blocked("venue", "v1", date(2025, 5, 20), True)
+
+    free = bitmaps.free_mask("venue", "v1", date(2025, 6, 2), 5)
+    assert [free >> i & 1 for i in range(5)] == [1, 0, 1, 0, 1]
+
+    bitmaps.set_blocked("venue", "v1", date(2025, 6, 3), False)
+    free = bitmaps.free_mask("venue", "v1", date(2025, 5, 31), 6)
+    assert [free >> i & 1 for i in range(6)] == [0, 1, 1, 1, 1, 0]
+
+
+def test_days_before_the_epoch_are_never_free():
+    bitmaps = CalendarBitmaps(date(2025, 6, 1))
+    assert bitmaps.free_mask("venue", "v1", date(2025, 5, 29), 4) == 0b1000
+    assert bitmaps.free_mask("venue", "v1", date(2025, 5, 1), 10) == 0
+
+
+def test_weekday_mask_selects_saturdays():
+    start = date(2025, 7, 1)
+    mask = weekday_mask(start, 31, [5])
+    assert [i + 1 for i in range(31) if mask >> i & 1] == [5, 12, 19, 26]
+
+
+def test_free_days_by_date_groups_providers_per_day():
+    bitmaps = CalendarBitmaps(date(2025, 7, 1))
+    bitmaps.set_blocked("caterer", "c2", date(2025, 7, 12), True)
+    caterers = [{"id": "c1", "name": "A"}, {"id": "c2", "name": "B"}]
+
+    start = date(2025, 7, 1)
+    by_day = free_days_by_date(bitmaps, "caterer", caterers, start, 31, weekday_mask(start, 31, [5]))
+
+    assert [c["id"] for c in by_day[4]] == ["c1", "c2"]
+    assert [c["id"] for c in by_day[11]] == ["c1"]
+    assert sorted(by_day) == [4, 11, 18, 25]
+
+
+def test_apply_change_updates_loaded_bitmaps(monkeypatch):
+    bitmaps = CalendarBitmaps(date(2025, 1, 1))
+    monkeypatch.setattr(AvailabilityIndex, "_bitmaps", bitmaps)
+    monkeypatch.setattr(AvailabilityIndex, "_dirty", False)
+    monkeypatch.setattr(AvailabilityIndex, "updates", 0)
+
+    AvailabilityIndex.apply_change({"kind": "venue", "id": "v9", "date": "2025-01-04", "available": False})
+    assert bitmaps.free_mask("venue", "v9", date(2025, 1, 1), 5) == 0b10111
+
+    AvailabilityIndex.apply_change({"kind": "venue", "id": "v9", "date": "2025-01-04", "available": True})
+    assert bitmaps.free_mask("venue", "v9", date(2025, 1, 1), 5) == 0b11111
+
+    AvailabilityIndex.apply_change({"kind": "venue", "reload": True})
+    assert AvailabilityIndex._dirty is True
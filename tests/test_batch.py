@@ -0,0 +1,95 @@
+import asyncio
+from datetime import date
+
+from app.database import DatabaseService
+from app.models import EventPlanRequest
+from app.services.batch_service import fetch_batch_candidates
+
+
+CATERERS = [
+    {"id": "c1", "name": "A", "location": "Chicago", "supported_cuisines": ["Italian"],
+     "base_price_per_guest": 55.0, "service_fee_flat": 300.0, "tax_rate_percent": 10.25,
+     "min_guests": 20, "max_guests": 150},
+    {"id": "c2", "name": "B", "location": "Chicago", "supported_cuisines": ["Indian"],
+     "base_price_per_guest": 48.0, "service_fee_flat": 250.0, "tax_rate_percent": 10.25,
+     "min_guests": 100, "max_guests": 400},
+]
+
+VENUES = [
+    {"id": "v1", "name": "Hall", "location": "Chicago", "capacity_min": 50, "capacity_max": 250},
+]
+
+
+def test_batch_fetches_once_per_location(monkeypatch):
+    calls = []
+
+    async def fake_fetch_caterers(**kwargs):
+        calls.append(("caterers", kwargs))
+        return CATERERS
+
+    async def fake_fetch_venues(**kwargs):
+        calls.append(("venues", kwargs))
+        return VENUES
+
+    async def fake_unavailable_caterers(ids, dates):
+        calls.append(("caterer_calendar", {"ids": ids, "dates": dates}))
+        return set()
+
+    async def fake_unavailable_venues(ids, dates):
+        calls.append(("venue_calendar", {"ids": ids, "dates": dates}))
+        return {("v1", date(2025, 6, 8))}
+
+    monkeypatch.setattr(DatabaseService, "fetch_caterers", fake_fetch_caterers)
+    monkeypatch.setattr(DatabaseService, "fetch_venues", fake_fetch_venues)
+    monkeypatch.setattr(DatabaseService, "fetch_unavailable_caterers", fake_unavailable_caterers)
+    monkeypatch.setattr(DatabaseService, "fetch_unavailable_venues", fake_unavailable_venues)
+
+    requests = [
+        EventPlanRequest(event_date="2025-06-01", location="Chicago", number_of_guests=50,
+                         cuisine_preferences=["Italian"], needs_event_room=True),
+        EventPlanRequest(event_date="2025-06-08", location="chicago", number_of_guests=300),
+    ]
+
+    groups = asyncio.run(fetch_batch_candidates(requests))
+
+    assert sorted(kind for kind, _ in calls) == ["caterer_calendar", "caterers", "venue_calendar", "venues"]
+    assert dict(calls)["caterers"]["min_guests"] == 50
+    assert dict(calls)["caterers"]["max_guests"] == 300
+    assert dict(calls)["venue_calendar"]["dates"] == [date(2025, 6, 1), date(2025, 6, 8)]
+
+    caterers, rooms = groups["chicago"].candidates_for(requests[0])
+    assert [c["id"] for c in caterers] == ["c1"]
+    assert [r["id"] for r in rooms] == ["v1"]
+
+    caterers, rooms = groups["chicago"].candidates_for(requests[1])
+    assert [c["id"] for c in caterers] == ["c2"]
+    assert rooms == []
+
+    booked = EventPlanRequest(event_date="2025-06-08", location="Chicago", number_of_guests=50,
+                              needs_event_room=True)
+    assert groups["chicago"].candidates_for(booked)[1] == []
+
+
+def test_batch_candidates_apply_budget_and_page(monkeypatch):
+    async def fake_fetch(**kwargs):
+        return CATERERS if "min_guests" in kwargs else VENUES
+
+    async def nothing_booked(ids, dates):
+        return set()
+
+    monkeypatch.setattr(DatabaseService, "fetch_caterers", fake_fetch)
+    monkeypatch.setattr(DatabaseService, "fetch_venues", fake_fetch)
+    monkeypatch.setattr(DatabaseService, "fetch_unavailable_caterers", nothing_booked)
+    monkeypatch.setattr(DatabaseService, "fetch_unavailable_venues", nothing_booked)
+
+    # At 120 guests c1 costs 63.39 per guest and c2 55.22.
+    request = EventPlanRequest(event_date="2025-06-01", location="Chicago", number_of_guests=120)
+    groups = asyncio.run(fetch_batch_candidates([request]))
+    group = groups["chicago"]
+
+    assert [c["id"] for c in group.candidates_for(request)[0]] == ["c1", "c2"]
+    by_cost = request.model_copy(update={"sort_by": "cost"})
+    assert [c["id"] for c in group.candidates_for(by_cost)[0]] == ["c2", "c1"]
+    assert [c["id"] for c in group.candidates_for(by_cost.model_copy(update={"offset": 1}))[0]] == ["c1"]
+    within = request.model_copy(update={"budget_per_guest": 60})
+    assert [c["id"] for c in group.candidates_for(within)[0]] == ["c2"]
@@ -0,0 +1,117 @@
+import asyncio
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.database import BookingConflictError, DatabaseConnection, DatabaseService, ManagedPool
+from app.services import booking_service
+from tests.test_pool import FakePool
+
+
+class Transaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class Statement:
+    def __init__(self, connection, name):
+        self.connection = connection
+        self.name = name
+
+    async def fetchrow(self, *args):
+        return {"id": "b1", "booking_reference": "BK-1", "client_id": args[0], "venue_id": args[1],
+                "caterer_id": args[2], "event_date": args[3], "number_of_guests": args[4],
+                "status": "pending", "total_cost": args[10]}
+
+    async def fetchval(self, provider_id, day, booking_id):
+        slot = (self.name, provider_id, day)
+        if slot in self.connection.blocked:
+            return None
+        self.connection.blocked.add(slot)
+        return 1
+
+    async def fetch(self, *args):
+        self.connection.calls.append((self.name, args))
+        if self.name.startswith("unavailable_"):
+            kind = self.name[len("unavailable_"):-1]
+            return [{f"{kind}_id": provider_id, "date": day}
+                    for name, provider_id, day in self.connection.blocked if name == f"reserve_{kind}"]
+        return []
+
+
+class FakeConnection(FakePool):
+    def __init__(self):
+        super().__init__(1)
+        self.blocked = set()
+        self.calls = []
+        self.copied = []
+
+    def transaction(self):
+        return Transaction()
+
+    async def execute(self, query):
+        self.calls.append(("execute", query))
+
+    async def registered_statement(self, name, refresh=False):
+        return Statement(self, name)
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied.extend(dict(zip(columns, record)) for record in records)
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    connection = FakeConnection()
+    primary = ManagedPool("primary", "postgresql://primary")
+    primary.pool = connection
+    monkeypatch.setattr(DatabaseConnection, "_primary", primary)
+    monkeypatch.setattr(DatabaseConnection, "_replicas", [])
+    return connection
+
+
+def test_second_booking_of_a_slot_conflicts(connection):
+    async def scenario():
+        await DatabaseService.create_booking("c1", "v1", "k1", "2025-09-13", 80)
+        with pytest.raises(BookingConflictError) as conflict:
+            await DatabaseService.create_booking("c2", None, "k1", "2025-09-13", 40)
+        return conflict.value
+
+    conflict = asyncio.run(scenario())
+    assert (conflict.kind, conflict.provider_id, conflict.event_date) == ("caterer", "k1", date(2025, 9, 13))
+
+
+def test_import_skips_rows_clashing_with_the_calendar_or_each_other(connection):
+    venue, caterer = uuid.uuid4(), uuid.uuid4()
+    connection.blocked.add(("reserve_venue", venue, date(2025, 9, 6)))
+    rows = [
+        {"client_id": str(uuid.uuid4()), "venue_id": str(venue), "event_date": "2025-09-06",
+         "number_of_guests": "50"},
+        {"client_id": str(uuid.uuid4()), "venue_id": str(venue), "caterer_id": str(caterer),
+         "event_date": "2025-09-13", "number_of_guests": "80", "cuisine_preferences": "Italian; Indian",
+         "total_cost": "4250.50"},
+        {"client_id": str(uuid.uuid4()), "caterer_id": str(caterer), "event_date": "2025-09-13",
+         "number_of_guests": "30"},
+        {"client_id": str(uuid.uuid4()), "venue_id": str(venue), "event_date": "2025-09-06",
+         "number_of_guests": "20", "status": "cancelled"},
+    ]
+
+    result = asyncio.run(booking_service.import_bookings(rows, batch_size=3))
+
+    assert result == {"imported": 2, "conflicts": [{"row": 0, "kind": "venue"}, {"row": 2, "kind": "caterer"}]}
+    first, cancelled = connection.copied
+    assert first["cuisine_preferences"] == ["Italian", "Indian"]
+    assert first["total_cost"] == Decimal("4250.50")
+    assert first["status"] == "pending"
+    assert cancelled["status"] == "cancelled"
+    reserved = [args for name, args in connection.calls if name == "reserve_venues"]
+    assert reserved == [([venue], [date(2025, 9, 13)], [first["id"]])]
+
+
+def test_import_rejects_malformed_ids():
+    with pytest.raises(ValueError):
+        booking_service.import_record({"client_id": "42", "event_date": "2025-09-06", "number_of_guests": "5"})
@@ -0,0 +1,68 @@
+import asyncio
+
+from app.catalog import CatalogSnapshot, CatalogCache
+
+
+CATERERS = [
+    {"id": "c1", "name": "Bella Cucina", "location": "San Francisco",
+     "supported_cuisines": ["Italian", "Mediterranean"], "min_guests": 20, "max_guests": 200},
+    {"id": "c2", "name": "Spice Route", "location": "san francisco",
+     "supported_cuisines": ["Indian"], "min_guests": 50, "max_guests": 500},
+    {"id": "c3", "name": "Taco Loco", "location": "Los Angeles",
+     "supported_cuisines": ["Mexican"], "min_guests": 10, "max_guests": 100},
+]
+
+VENUES = [
+    {"id": "v1", "name": "Bay Hall", "location": "San Francisco", "capacity_min": 50, "capacity_max": 150},
+    {"id": "v2", "name": "Pier Loft", "location": "San Francisco", "capacity_min": 150, "capacity_max": 400},
+]
+
+
+def test_find_caterers_matches_sql_filters():
+    snapshot = CatalogSnapshot(CATERERS, VENUES)
+
+    ids = [c["id"] for c in snapshot.find_caterers("SAN FRANCISCO", 120, 120)]
+    assert ids == ["c1", "c2"]
+
+    ids = [c["id"] for c in snapshot.find_caterers("San Francisco", 120, 120, ["Indian"])]
+    assert ids == ["c2"]
+
+    assert snapshot.find_caterers("San Francisco", 10, 10) == []
+    assert snapshot.find_caterers("San Francisco", 120, 120, ["indian"]) == []
+
+
+def test_find_venues_matches_capacity_range():
+    snapshot = CatalogSnapshot(CATERERS, VENUES)
+
+    assert [v["id"] for v in snapshot.find_venues("san francisco", 150, 150)] == ["v1", "v2"]
+    assert [v["id"] for v in snapshot.find_venues("San Francisco", 300, 300)] == ["v2"]
+    assert snapshot.find_venues("Chicago", 100, 100) == []
+
+
+def test_cache_serves_hits_until_invalidated(monkeypatch):
+    loads = []
+
+    async def fake_refresh():
+        loads.append(1)
+        CatalogCache._dirty = False
+        CatalogCache._snapshot = CatalogSnapshot(CATERERS, VENUES)
+
+    monkeypatch.setattr(CatalogCache, "refresh", fake_refresh)
+    monkeypatch.setattr(CatalogCache, "_snapshot", None)
+    monkeypatch.setattr(CatalogCache, "_lock", None)
+    monkeypatch.setattr(CatalogCache, "hits", 0)
+    monkeypatch.setattr(CatalogCache, "misses", 0)
+    monkeypatch.setattr(CatalogCache, "invalidations", 0)
+    monkeypatch.setattr(CatalogCache, "_dirty", False)
+
+    async def scenario():
+        await CatalogCache.get_snapshot()
+        await CatalogCache.get_snapshot()
+        CatalogCache.invalidate()
+        await CatalogCache.get_snapshot()
+
+    asyncio.run(scenario())
+
+    assert len(loads) == 2
+    assert CatalogCache.hits == 1
+    assert CatalogCache.misses == 2
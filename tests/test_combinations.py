@@ -0,0 +1,122 @@
+import asyncio
+import random
+
+from app.models import EventRoom, RoomPricing
+from app.services.pricing_service import budget_total, price_catering_services, round_cents
+from app.services.catering_service import build_catering_analysis, group_by_cuisine, preference_set
+from app.services.combination_service import order_by_rating, rank_combinations
+from app.services.venue_service import build_event_room_response
+
+
+def make_room(i, cost, includes_catering=False):
+    return EventRoom(
+        room_id=f"v{i}", room_name=f"Room {i}", location="Chicago",
+        capacity_min=10, capacity_max=500, amenities=[],
+        pricing=RoomPricing(base_room_rental_fee=cost, assumed_hours=4, estimated_room_total_cost=cost),
+        includes_catering=includes_catering
+    )
+
+
+def make_caterers(count, rng):
+    cuisines = ["Italian", "Indian", "Thai"]
+    return [
+        {"id": f"c{j}", "name": f"Caterer {j}", "supported_cuisines": [rng.choice(cuisines)],
+         "base_price_per_guest": rng.randint(30, 120), "service_fee_flat": rng.randint(0, 800),
+         "tax_rate_percent": 9.5}
+        for j in range(count)
+    ]
+
+
+def brute_force(rooms, caterers, table, guests, preference, budget, top_k):
+    pairs = []
+    for room in rooms:
+        if room.includes_catering:
+            continue
+        for caterer in caterers:
+            if preference and preference not in caterer["supported_cuisines"]:
+                continue
+            total = room.pricing.estimated_room_total_cost + table.breakdown(caterer, guests).total_cost
+            if budget is None or float(round_cents(total)) <= budget_total(budget, guests):
+                pairs.append(round(total, 2))
+    return sorted(pairs)[:top_k]
+
+
+def test_rank_combinations_matches_cross_product():
+    rng = random.Random(4)
+    rooms = [make_room(i, float(rng.randint(500, 9000)), includes_catering=i % 7 == 0) for i in range(60)]
+    caterers = make_caterers(80, rng)
+    guests = 120
+    table = price_catering_services(caterers, [guests])
+
+    for preference, budget in [(None, None), ("Italian", None), ("Thai", 150.0), (None, 95.0), (None, 1.0)]:
+        ranked = rank_combinations(
+            rooms, caterers, table, guests,
+            cuisine_preferences=[preference] if preference else None,
+            budget_per_guest=budget, top_k=10
+        )
+        assert [c.total_cost for c in ranked] == brute_force(rooms, caterers, table, guests, preference, budget, 10)
+        if preference:
+            wanted = {c["id"] for c in caterers if preference in c["supported_cuisines"]}
+            assert all(c.provider_id in wanted for c in ranked)
+
+
+
+def test_pair_costing_exactly_the_budget_is_kept():
+    # 70.1 * 3 is 210.29999999999998 in floats; the statements compare
+    # against the exact 210.30.
+    caterer = {"id": "c0", "name": "Caterer 0", "supported_cuisines": ["Thai"],
+               "base_price_per_guest": 0, "service_fee_flat": 110.2, "tax_rate_percent": 0}
+    table = price_catering_services([caterer], [3])
+    ranked = rank_combinations([make_room(0, 100.1)], [caterer], table, 3, budget_per_guest=70.1)
+    assert [c.total_cost for c in ranked] == [210.3]
+    assert rank_combinations([make_room(0, 100.11)], [caterer], table, 3, budget_per_guest=70.1) == []
+
+def test_rank_combinations_skips_rooms_with_included_catering():
+    rng = random.Random(1)
+    caterers = make_caterers(3, rng)
+    table = price_catering_services(caterers, [50])
+
+    assert rank_combinations([make_room(0, 1000.0, includes_catering=True)], caterers, table, 50) == []
+
+
+def test_rank_by_rating_puts_rated_providers_first():
+    rooms = [
+        {"id": f"v{i}", "name": f"Room {i}", "location": "Chicago", "capacity_min": 10, "capacity_max": 500,
+         "amenities": [], "base_room_rental_fee": fee, "hourly_rate": None, "includes_catering": False,
+         "average_rating": rating, "review_count": reviews}
+        for i, (fee, rating, reviews) in enumerate([(900, None, 0), (1500, 4.5, 2), (1200, 4.5, 9), (800, 3.0, 4)])
+    ]
+    ranked = asyncio.run(build_event_room_response(rooms, 0.0, rank_by_rating=True))
+    assert [room.room_id for room in ranked] == ["v2", "v1", "v3", "v0"]
+    in_page_order = asyncio.run(build_event_room_response(rooms, 0.0))
+    assert [room.room_id for room in in_page_order] == ["v0", "v1", "v2", "v3"]
+    assert order_by_rating(in_page_order[:1]) == in_page_order[:1]
+
+    caterers = make_caterers(3, random.Random(5))
+    for caterer, rating in zip(caterers, [3.5, None, 4.8]):
+        caterer.update(supported_cuisines=["Thai"], location="Chicago", average_rating=rating, review_count=1)
+    analysis = asyncio.run(build_catering_analysis(caterers, 50, rank_by_rating=True))
+    assert [p.provider_id for p in analysis.by_cuisine[0].providers] == ["c2", "c0", "c1"]
+
+
+def test_catering_analysis_groups_preferred_cuisines_or_falls_back_to_all():
+    caterers = make_caterers(30, random.Random(9))
+    for caterer in caterers:
+        caterer["location"] = "Chicago"
+    caterers[4]["supported_cuisines"] = ["Thai", "Italian"]
+
+    assert group_by_cuisine(caterers, preference_set(["italian", "THAI"])) == {
+        cuisine: members for cuisine, members in group_by_cuisine(caterers).items() if cuisine in ("Italian", "Thai")
+    }
+    assert preference_set([]) is None
+
+    preferred = asyncio.run(build_catering_analysis(caterers, 50, cuisine_preferences=["thai"]))
+    assert [group.cuisine for group in preferred.by_cuisine] == ["Thai"]
+    thai = [c["id"] for c in caterers if "Thai" in c["supported_cuisines"]]
+    assert [p.provider_id for p in preferred.by_cuisine[0].providers] == thai
+
+    fallback = asyncio.run(build_catering_analysis(caterers, 50, cuisine_preferences=["Korean"]))
+    everything = asyncio.run(build_catering_analysis(caterers, 50))
+    assert fallback == everything
+    assert [group.cuisine for group in everything.by_cuisine] == ["Indian", "Italian", "Thai"]
+    assert sum(len(group.providers) for group in everything.by_cuisine) == 31
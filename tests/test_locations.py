@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import asyncpg
+import pytest
+
+from app.config import DATABASE_URL, SUPPORTED_LOCATIONS
+from app.database import _caterer_search, _venue_search
+from app.locations import CITIES, canonical_location, city_id
+from app.models import AvailabilitySearchRequest, EventPlanRequest
+from app.statements import STATEMENTS
+
+
+def test_aliases_resolve_to_the_stored_spelling():
+    assert sorted(CITIES.values()) == sorted(SUPPORTED_LOCATIONS)
+    assert city_id("San Francisco") == "san-francisco"
+    for spelling in ("SF", " san  francisco ", "San Francisco, CA", "san-francisco"):
+        assert canonical_location(spelling) == "San Francisco"
+    assert canonical_location("L.A.") == "Los Angeles"
+    assert canonical_location("nyc") == "New York"
+
+
+def test_unknown_locations_are_only_trimmed():
+    assert city_id("Springfield") is None
+    assert canonical_location("  Springfield   Gardens ") == "Springfield Gardens"
+
+
+def test_requests_carry_the_canonical_location():
+    plan = EventPlanRequest(event_date="2025-06-01", location="sf", number_of_guests=50)
+    search = AvailabilitySearchRequest(start_date="2025-06-01", end_date="2025-06-02", location="NYC",
+                                       number_of_guests=50)
+    assert (plan.location, search.location) == ("San Francisco", "New York")
+    with pytest.raises(ValueError):
+        EventPlanRequest(event_date="2025-06-01", location="   ", number_of_guests=50)
+
+
+PROVIDERS = 1_000_000
+CITY_COUNT = 1_000
+
+_FILL_VENUES = """
+    INSERT INTO venues (name, location, capacity_min, capacity_max, base_room_rental_fee, hourly_rate, is_active)
+    SELECT 'Venue ' || g, 'City ' || g % $2::int, 10 + g % 90, 10 + g % 90 + g * 7 % 400,
+           500 + g % 5000, g % 300, g % 10 <> 0
+    FROM generate_series(1, $1::int) g
+"""
+
+_FILL_CATERERS = """
+    INSERT INTO caterers (name, location, supported_cuisines, base_price_per_guest, service_fee_flat,
+                          tax_rate_percent, min_guests, max_guests, is_active)
+    SELECT 'Caterer ' || g, 'City ' || g % $2::int, ARRAY[(ARRAY['Italian', 'Indian', 'Thai'])[1 + g % 3]],
+           20 + g % 80, g % 500, 8.5, 10 + g % 90, 10 + g % 90 + g * 7 % 400, g % 10 <> 0
+    FROM generate_series(1, $1::int) g
+"""
+
+
+def scans(plan):
+    """(node type, relation, index) of every scan in an EXPLAIN JSON plan."""
+    found = []
+    if "Relation Name" in plan or "Index Name" in plan:
+        found.append((plan["Node Type"], plan.get("Relation Name"), plan.get("Index Name")))
+    for child in plan.get("Plans", []):
+        found.extend(scans(child))
+    return found
+
+
+def literal(value):
+    """`value` as an EXECUTE argument; PREPARE has inferred the types."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, list):
+        value = "{" + ",".join(f'"{item}"' for item in value) + "}"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+async def explain_searches():
+    try:
+        conn = await asyncpg.connect(DATABASE_URL, timeout=5)
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as exc:
+        pytest.skip(f"no database at DATABASE_URL: {exc}")
+    try:
+        if await conn.fetchval("SELECT to_regclass('venues') IS NULL OR to_regclass('caterers') IS NULL"):
+            pytest.skip("database/schema.sql is not loaded")
+        transaction = conn.transaction()
+        await transaction.start()
+        try:
+            await conn.execute(_FILL_VENUES, PROVIDERS, CITY_COUNT)
+            await conn.execute(_FILL_CATERERS, PROVIDERS, CITY_COUNT)
+            await conn.execute("ANALYZE venues, caterers")
+
+            searches = [
+                _venue_search("city 7", 120, 120, None, number_of_guests=120, limit=101),
+                _venue_search("city 7", 120, 120, "2025-06-01", number_of_guests=120, budget_per_guest=40.0,
+                              order_by="cost", limit=101),
+                _caterer_search("city 7", 120, 120, ["Italian"], None, number_of_guests=120, limit=101),
+                _caterer_search("city 7", 120, 120, None, "2025-06-01", number_of_guests=120,
+                                budget_per_guest=40.0, order_by="cost", limit=101),
+            ]
+            plans = {}
+            for name, *params in searches:
+                # Unnamed statements are planned with their parameters, as
+                # the registry's prepared statements are for their first
+                # five executions.
+                plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {STATEMENTS[name]}", *params)
+                plans[(name, params[6], "custom")] = scans(json.loads(plan)[0]["Plan"])
+
+                # After that they may switch to a plan made without them.
+                await conn.execute(f"PREPARE search AS {STATEMENTS[name]}")
+                await conn.execute("SET LOCAL plan_cache_mode = force_generic_plan")
+                arguments = ", ".join(literal(value) for value in params)
+                plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) EXECUTE search({arguments})")
+                plans[(name, params[6], "generic")] = scans(json.loads(plan)[0]["Plan"])
+                await conn.execute("DEALLOCATE search")
+                await conn.execute("RESET plan_cache_mode")
+            return plans
+        finally:
+            await transaction.rollback()
+    finally:
+        await conn.close()
+
+
+def test_searches_use_the_location_capacity_indexes_at_a_million_rows():
+    for (name, by_cost, plan_kind), found in asyncio.run(explain_searches()).items():
+        table = "venues" if name.startswith("venues") else "caterers"
+        case = (name, by_cost, plan_kind, found)
+        assert all(node != "Seq Scan" for node, relation, _ in found if relation == table), case
+        assert f"idx_{table}_active_location_capacity" in {index for _, _, index in found}, case
@@ -0,0 +1,71 @@
+import random
+
+from app.matching import IntervalTree, caterer_index, venue_index
+
+
+CUISINES = ["Italian", "Indian", "Chinese", "Mexican", "American", "Japanese", "Thai"]
+LOCATIONS = ["San Francisco", "New York", "Chicago"]
+
+
+def make_caterers(count, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        low = rng.randint(1, 300)
+        rows.append({
+            "id": f"c{i}",
+            "name": f"Caterer {i:05d}",
+            "location": rng.choice(LOCATIONS).upper() if i % 5 == 0 else rng.choice(LOCATIONS),
+            "supported_cuisines": rng.sample(CUISINES, rng.randint(1, 3)),
+            "min_guests": low,
+            "max_guests": low + rng.randint(0, 400),
+        })
+    return rows
+
+
+def scan(rows, location, a, b, cuisines):
+    return [
+        row for row in rows
+        if row["location"].lower() == location.lower()
+        and row["max_guests"] >= a and row["min_guests"] <= b
+        and (not cuisines or set(cuisines) & set(row["supported_cuisines"]))
+    ]
+
+
+def test_interval_tree_overlap_matches_brute_force():
+    rng = random.Random(3)
+    intervals = []
+    for i in range(500):
+        low = rng.randint(0, 1000)
+        intervals.append((low, low + rng.randint(0, 200), i))
+    tree = IntervalTree(intervals)
+
+    for _ in range(200):
+        a = rng.randint(-50, 1250)
+        b = a + rng.randint(0, 100)
+        expected = sorted(p for low, high, p in intervals if low <= b and high >= a)
+        assert sorted(tree.overlapping(a, b)) == expected
+
+
+def test_caterer_index_matches_linear_scan():
+    rows = make_caterers(2000)
+    index = caterer_index(rows)
+    rng = random.Random(11)
+
+    for _ in range(300):
+        location = rng.choice(LOCATIONS)
+        guests = rng.randint(1, 700)
+        cuisines = rng.choice([None, [rng.choice(CUISINES)], rng.sample(CUISINES, 2), ["Klingon"]])
+        assert index.search(location, guests, guests, cuisines) == scan(rows, location, guests, guests, cuisines)
+
+
+def test_venue_index_without_location_returns_all_partitions_in_order():
+    venues = [
+        {"id": "v1", "name": "A", "location": "Chicago", "capacity_min": 10, "capacity_max": 100},
+        {"id": "v2", "name": "B", "location": "Austin", "capacity_min": 50, "capacity_max": 500},
+        {"id": "v3", "name": "C", "location": "Chicago", "capacity_min": 200, "capacity_max": 300},
+    ]
+    index = venue_index(venues)
+
+    assert [v["id"] for v in index.search(None, 60, 60)] == ["v1", "v2"]
+    assert [v["id"] for v in index.search("chicago", None, None)] == ["v1", "v3"]
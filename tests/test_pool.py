@@ -0,0 +1,197 @@
+import asyncio
+import time
+
+import pytest
+
+import app.database as database
+from app.database import DatabaseConnection, DatabaseService, ManagedPool
+
+
+class FakePool:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.free = asyncio.Semaphore(max_size)
+
+    def get_max_size(self):
+        return self.max_size
+
+    def get_size(self):
+        return self.max_size
+
+    def get_idle_size(self):
+        return self.free._value
+
+    async def acquire(self, timeout=None):
+        await asyncio.wait_for(self.free.acquire(), timeout)
+        return self
+
+    async def release(self, connection):
+        self.free.release()
+
+    async def close(self):
+        pass
+
+
+class UnreachablePool(FakePool):
+    async def acquire(self, timeout=None):
+        raise ConnectionRefusedError()
+
+
+@pytest.fixture
+def fresh_pool_state(monkeypatch):
+    monkeypatch.setattr(DatabaseConnection, "_primary", ManagedPool("primary", "postgresql://primary"))
+    monkeypatch.setattr(DatabaseConnection, "_replicas", [])
+
+
+def with_replicas(monkeypatch, *lags):
+    replicas = []
+    for i, lag in enumerate(lags):
+        replica = ManagedPool(f"replica-{i}", f"postgresql://replica-{i}")
+        replica.pool = FakePool(5)
+        replica.lag_seconds = lag
+        replica.lag_checked_at = time.monotonic() + 3600
+        replicas.append(replica)
+    monkeypatch.setattr(DatabaseConnection, "_replicas", replicas)
+    DatabaseConnection._primary.pool = FakePool(5)
+    return replicas
+
+
+def test_concurrent_first_requests_create_one_pool(fresh_pool_state, monkeypatch):
+    created = []
+
+    async def fake_create_pool(dsn, **kwargs):
+        created.append(kwargs)
+        await asyncio.sleep(0.01)
+        return FakePool(kwargs["max_size"])
+
+    monkeypatch.setattr(database.asyncpg, "create_pool", fake_create_pool)
+
+    async def scenario():
+        return await asyncio.gather(*(DatabaseConnection.get_pool() for _ in range(10)))
+
+    pools = asyncio.run(scenario())
+
+    assert len(created) == 1
+    assert all(pool is pools[0] for pool in pools)
+    assert created[0]["max_size"] == database.settings.db_pool_max_size
+    assert created[0]["statement_cache_size"] == database.settings.db_statement_cache_size
+
+
+def test_get_connection_records_waits_and_saturation(fresh_pool_state, monkeypatch):
+    DatabaseConnection._primary.pool = FakePool(2)
+
+    async def hold(seconds):
+        async with DatabaseConnection.get_connection():
+            await asyncio.sleep(seconds)
+
+    async def scenario():
+        await asyncio.gather(*(hold(0.02) for _ in range(4)))
+
+    asyncio.run(scenario())
+
+    stats = DatabaseConnection.stats()
+    assert stats["acquires"] == 4
+    assert stats["in_use"] == 0
+    assert stats["peak_in_use"] == 2
+    assert stats["saturation_events"] == 2
+    assert stats["acquire_wait_ms_max"] >= 10
+
+
+def test_acquire_timeout_is_counted(fresh_pool_state, monkeypatch):
+    DatabaseConnection._primary.pool = FakePool(1)
+    monkeypatch.setattr(database.settings, "db_pool_acquire_timeout", 0.01)
+
+    async def scenario():
+        async with DatabaseConnection.get_connection():
+            with pytest.raises(asyncio.TimeoutError):
+                async with DatabaseConnection.get_connection():
+                    pass
+
+    asyncio.run(scenario())
+
+    assert DatabaseConnection.stats()["acquire_timeouts"] == 1
+
+
+def test_pool_bounds_split_the_connection_ceiling_across_workers():
+    from app.config import Settings
+
+    assert Settings(db_pool_max_size=20).pool_bounds() == (5, 20)
+
+    settings = Settings(web_concurrency=4, db_max_connections=80, db_pool_max_size=20)
+    assert settings.listener_connections() == 1
+    assert settings.pool_bounds() == (5, 19)
+
+    settings = Settings(web_concurrency=8, db_max_connections=80, response_cache_enabled=True)
+    assert settings.pool_bounds() == (5, 7)
+
+    with pytest.raises(ValueError):
+        Settings(web_concurrency=80, db_max_connections=80)
+
+
+def test_reads_use_least_loaded_fresh_replica(fresh_pool_state, monkeypatch):
+    fresh, busy, lagging = with_replicas(monkeypatch, 0.0, 0.5, 60.0)
+    busy.metrics.in_use = 3
+
+    async def scenario():
+        async with DatabaseConnection.get_connection(readonly=True) as connection:
+            assert connection is fresh.pool
+        async with DatabaseConnection.get_connection() as connection:
+            assert connection is DatabaseConnection._primary.pool
+
+    asyncio.run(scenario())
+    assert lagging.metrics.acquires == 0
+
+
+def test_reads_after_a_write_stay_on_primary(fresh_pool_state, monkeypatch):
+    replica, = with_replicas(monkeypatch, 0.0)
+    used = []
+
+    class Statement:
+        async def fetch(self, *args):
+            return []
+
+        async def fetchrow(self, *args):
+            return {"id": "booking"}
+
+        async def fetchval(self, *args):
+            return 1
+
+    class Transaction:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def registered_statement(name, refresh=False):
+        return Statement()
+
+    for pool in (replica.pool, DatabaseConnection._primary.pool):
+        pool.registered_statement = registered_statement
+        pool.transaction = Transaction
+
+    async def request():
+        await DatabaseService.fetch_venues()
+        used.append(replica.metrics.acquires)
+        await DatabaseService.create_booking("client", "venue", None, "2025-09-15", 10)
+        await DatabaseService.fetch_venues()
+        used.append(replica.metrics.acquires)
+
+    asyncio.run(request())
+    assert used == [1, 1]
+    assert DatabaseConnection._primary.metrics.acquires == 2
+
+
+def test_unreachable_replica_falls_back_to_primary(fresh_pool_state, monkeypatch):
+    replica, = with_replicas(monkeypatch, 0.0)
+    replica.pool = UnreachablePool(5)
+
+    async def scenario():
+        async with DatabaseConnection.get_connection(readonly=True) as connection:
+            assert connection is DatabaseConnection._primary.pool
+        async with DatabaseConnection.get_connection(readonly=True) as connection:
+            assert connection is DatabaseConnection._primary.pool
+
+    asyncio.run(scenario())
+    assert replica.failed_at > 0
+    assert DatabaseConnection._primary.metrics.acquires == 2
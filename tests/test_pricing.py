@@ -0,0 +1,125 @@
+import random
+from decimal import Decimal
+
+from app.services.catering_service import calculate_cost_breakdown, select_caterers
+from app.models import EventPlanRequest
+from app.pagination import CATERERS, ROOMS, sort_key
+from app.services.pricing_service import price_catering_services, price_event_rooms, round_cents
+from app.services.venue_service import calculate_room_cost, select_rooms
+
+
+def make_services(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"c{i}",
+            "base_price_per_guest": Decimal(rng.randint(100, 20000)) / 100,
+            "service_fee_flat": Decimal(rng.randint(0, 100000)) / 100,
+            "tax_rate_percent": Decimal(rng.randint(0, 1500)) / 100,
+        }
+        for i in range(count)
+    ]
+
+
+def test_vectorized_breakdowns_match_scalar_rounding():
+    services = make_services(300)
+    # Exact half-cent ties: (0.50 + 0) * 1% = 0.005 and (1.00 + 0.25) * 10% = 0.125.
+    services.append({"id": "tie1", "base_price_per_guest": Decimal("0.50"),
+                     "service_fee_flat": Decimal("0"), "tax_rate_percent": Decimal("1")})
+    services.append({"id": "tie2", "base_price_per_guest": Decimal("1.00"),
+                     "service_fee_flat": Decimal("0.25"), "tax_rate_percent": Decimal("10")})
+    guest_counts = [1, 3, 7, 50, 120, 333, 1000]
+
+    table = price_catering_services(services, guest_counts)
+
+    for guests in guest_counts:
+        for service in services:
+            assert table.breakdown(service, guests) == calculate_cost_breakdown(service, guests)
+
+
+def test_float_inputs_and_cheapest_total():
+    services = [
+        {"id": "a", "base_price_per_guest": 45.5, "service_fee_flat": 350.0, "tax_rate_percent": 8.5},
+        {"id": "b", "base_price_per_guest": 39.99, "service_fee_flat": 500.0, "tax_rate_percent": 9.25},
+    ]
+    table = price_catering_services(services, [80])
+
+    for service in services:
+        assert table.breakdown(service, 80) == calculate_cost_breakdown(service, 80)
+
+    expected = min(calculate_cost_breakdown(s, 80).total_cost for s in services)
+    assert table.cheapest_total(services, 80) == expected
+    assert table.cheapest_total([], 80) == 0.0
+
+
+def test_room_totals_match_scalar_rounding():
+    rooms = [
+        {"base_room_rental_fee": Decimal("1500.00"), "hourly_rate": Decimal("125.50")},
+        {"base_room_rental_fee": Decimal("999.99"), "hourly_rate": None},
+        {"base_room_rental_fee": Decimal("2500.10"), "hourly_rate": Decimal("0")},
+    ]
+
+    totals = price_event_rooms(rooms, 4).tolist()
+
+    assert totals == [round(calculate_room_cost(room, 4), 2) for room in rooms]
+
+
+def test_select_caterers_filters_budget_orders_by_cost_and_pages():
+    services = make_services(200, seed=4)
+    for i, service in enumerate(services):
+        service["name"] = f"Caterer {i:03d}"
+    guests = 80
+    table = price_catering_services(services, [guests])
+    per_guest = {s["id"]: table.breakdown(s, guests).effective_cost_per_guest for s in services}
+    budget = sorted(per_guest.values())[120]
+
+    within = select_caterers(services, guests, budget_per_guest=budget)
+    assert [s["id"] for s in within] == [s["id"] for s in services if per_guest[s["id"]] <= budget]
+
+    cheapest = select_caterers(services, guests, budget_per_guest=budget, order_by="cost")
+    totals = {s["id"]: table.breakdown(s, guests).total_cost for s in services}
+    assert sorted(totals[s["id"]] for s in within) == [totals[s["id"]] for s in cheapest]
+
+    pages = [
+        select_caterers(services, guests, budget_per_guest=budget, order_by="cost", limit=25, offset=offset)
+        for offset in range(0, len(cheapest), 25)
+    ]
+    assert [s for page in pages for s in page] == cheapest
+    assert select_caterers(services, guests) is services
+
+
+def test_select_rooms_prices_rooms_for_the_budget():
+    rooms = [
+        {"id": "r1", "base_room_rental_fee": Decimal("3000"), "hourly_rate": Decimal("500")},
+        {"id": "r2", "base_room_rental_fee": Decimal("1500"), "hourly_rate": None},
+        {"id": "r3", "base_room_rental_fee": Decimal("4000"), "hourly_rate": Decimal("0")},
+    ]
+    assert [r["id"] for r in select_rooms(rooms, 100, budget_per_guest=40)] == ["r2", "r3"]
+    assert [r["id"] for r in select_rooms(rooms, 100, order_by="cost", limit=2)] == ["r2", "r3"]
+
+
+def test_cents_round_half_away_from_zero_like_numeric_round():
+    tie = {"id": "tie", "name": "Tie", "base_price_per_guest": Decimal("1.00"),
+           "service_fee_flat": Decimal("0.25"), "tax_rate_percent": Decimal("10")}
+    assert calculate_cost_breakdown(tie, 1).tax == 0.13
+    assert price_catering_services([tie], [1]).breakdown(tie, 1).tax == 0.13
+    assert round_cents(Decimal("2.675")) == Decimal("2.68") and round_cents(2.675) == Decimal("2.68")
+
+    room = {"id": "r", "name": "Room", "base_room_rental_fee": Decimal("1000.125"), "hourly_rate": None}
+    assert price_event_rooms([room], 4).tolist() == [1000.13]
+    request = EventPlanRequest(event_date="2025-09-15", location="Chicago", number_of_guests=1, sort_by="cost")
+    assert sort_key(room, ROOMS, request) == ["1000.13", "Room", "r"]
+    assert sort_key(tie, CATERERS, request)[0] == "1.38"
+
+
+def test_budget_compares_the_rounded_cost_shown():
+    # 9500.40 for 100 guests shows as 95.00 per guest.
+    caterer = {"id": "c", "name": "C", "base_price_per_guest": Decimal("95.004"),
+               "service_fee_flat": Decimal("0"), "tax_rate_percent": Decimal("0")}
+    assert calculate_cost_breakdown(caterer, 100).effective_cost_per_guest == 95.0
+    assert select_caterers([caterer], 100, budget_per_guest=95) == [caterer]
+    assert select_caterers([caterer], 100, budget_per_guest=94.99) == []
+
+    # 95.1 * 100 is 9509.999999999998 in floats; SQL compares 9510.0.
+    room = {"id": "r", "base_room_rental_fee": Decimal("9510.00"), "hourly_rate": None}
+    assert select_rooms([room], 100, budget_per_guest=95.1) == [room]
@@ -0,0 +1,211 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.models import EventPlanRequest
+from app.response_cache import PlanResponseCache
+from app.responses import etag_matches
+
+
+CATERERS = [
+    {"id": "c1", "name": "Bella Cucina", "location": "San Francisco",
+     "supported_cuisines": ["Italian"], "min_guests": 20, "max_guests": 200,
+     "base_price_per_guest": Decimal("45.00"), "service_fee_flat": Decimal("250.00"),
+     "tax_rate_percent": Decimal("8.50"), "rating": Decimal("4.5"), "contact_info": None},
+]
+
+
+class FakeListener:
+    def __init__(self):
+        self.listening = self.reachable = True
+        self.attempts = 0
+
+    async def ensure(self):
+        self.attempts += 1
+        self.listening = self.reachable
+        return self.listening
+
+
+def get(key):
+    return asyncio.run(PlanResponseCache.get(key))
+
+
+def put(key, body):
+    return PlanResponseCache.put(key, body, PlanResponseCache.generation)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(PlanResponseCache, "enabled", classmethod(lambda cls: True))
+    monkeypatch.setattr(PlanResponseCache, "_bytes", 0)
+    monkeypatch.setattr(PlanResponseCache, "ttl", 30.0)
+    monkeypatch.setattr(PlanResponseCache, "max_entries", 100)
+    monkeypatch.setattr(PlanResponseCache, "max_bytes", 1 << 20)
+    for counter in ("hits", "misses", "evictions", "invalidations", "generation"):
+        monkeypatch.setattr(PlanResponseCache, counter, 0)
+    monkeypatch.setattr(PlanResponseCache, "_listeners", (FakeListener(), FakeListener()))
+    monkeypatch.setattr(PlanResponseCache, "_next_reconnect", 0.0)
+    PlanResponseCache._entries.clear()
+    yield PlanResponseCache
+    PlanResponseCache._entries.clear()
+
+
+def _request(**overrides):
+    fields = {
+        "event_date": "2025-09-15",
+        "location": "San Francisco",
+        "number_of_guests": 120,
+        "cuisine_preferences": ["Italian", "Indian"],
+        "needs_event_room": False
+    }
+    fields.update(overrides)
+    return EventPlanRequest(**fields)
+
+
+def test_key_folds_spelling_but_keeps_the_echoed_cuisine_order():
+    key = PlanResponseCache.key_for(_request())
+    assert PlanResponseCache.key_for(_request(location=" san FRANCISCO ")) == key
+    assert PlanResponseCache.key_for(_request(cuisine_preferences=["italian", " INDIAN"])) == key
+    assert PlanResponseCache.key_for(_request(cuisine_preferences=["Indian", "Italian"])) != key
+    assert PlanResponseCache.key_for(_request(location="Springfield")) != PlanResponseCache.key_for(
+        _request(location="springfield"))
+    assert PlanResponseCache.key_for(_request(special_requirements="nut-free")) == key
+    assert PlanResponseCache.key_for(_request(number_of_guests=121)) != key
+    assert PlanResponseCache.key_for(_request(needs_event_room=True)) != key
+    assert PlanResponseCache.key_for(_request(budget_per_guest=80)) != key
+    assert PlanResponseCache.key_for(_request(rank_by_rating=True)) != key
+
+
+def test_lru_eviction_by_entries_and_bytes(cache):
+    cache.max_entries = 2
+    put("a", b"1")
+    put("b", b"2")
+    assert get("a") is not None
+    put("c", b"3")
+
+    assert get("b") is None
+    assert get("a") is not None
+    assert cache.evictions == 1
+
+    cache.max_bytes = 2000
+    put("big", b"x" * 1200)
+    assert get("big") is not None
+    assert cache.stats()["bytes"] <= 2000
+
+
+def test_expired_entries_are_misses(cache):
+    cache.ttl = 0
+    put("a", b"1")
+    assert get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalidate_drops_everything(cache):
+    put("a", b"1")
+    put("b", b"2")
+    cache.invalidate(None, 1234, "catalog_changed", "")
+
+    assert get("a") is None
+    assert cache.stats()["bytes"] == 0
+    assert cache.invalidations == 1
+
+
+def test_etag_matches_list_and_weak_tags():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', '"xyz", "abc"')
+    assert etag_matches('"abc"', '*')
+    assert not etag_matches('"abc"', '"xyz"')
+    assert not etag_matches('"abc"', None)
+
+
+def test_plan_event_served_from_cache_with_etag(cache, monkeypatch):
+    calls = []
+
+    async def fake_filter(**kwargs):
+        calls.append(kwargs)
+        return CATERERS
+
+    monkeypatch.setattr(main, "filter_catering_services", fake_filter)
+    client = TestClient(main.app)
+    payload = {"event_date": "2025-09-15", "location": "San Francisco",
+               "number_of_guests": 120, "cuisine_preferences": ["Italian"]}
+
+    first = client.post("/plan-event", json=payload)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = client.post("/plan-event", json={**payload, "special_requirements": "vegan"})
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert len(calls) == 1
+
+    revalidated = client.post("/plan-event", json=payload, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert len(calls) == 1
+
+    stats = client.get("/stats").json()["response_cache"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_cached_body_echoes_the_request_it_answers(cache, monkeypatch):
+    async def fake_filter(**kwargs):
+        return CATERERS
+
+    monkeypatch.setattr(main, "filter_catering_services", fake_filter)
+    client = TestClient(main.app)
+    payload = {"event_date": "2025-09-15", "location": "sf", "number_of_guests": 120}
+
+    for cuisines in (["Italian", "Thai"], ["thai", "ITALIAN"], ["THAI", "italian"]):
+        body = client.post("/plan-event", json={**payload, "cuisine_preferences": cuisines}).json()
+        assert body["input_summary"]["location"] == "San Francisco"
+        assert body["input_summary"]["cuisine_preferences"] == [c.title() for c in cuisines]
+    assert cache.hits == 1 and cache.misses == 2
+
+
+def test_nothing_is_cached_until_a_dropped_listener_reconnects(cache, monkeypatch):
+    put("a", b"1")
+    catalog = cache._listeners[0]
+    catalog.listening = catalog.reachable = False
+    cache.invalidate()
+
+    put("a", b"1")
+    assert get("a") is None
+    assert get("a") is None
+    assert catalog.attempts == 1
+
+    monkeypatch.setattr(cache, "_next_reconnect", 0.0)
+    catalog.reachable = True
+    generation = cache.generation
+    assert get("a") is None
+    assert cache.generation == generation + 1
+    assert cache.stats()["listening"]
+
+    put("a", b"1")
+    assert get("a") is not None
+
+
+def test_response_read_before_an_invalidation_is_not_stored(cache, monkeypatch):
+    calls = []
+
+    async def fake_filter(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            # The catalog changes while the first request is reading it.
+            cache.invalidate(None, 1234, "catalog_changed", "")
+        return CATERERS
+
+    monkeypatch.setattr(main, "filter_catering_services", fake_filter)
+    client = TestClient(main.app)
+    payload = {"event_date": "2025-09-15", "location": "San Francisco", "number_of_guests": 120}
+
+    assert client.post("/plan-event", json=payload).status_code == 200
+    assert cache.stats()["entries"] == 0
+    assert client.post("/plan-event", json=payload).status_code == 200
+    assert client.post("/plan-event", json=payload).status_code == 200
+    assert len(calls) == 2
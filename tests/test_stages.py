@@ -0,0 +1,72 @@
+import asyncio
+import functools
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.database import PoolExhaustedError
+from app.services.stages import StageTimeoutError, run_stages
+
+
+client = TestClient(main.app)
+
+REQUEST = {"event_date": "2025-09-15", "location": "Chicago", "number_of_guests": 80, "needs_event_room": True}
+
+
+@pytest.fixture
+def stages(monkeypatch):
+    monkeypatch.setattr(main, "run_stages", functools.partial(run_stages, timeout=0.05))
+    cancelled = []
+
+    def install(catering, rooms):
+        async def stage(name, body, **kwargs):
+            try:
+                return await body()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        monkeypatch.setattr(main, "filter_catering_services", functools.partial(stage, "catering", catering))
+        monkeypatch.setattr(main, "filter_event_rooms", functools.partial(stage, "rooms", rooms))
+        return cancelled
+
+    return install
+
+
+async def hang():
+    await asyncio.sleep(30)
+
+
+def test_slow_stage_gives_504_and_cancels_the_others(stages):
+    async def quick_then_hang():
+        await asyncio.sleep(0.01)
+        await hang()
+
+    cancelled = stages(hang, quick_then_hang)
+    response = client.post("/plan-event", json=REQUEST)
+
+    assert response.status_code == 504
+    assert "timed out after 0.05s" in response.json()["detail"]
+    assert set(cancelled) == {"catering", "rooms"}
+
+
+def test_pool_exhaustion_inside_a_stage_is_not_a_stage_timeout(stages):
+    async def exhausted():
+        raise PoolExhaustedError("primary", 10.0)
+
+    cancelled = stages(exhausted, hang)
+    response = client.post("/plan-event", json=REQUEST)
+
+    assert response.status_code == 503
+    assert "primary database pool" in response.json()["detail"]
+    assert set(cancelled) == {"rooms"}
+
+
+def test_only_the_stage_deadline_becomes_a_stage_timeout():
+    async def inner_timeout():
+        raise asyncio.TimeoutError()
+
+    with pytest.raises(TimeoutError) as raised:
+        asyncio.run(run_stages({"catering": inner_timeout()}, timeout=5))
+    assert not isinstance(raised.value, StageTimeoutError)
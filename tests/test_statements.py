@@ -0,0 +1,203 @@
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+
+import asyncpg
+import pytest
+
+from app.database import DatabaseConnection, DatabaseService
+from app.statements import STATEMENTS, StatementConnection, StatementRegistry
+from app.tracing import Metrics
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(StatementRegistry, "prepare_seconds", {})
+    monkeypatch.setattr(StatementRegistry, "prepare_counts", {})
+    for counter in ("prepares", "prepare_failures", "hits", "misses"):
+        monkeypatch.setattr(StatementRegistry, counter, 0)
+    monkeypatch.setattr(StatementRegistry, "saved_seconds", 0.0)
+    return StatementRegistry
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded = []
+
+    async def fake_execute_statement(name, *args, fetch_one=False):
+        recorded.append((name, args))
+        return None if fetch_one else []
+
+    monkeypatch.setattr(DatabaseService, "execute_statement", staticmethod(fake_execute_statement))
+    return recorded
+
+
+def test_statement_placeholders_are_contiguous():
+    for name, sql in STATEMENTS.items():
+        numbers = sorted({int(n) for n in re.findall(r"\$(\d+)", sql)})
+        assert numbers == list(range(1, len(numbers) + 1)), name
+
+
+def test_search_text_depends_only_on_location_and_date(calls):
+    async def scenario():
+        await DatabaseService.fetch_caterers()
+        await DatabaseService.fetch_caterers(location="Chicago", min_guests=50, max_guests=50)
+        await DatabaseService.fetch_caterers(location="", cuisines=[])
+        await DatabaseService.fetch_caterers("Chicago", 50, 50, ["Thai"], available_on="2025-09-15")
+        await DatabaseService.fetch_venues(min_capacity=10)
+
+    asyncio.run(scenario())
+
+    unpaged = (None, False, None, None, None, None, None)
+    assert calls == [
+        ("caterers_anywhere", (None, None, None, None, None) + unpaged),
+        ("caterers", ("Chicago", 50, 50, None, None) + unpaged),
+        ("caterers_anywhere", (None, None, None, None, None) + unpaged),
+        ("caterers_available_on", ("Chicago", 50, 50, ["Thai"], None) + unpaged + (date(2025, 9, 15),)),
+        ("venues_anywhere", (None, 10, None, None, 4) + unpaged),
+    ]
+
+
+def test_budget_and_cost_order_are_statement_parameters(calls):
+    async def scenario():
+        await DatabaseService.fetch_caterers(
+            "Chicago", 50, 50, number_of_guests=50, budget_per_guest=80.0, order_by="cost", limit=20, offset=40
+        )
+        await DatabaseService.fetch_venues("Chicago", 50, 50, order_by="cost", limit=5)
+        await DatabaseService.fetch_venues(
+            "Chicago", 50, 50, order_by="cost", limit=5, after=("2300.00", "Hall", "3f0c2a4e-0000-4000-8000-000000000001")
+        )
+
+    asyncio.run(scenario())
+
+    assert calls == [
+        ("caterers", ("Chicago", 50, 50, None, 50, 80.0, True, 20, 40, None, None, None)),
+        ("venues", ("Chicago", 50, 50, None, 4, None, True, 5, None, None, None, None)),
+        ("venues", ("Chicago", 50, 50, None, 4, None, True, 5, None,
+                    "Hall", "3f0c2a4e-0000-4000-8000-000000000001", Decimal("2300.00"))),
+    ]
+
+
+@pytest.mark.parametrize("kwargs", [{"budget_per_guest": 80.0}, {"order_by": "cost"}, {"order_by": "rating"}])
+def test_pricing_arguments_are_validated(calls, kwargs):
+    with pytest.raises(ValueError):
+        asyncio.run(DatabaseService.fetch_caterers("Chicago", **kwargs))
+    assert calls == []
+
+
+def test_connection_reuses_prepared_statements(registry, monkeypatch):
+    prepared = []
+
+    async def fake_prepare(self, query):
+        prepared.append(query)
+        return object()
+
+    monkeypatch.setattr(StatementConnection, "prepare", fake_prepare)
+    connection = StatementConnection.__new__(StatementConnection)
+    connection._registered = {}
+    connection._aborted = True  # never connected; keeps Connection.__del__ quiet
+
+    async def scenario():
+        await connection.prepare_all()
+        first = await connection.registered_statement("venues")
+        second = await connection.registered_statement("venues")
+        refreshed = await connection.registered_statement("venues", refresh=True)
+        return first, second, refreshed
+
+    first, second, refreshed = asyncio.run(scenario())
+
+    assert first is second
+    assert refreshed is not first
+    assert len(prepared) == len(STATEMENTS) + 1
+    stats = registry.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["prepares"] == len(STATEMENTS) + 1
+    assert "estimated_parse_ms_saved" in stats and "estimated_parse_plan_ms_saved" not in stats
+
+
+class FakeCursorConnection:
+    """Serves `rows` from a cursor; the first `stale` cursors opened fail
+    the way a statement invalidated by a schema change does."""
+
+    def __init__(self, rows, stale=1, fail_after=None):
+        self.rows, self.stale, self.fail_after = rows, stale, fail_after
+        self.refreshes, self.transactions = [], []
+
+    @asynccontextmanager
+    async def transaction(self, readonly=False):
+        self.transactions.append("begin")
+        try:
+            yield
+        except BaseException:
+            self.transactions.append("rollback")
+            raise
+        self.transactions.append("commit")
+
+    async def registered_statement(self, name, refresh=False):
+        self.refreshes.append(refresh)
+        return self
+
+    def cursor(self, *args):
+        connection = self
+
+        class Cursor:
+            position = 0
+
+            async def fetch(self, n):
+                if connection.stale:
+                    connection.stale -= 1
+                    raise asyncpg.InvalidCachedStatementError("cached statement plan is invalid")
+                if connection.fail_after is not None and self.position >= connection.fail_after:
+                    raise asyncpg.OutdatedSchemaCacheError("cached statement plan is invalid")
+                batch = connection.rows[self.position:self.position + n]
+                self.position += n
+                return batch
+
+        async def opened():
+            return Cursor()
+
+        return opened()
+
+
+@pytest.fixture
+def stream_connection(monkeypatch):
+    def install(connection):
+        @asynccontextmanager
+        async def get_connection(readonly=False):
+            yield connection
+
+        monkeypatch.setattr(DatabaseConnection, "get_connection", get_connection)
+        monkeypatch.setattr("app.database.settings.plan_stream_prefetch", 2)
+        return connection
+
+    return install
+
+
+def test_stream_retries_a_statement_invalidated_before_the_first_row(stream_connection, monkeypatch):
+    monkeypatch.setattr(Metrics, "_histograms", {})
+    connection = stream_connection(FakeCursorConnection([{"n": n} for n in range(5)]))
+
+    async def collect():
+        return [row async for row in DatabaseService.stream_statement("venues", "Chicago")]
+
+    assert asyncio.run(collect()) == [{"n": n} for n in range(5)]
+    assert connection.refreshes == [False, True]
+    assert connection.transactions == ["begin", "rollback", "begin", "commit"]
+    assert 'db_query_seconds_count{statement="venues"} 2' in Metrics.render()
+
+
+def test_stream_does_not_retry_once_rows_were_sent(stream_connection):
+    connection = stream_connection(FakeCursorConnection([{"n": n} for n in range(5)], stale=0, fail_after=2))
+    received = []
+
+    async def collect():
+        async for row in DatabaseService.stream_statement("venues", "Chicago"):
+            received.append(row)
+
+    with pytest.raises(asyncpg.OutdatedSchemaCacheError):
+        asyncio.run(collect())
+    assert received == [{"n": 0}, {"n": 1}]
+    assert connection.refreshes == [False]
@@ -0,0 +1,230 @@
+import asyncio
+import base64
+import json
+import random
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.config import PLAN_MAX_PAGE_SIZE
+from app.database import DatabaseService
+from app.main import app, assemble_page, cheapest_pairs, fetch_cheapest_caterers, fetch_cheapest_rooms, stream_plan
+from app.models import EventPlanRequest
+from app.pagination import CATERERS, ROOMS, PageCursor, candidate_query
+from app.services.catering_service import select_caterers
+from app.services.venue_service import select_rooms
+from app.responses import frame_stream
+
+
+def synthetic_rows(rng):
+    cuisines = ["Italian", "Indian", "Thai", "French"]
+    caterers = [
+        {"id": str(uuid.UUID(int=i)), "name": f"Caterer {i:03d}", "location": "Chicago",
+         "supported_cuisines": rng.sample(cuisines, rng.randint(1, 2)),
+         "base_price_per_guest": Decimal(rng.randint(3000, 9000)) / 100,
+         "service_fee_flat": Decimal(rng.choice([0, 250, 500])), "tax_rate_percent": Decimal("9.50"),
+         "min_guests": 10, "max_guests": 500, "notes": None}
+        for i in range(300)
+    ]
+    venues = [
+        {"id": str(uuid.UUID(int=1000 + i)), "name": f"Venue {i:03d}", "location": "Chicago", "capacity_min": 10,
+         "capacity_max": 500, "base_room_rental_fee": Decimal(rng.randint(5, 40) * 100),
+         "hourly_rate": rng.choice([None, Decimal(150)]), "includes_catering": rng.random() < 0.2,
+         "supported_cuisines_if_included": None, "amenities": []}
+        for i in range(120)
+    ]
+    return caterers, venues
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    caterers, venues = synthetic_rows(random.Random(3))
+
+    def matching(cuisines):
+        return [c for c in caterers if not cuisines or set(cuisines) & set(c["supported_cuisines"])]
+
+    async def stream(rows_):
+        for row in rows_:
+            yield dict(row)
+
+    def caterer_page(cuisines=None, number_of_guests=None, **kw):
+        page = {key: kw[key] for key in PAGE_ARGUMENTS}
+        return select_caterers(matching(cuisines), number_of_guests, **page)
+
+    def room_page(number_of_guests=None, **kw):
+        return select_rooms(venues, number_of_guests, **{key: kw[key] for key in PAGE_ARGUMENTS})
+
+    async def fetch(page, **kw):
+        return page(**kw)
+
+    monkeypatch.setattr(DatabaseService, "stream_caterers", staticmethod(lambda **kw: stream(caterer_page(**kw))))
+    monkeypatch.setattr(DatabaseService, "stream_venues", staticmethod(lambda **kw: stream(room_page(**kw))))
+    monkeypatch.setattr(DatabaseService, "fetch_caterers", staticmethod(lambda **kw: fetch(caterer_page, **kw)))
+    monkeypatch.setattr(DatabaseService, "fetch_venues", staticmethod(lambda **kw: fetch(room_page, **kw)))
+    return caterer_page, room_page
+
+
+PAGE_ARGUMENTS = ("budget_per_guest", "order_by", "limit", "offset", "after")
+
+
+async def collect(request):
+    return [frame async for frame in stream_plan(request)]
+
+
+def buffered_plan(request, caterer_page, room_page):
+    cursor = PageCursor.for_request(request)
+    catering_rows = room_rows = []
+    if not cursor.exhausted(CATERERS):
+        catering_rows = caterer_page(
+            request.cuisine_preferences, request.number_of_guests, **candidate_query(request, cursor, CATERERS))
+    if not cursor.exhausted(ROOMS):
+        room_rows = room_page(request.number_of_guests, **candidate_query(request, cursor, ROOMS))
+    cheapest = [], []
+    if request.needs_event_room:
+        cheapest = asyncio.run(fetch_cheapest_caterers(request)), asyncio.run(fetch_cheapest_rooms(request))
+    return asyncio.run(assemble_page(request, cursor, catering_rows, room_rows, cheapest))
+
+
+@pytest.mark.parametrize("cuisines,budget,sort_by", [
+    (None, None, "name"), (["Thai", "indian"], None, "name"), (["Italian"], 95.0, "name"), (None, 95.0, "cost")])
+def test_stream_matches_the_buffered_plan(rows, cuisines, budget, sort_by):
+    request = EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120,
+                               cuisine_preferences=cuisines, budget_per_guest=budget, sort_by=sort_by,
+                               needs_event_room=True)
+
+    frames = asyncio.run(collect(request))
+    plan = buffered_plan(request, *rows)
+
+    assert frames[0]["type"] == "input_summary" and frames[-1]["type"] == "summary"
+    streamed = {}
+    for frame in frames:
+        if frame["type"] == "caterer":
+            for cuisine in frame["cuisines"]:
+                streamed.setdefault(cuisine, []).append(frame["provider"])
+    assert streamed == {
+        group.cuisine: [p.model_dump(mode="json") for p in group.providers]
+        for group in plan.catering_analysis.by_cuisine
+    }
+    rooms = [frame["room"] for frame in frames if frame["type"] == "room"]
+    assert rooms == [room.model_dump(mode="json") for room in plan.event_rooms]
+    assert frames[-1]["recommended_combinations"] == [c.model_dump(mode="json") for c in plan.recommended_combinations]
+    assert frames[-1]["summary_text"] == plan.summary_text
+    assert frames[-1]["next_cursor"] == plan.next_cursor
+
+
+@pytest.mark.parametrize("sort_by", ["name", "cost"])
+def test_cursor_pages_cover_every_candidate_once(rows, sort_by):
+    caterer_page, room_page = rows
+    request = EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120,
+                               sort_by=sort_by, limit=40, needs_event_room=True)
+    everything = dict(budget_per_guest=None, order_by=sort_by, limit=None, offset=0, after=None)
+    caterer_ids = [str(c["id"]) for c in caterer_page(None, 120, **everything)]
+
+    seen_caterers, seen_rooms, pages = [], [], 0
+    while True:
+        frames = asyncio.run(collect(request))
+        pages += 1
+        seen_caterers += [f["provider"]["provider_id"] for f in frames if f["type"] == "caterer"]
+        seen_rooms += [f["room"]["room_id"] for f in frames if f["type"] == "room"]
+        plan = buffered_plan(request, *rows)
+        assert frames[-1]["next_cursor"] == plan.next_cursor
+        if frames[-1]["next_cursor"] is None:
+            break
+        request = request.model_copy(update={"cursor": frames[-1]["next_cursor"]})
+
+    assert pages == 8  # 300 caterers in pages of 40
+    assert seen_caterers == caterer_ids and len(set(seen_caterers)) == 300
+    assert seen_rooms == [str(v["id"]) for v in room_page(120, **everything)]
+
+
+@pytest.mark.parametrize("sort_by", ["name", "cost"])
+def test_every_page_recommends_from_the_whole_filtered_set(rows, sort_by):
+    caterer_page, room_page = rows
+    request = EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120,
+                               budget_per_guest=95.0, sort_by=sort_by, limit=40, needs_event_room=True)
+    everything = dict(budget_per_guest=95.0, order_by=sort_by, limit=None, offset=0, after=None)
+    cheapest_cost, combinations = asyncio.run(cheapest_pairs(
+        request, caterer_page(None, 120, **everything), room_page(120, **everything)))
+    assert combinations
+
+    pages = 0
+    while request is not None:
+        cursor = PageCursor.for_request(request)
+        plan = buffered_plan(request, *rows)
+        pages += 1
+        assert plan.recommended_combinations == combinations
+        expected_rooms = []
+        if not cursor.exhausted(ROOMS):
+            expected_rooms = room_page(120, **candidate_query(request, cursor, ROOMS))[:40]
+        assert [room.room_id for room in plan.event_rooms] == [str(v["id"]) for v in expected_rooms]
+        for room in plan.event_rooms:
+            if not room.includes_catering:
+                assert room.estimated_combined_cost_with_cheapest_catering == round(
+                    room.pricing.estimated_room_total_cost + cheapest_cost, 2)
+        request = plan.next_cursor and request.model_copy(update={"cursor": plan.next_cursor})
+    assert pages > 1
+
+
+def test_rank_by_rating_is_not_paged(rows):
+    request = EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120,
+                               rank_by_rating=True, limit=10)
+    with pytest.raises(ValueError, match="rank_by_rating"):
+        buffered_plan(request, *rows)
+    with pytest.raises(ValidationError):
+        request.model_validate({**request.model_dump(), "offset": 10})
+
+
+def test_cursor_is_bound_to_its_query(rows):
+    request = EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120, limit=10)
+    token = buffered_plan(request, *rows).next_cursor
+    assert PageCursor.for_request(request.model_copy(update={"cursor": token})).after_key(CATERERS) is not None
+
+    for changed in ({"number_of_guests": 121}, {"sort_by": "cost"}, {"limit": 11}):
+        with pytest.raises(ValueError):
+            PageCursor.for_request(request.model_copy(update={"cursor": token, **changed}))
+    with pytest.raises(ValueError):
+        PageCursor.for_request(request.model_copy(update={"cursor": "not-a-cursor"}))
+    with pytest.raises(ValidationError):
+        EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120, cursor=token, offset=5)
+    with pytest.raises(ValidationError):
+        EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120, limit=PLAN_MAX_PAGE_SIZE + 1)
+
+
+def test_crafted_cursors_are_rejected(rows):
+    request = EventPlanRequest(event_date="2025-09-13", location="Chicago", number_of_guests=120,
+                               sort_by="cost", limit=10)
+    token = buffered_plan(request, *rows).next_cursor
+    payload, signature = token.split(".")
+    state = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    state["a"][CATERERS][0] = "NaN-ish"
+    forged = base64.urlsafe_b64encode(json.dumps(state).encode()).decode().rstrip("=")
+
+    response = TestClient(app).post("/plan-event", json={**request.model_dump(), "cursor": f"{forged}.{signature}"})
+    assert response.status_code == 400
+
+    # Even a correctly signed key is checked before it reaches a query.
+    cursor = PageCursor.for_request(request)
+    valid = str(uuid.UUID(int=1))
+    for key in (["abc", "Caterer", valid], ["Infinity", "Caterer", valid], ["12.50", "Caterer", "1 OR 1=1"],
+                [None, "Caterer", valid], ["12.50", "Caterer"], "12.50"):
+        signed = cursor.next_token(request, {CATERERS: key, ROOMS: None})
+        with pytest.raises(ValueError, match="Malformed cursor"):
+            PageCursor.for_request(request.model_copy(update={"cursor": signed}))
+
+
+def test_frame_stream_encodes_ndjson_sse_and_errors():
+    async def frames():
+        yield {"type": "caterer", "n": 1}
+        raise RuntimeError("cursor lost")
+
+    async def encode(sse):
+        return b"".join([chunk async for chunk in frame_stream(frames(), sse=sse)]).decode()
+
+    lines = asyncio.run(encode(False)).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"type": "caterer", "n": 1}, {"type": "error", "detail": "cursor lost"}]
+    assert asyncio.run(encode(True)).startswith('event: caterer\ndata: {"type":"caterer","n":1}\n\nevent: error\n')
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.stages import StageTimeoutError, run_stages
+from app.tracing import LATENCY_BUCKETS, Metrics, RequestTimingMiddleware, SamplingProfiler, Tracer, stage_span
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    monkeypatch.setattr(Tracer, "metrics_enabled", True)
+    monkeypatch.setattr(Tracer, "_tracer", None)
+    Metrics.reset()
+    yield
+    Metrics.reset()
+
+
+def series(metric, label, value):
+    prefix = f'{metric}_count{{{label}="{value}"}} '
+    for line in Metrics.render().splitlines():
+        if line.startswith(prefix):
+            return int(line[len(prefix):])
+    return 0
+
+
+def test_histogram_buckets_are_cumulative():
+    for seconds in (0.0001, 0.003, 0.003, 20.0):
+        Metrics.observe("plan_stage_seconds", "stage", "summary", seconds)
+
+    lines = Metrics.render().splitlines()
+    assert "# TYPE plan_stage_seconds histogram" in lines
+    buckets = [line for line in lines if line.startswith("plan_stage_seconds_bucket")]
+    assert len(buckets) == len(LATENCY_BUCKETS) + 1
+    assert buckets[0].endswith(" 1")
+    assert 'le="0.005"} 3' in "\n".join(buckets)
+    assert buckets[-1] == 'plan_stage_seconds_bucket{stage="summary",le="+Inf"} 4'
+    assert series("plan_stage_seconds", "stage", "summary") == 4
+
+
+def test_span_records_even_when_the_body_raises():
+    with pytest.raises(ValueError):
+        with stage_span("combinations"):
+            raise ValueError("boom")
+    assert series("plan_stage_seconds", "stage", "combinations") == 1
+
+
+def test_disabled_metrics_return_the_shared_noop_span(monkeypatch):
+    monkeypatch.setattr(Tracer, "metrics_enabled", False)
+    assert stage_span("a") is stage_span("b")
+    with stage_span("a"):
+        pass
+    assert Metrics.render().strip() == ""
+
+
+def test_run_stages_times_each_stage_and_timeouts():
+    async def slow():
+        await asyncio.sleep(1)
+
+    asyncio.run(run_stages({"catering": asyncio.sleep(0, result=[]), "rooms": asyncio.sleep(0, result=[])}))
+    with pytest.raises(StageTimeoutError):
+        asyncio.run(run_stages({"rooms": slow()}, timeout=0.01))
+
+    assert series("plan_stage_seconds", "stage", "catering") == 1
+    assert series("plan_stage_seconds", "stage", "rooms") == 2
+
+
+def test_request_timing_covers_a_streamed_body():
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for _ in range(3):
+            await asyncio.sleep(0.02)
+            await send({"type": "http.response.body", "body": b"line\n", "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    middleware = RequestTimingMiddleware(streaming_app, label=lambda path: path)
+    asyncio.run(middleware({"type": "http", "path": "/plan-event/stream"}, receive, send))
+
+    assert sent[-1] == {"type": "http.response.body", "body": b""}
+    assert series("http_request_seconds", "route", "/plan-event/stream") == 1
+    total = next(
+        line for line in Metrics.render().splitlines()
+        if line.startswith('http_request_seconds_sum{route="/plan-event/stream"}')
+    )
+    assert float(total.split()[-1]) >= 0.06
+
+
+def test_unknown_exporter_is_rejected():
+    with pytest.raises((ValueError, RuntimeError)):
+        Tracer.configure("zipkin")
+    Tracer.configure("none")
+    assert Tracer._tracer is None
+
+
+def test_profiler_folds_the_target_threads_stack():
+    stop = threading.Event()
+
+    def busy_marker():
+        while not stop.is_set():
+            time.sleep(0.001)
+
+    worker = threading.Thread(target=busy_marker)
+    worker.start()
+    try:
+        folded = SamplingProfiler.profile(0.1, 0.005, thread_id=worker.ident)
+    finally:
+        stop.set()
+        worker.join()
+
+    stack, count = folded.splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "busy_marker" in stack.split(";")[-1]